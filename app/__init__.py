@@ -3,19 +3,27 @@
 
 import os
 import sys
+import logging
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterable
 
 from flask import Flask
 
 # Импортируем синглтоны менеджеров конфигурации и лога календаря
 from .core.config_manager import ConfigManager
 from .core.calendar_log import CalendarLog
+from .core.profile_registry import ProfileRegistry, DEFAULT_MAX_LOADED_PROFILES
+from .core.log_config import configure_logging, apply_config_levels
+
+# Логгер модуля (вывод настраивается в create_app через configure_logging)
+logger = logging.getLogger(__name__)
 
 # Создаем глобальные экземпляры менеджеров (синглтоны)
 # Пути будут установлены позже в create_app
 config_manager: ConfigManager = ConfigManager(None)
 calendar_log: CalendarLog = CalendarLog(None)
+# Реестр дополнительных профилей (/api/p/<profile>/...), каждый со своими менеджерами
+profile_registry: ProfileRegistry = ProfileRegistry(None)
 
 
 def resource_path(relative_path: str) -> str:
@@ -55,26 +63,38 @@ SOUND_FOLDERS: List[str] = [
     'WheelStop'
 ]
 
-def create_app(save_dir_path: str) -> Flask:
+def create_app(save_dir_path: str, max_loaded_profiles: Optional[int] = None,
+               debug: bool = False, profiles: Optional[Iterable[str]] = None) -> Flask:
     """Фабрика для создания и конфигурации экземпляра Flask-приложения.
 
     Args:
         save_dir_path: Абсолютный путь к директории для сохранения файлов config.json и calendar_log.json.
+        max_loaded_profiles: Сколько профилей держать в памяти одновременно
+            (по умолчанию из переменной окружения LOVETIMER_MAX_PROFILES или 8).
+        debug: Режим отладки (уровень DEBUG, логи запросов, Flask debug).
+        profiles: Имена профилей, которые нужно создать, если их ещё нет
+            (по умолчанию из LOVETIMER_PROFILES через запятую). Запросы к
+            несуществующим профилям получают 404, сами они не создаются.
 
     Returns:
         Сконфигурированный экземпляр Flask-приложения.
     """
-    print(f"--- Инициализация Flask-приложения ---")
-    print(f"Static folder: {STATIC_FOLDER}")
-    print(f"Template folder: {TEMPLATE_FOLDER}")
+    save_dir = Path(save_dir_path)
+
+    # Логи пишутся фоновым потоком (очередь), в консоль и в <save_dir>/logs/
+    configure_logging(save_dir, debug=debug)
+
+    logger.info("--- Инициализация Flask-приложения ---")
+    logger.info("Static folder: %s", STATIC_FOLDER)
+    logger.info("Template folder: %s", TEMPLATE_FOLDER)
 
     # Создаем экземпляр Flask, явно указывая пути к static и templates
     app = Flask(__name__,
                 static_folder=STATIC_FOLDER,
                 template_folder=TEMPLATE_FOLDER)
+    app.debug = debug
 
     # --- Конфигурация Менеджеров ---
-    save_dir = Path(save_dir_path)
     config_path = save_dir / "config.json"
     log_path = save_dir / "calendar_log.json"
 
@@ -86,15 +106,30 @@ def create_app(save_dir_path: str) -> Flask:
         # Загружаем данные или создаем файлы по умолчанию
         config_manager.load_or_create_defaults()
         calendar_log.load_or_create()
-        print("--- Менеджеры конфигурации и лога успешно инициализированы ---")
+        logger.info("--- Менеджеры конфигурации и лога успешно инициализированы ---")
+
+        # Уровни логов по модулям из config.json (LOVETIMER_LOG_LEVELS имеет приоритет)
+        apply_config_levels(config_manager.get_config().log_levels)
     except Exception as e:
         # Критическая ошибка при работе с файлами сохранения
-        print(f"!!! КРИТИЧЕСКАЯ ОШИБКА: Не удалось загрузить/создать файлы сохранения: {e}")
+        logger.critical("!!! КРИТИЧЕСКАЯ ОШИБКА: Не удалось загрузить/создать файлы сохранения: %s", e, exc_info=True)
         # В реальном приложении здесь можно показать страницу ошибки или выйти
         # exit(1) # Раскомментируй, если нужно прерывать запуск при ошибке
 
+    # --- Профили (ленивая загрузка, LRU-вытеснение) ---
+    if max_loaded_profiles is None:
+        max_loaded_profiles = int(os.environ.get("LOVETIMER_MAX_PROFILES", DEFAULT_MAX_LOADED_PROFILES))
+    profile_registry.init_app(save_dir / "profiles", max_loaded_profiles)
+    if profiles is None:
+        profiles = [name.strip() for name in os.environ.get("LOVETIMER_PROFILES", "").split(",") if name.strip()]
+    for name in profiles:
+        try:
+            profile_registry.create(name)
+        except (ValueError, OSError) as e:
+            logger.error("Не удалось создать профиль %r: %s", name, e)
+
     try:
-        print("--- [АУДИО] Проверка/создание папок для звуков...")
+        logger.info("--- [АУДИО] Проверка/создание папок для звуков...")
         sounds_root_path = save_dir / "sounds"
         sounds_root_path.mkdir(exist_ok=True)  # Создаем /sounds
 
@@ -103,9 +138,9 @@ def create_app(save_dir_path: str) -> Flask:
         for folder_name in SOUND_FOLDERS:
             (sounds_root_path / folder_name).mkdir(exist_ok=True)  # Создаем /sounds/Heartbeat и т.д.
 
-        print(f"--- [АУДИО] Файловая структура звуков в {sounds_root_path} проверена.")
+        logger.info("--- [АУДИО] Файловая структура звуков в %s проверена.", sounds_root_path)
     except (IOError, OSError) as e:
-        print(f"!!! [АУДИО] НЕКРИТИЧНАЯ ОШИБКА: Не удалось создать папки звуков: {e}")
+        logger.warning("!!! [АУДИО] НЕКРИТИЧНАЯ ОШИБКА: Не удалось создать папки звуков: %s", e)
 
     # --- Регистрация Blueprints (маршрутов) ---
     try:
@@ -114,9 +149,11 @@ def create_app(save_dir_path: str) -> Flask:
 
         app.register_blueprint(main.main_bp)
         app.register_blueprint(api.api_bp, url_prefix='/api') # Явно указываем префикс API
-        print("--- Blueprints (main, api) зарегистрированы ---")
+        # Тот же API, но для именованного профиля: /api/p/<profile>/...
+        app.register_blueprint(api.api_bp, url_prefix='/api/p/<profile>', name='profile_api')
+        logger.info("--- Blueprints (main, api) зарегистрированы ---")
     except ImportError as e:
-        print(f"!!! КРИТИЧЕСКАЯ ОШИБКА: Не удалось импортировать blueprints: {e}")
+        logger.critical("!!! КРИТИЧЕСКАЯ ОШИБКА: Не удалось импортировать blueprints: %s", e, exc_info=True)
         # exit(1) # Раскомментируй, если нужно прерывать запуск
 
     return app
\ No newline at end of file
@@ -4,16 +4,22 @@ Blueprint for handling Application API requests.
 Connects the frontend with ConfigManager and CalendarLog.
 """
 
+import logging
 from datetime import date, datetime
 from typing import Tuple, Dict, Any, Optional, List
 from pathlib import Path
 
-from flask import Blueprint, jsonify, request, Response, current_app, send_from_directory
+from flask import Blueprint, jsonify, request, Response, current_app, send_from_directory, stream_with_context, g, abort
 from pydantic import ValidationError
 
 # Import core managers and constants
-from . import config_manager, calendar_log, SOUND_FOLDERS
-from .core.config_manager import CustomTimer, AppConfig
+from . import config_manager, calendar_log, profile_registry, SOUND_FOLDERS
+from .core.config_manager import CustomTimer, AppConfig, ConfigManager
+from .core.calendar_log import CalendarLog
+from .core.calendar_io import EXPORT_FORMATS, CalendarImportError, resolve_format, iter_export, iter_import
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
 
 # Create 'api' Blueprint
 api_bp = Blueprint('api', __name__)
@@ -21,6 +27,57 @@ api_bp = Blueprint('api', __name__)
 # Type alias for Flask route responses
 ResponseType = Response | Tuple[Response, int]
 
+# Response header carrying the calendar log version (see /calendar_log/changes)
+CALENDAR_VERSION_HEADER = 'X-Calendar-Version'
+
+
+def _sampled(route: str) -> Dict[str, str]:
+    """`extra` for INFO logs on hot routes (rate-limited by SamplingFilter)."""
+    return {"sample_key": route}
+
+
+# ==============================================================================
+# Profiles (/api/p/<profile>/...)
+# ==============================================================================
+
+@api_bp.url_value_preprocessor
+def pull_profile(endpoint: Optional[str], values: Optional[Dict[str, Any]]) -> None:
+    """
+    Resolve the <profile> URL segment of profile-scoped routes.
+    The profile is held in `g` for the duration of the request.
+    """
+    if not values or 'profile' not in values:
+        return
+    name = values.pop('profile')
+    try:
+        g.profile = profile_registry.acquire(name)
+    except ValueError:
+        logger.warning("Rejected profile name: %r", name)
+        abort(404)
+    except KeyError:
+        logger.warning("Unknown profile: %r", name)
+        abort(404)
+
+
+@api_bp.teardown_request
+def release_profile(exc: Optional[BaseException]) -> None:
+    """Release the profile acquired for this request (allows LRU eviction)."""
+    profile = g.pop('profile', None)
+    if profile is not None:
+        profile_registry.release(profile)
+
+
+def _config_manager() -> ConfigManager:
+    """ConfigManager of the current profile (default profile for plain /api routes)."""
+    profile = g.get('profile')
+    return profile.config_manager if profile is not None else config_manager
+
+
+def _calendar_log() -> CalendarLog:
+    """CalendarLog of the current profile (default profile for plain /api routes)."""
+    profile = g.get('profile')
+    return profile.calendar_log if profile is not None else calendar_log
+
 
 # ==============================================================================
 # Configuration API (/api/config)
@@ -37,10 +94,10 @@ def get_config() -> ResponseType:
         500: If reading config fails.
     """
     try:
-        current_config = config_manager.get_config()
+        current_config = _config_manager().get_config()
         return jsonify(current_config.model_dump(mode="json"))
     except Exception as e:
-        current_app.logger.error(f"Error getting config: {e}", exc_info=True)
+        logger.error("Error getting config: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error reading config"}), 500
 
 
@@ -50,7 +107,8 @@ def update_config() -> ResponseType:
     Update the application configuration.
 
     Method: POST /api/config
-    Body: JSON object matching AppConfig schema.
+    Body: JSON object matching AppConfig schema. Omitted `timers.custom_timers`
+        / `wheel_options` are kept as stored (edit them via /timers, /wheel/options).
     Returns:
         JSON: Updated AppConfig object.
         400: Validation error.
@@ -58,18 +116,18 @@ def update_config() -> ResponseType:
     """
     new_data: Optional[Dict[str, Any]] = request.get_json()
     if not new_data:
-        current_app.logger.warning("Update config attempt with empty body.")
+        logger.warning("Update config attempt with empty body.")
         return jsonify({"error": "Request body must contain JSON data"}), 400
 
     try:
-        updated_config = config_manager.update_config(new_data)
-        current_app.logger.info("Configuration successfully updated.")
+        updated_config = _config_manager().update_config(new_data)
+        logger.info("Configuration successfully updated.", extra=_sampled("config_save"))
         return jsonify(updated_config.model_dump(mode="json"))
     except ValidationError as e:
-        current_app.logger.warning(f"Config validation failed: {e.errors()}")
-        return jsonify({"error": "Validation failed", "details": e.errors()}), 400
+        logger.warning("Config validation failed: %s", e.errors(include_context=False))
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
     except Exception as e:
-        current_app.logger.error(f"Error saving config: {e}", exc_info=True)
+        logger.error("Error saving config: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error saving config"}), 500
 
 
@@ -86,11 +144,11 @@ def get_default_config() -> ResponseType:
         # Note: Default custom timers are already added in the AppConfig/ConfigManager logic
         # No need to duplicate logic here.
 
-        current_app.logger.info("Serving default configuration.")
+        logger.info("Serving default configuration.", extra=_sampled("config_defaults"))
         return jsonify(default_config.model_dump(mode="json"))
 
     except Exception as e:
-        current_app.logger.error(f"Error generating default config: {e}", exc_info=True)
+        logger.error("Error generating default config: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error getting default config"}), 500
 
 
@@ -100,16 +158,177 @@ def reset_all_config() -> ResponseType:
     Create a backup and reset config.json to defaults.
     """
     try:
-        current_app.logger.warning("!!! REQUEST RECEIVED: FULL CONFIG RESET !!!")
-        new_default_config = config_manager.backup_and_reset_config()
-        current_app.logger.info("Config reset successful. Backup created.")
+        logger.warning("!!! REQUEST RECEIVED: FULL CONFIG RESET !!!")
+        new_default_config = _config_manager().backup_and_reset_config()
+        logger.info("Config reset successful. Backup created.")
         return jsonify(new_default_config.model_dump(mode="json"))
 
     except Exception as e:
-        current_app.logger.error(f"Error resetting config: {e}", exc_info=True)
+        logger.error("Error resetting config: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error resetting config"}), 500
 
 
+# ==============================================================================
+# Collection API (/api/timers, /api/wheel/options)
+# ==============================================================================
+# Item-level access to custom timers and wheel options: only the touched item
+# is validated, instead of round-tripping the whole config through /api/config.
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _list_items(kind: str) -> ResponseType:
+    offset = request.args.get('offset', default=0, type=int)
+    limit = request.args.get('limit', default=DEFAULT_PAGE_SIZE, type=int)
+    if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"Use offset >= 0 and 0 < limit <= {MAX_PAGE_SIZE}"}), 400
+
+    try:
+        page = _config_manager().list_items(
+            kind,
+            sort=request.args.get('sort', 'order'),
+            descending=request.args.get('order', 'asc') == 'desc',
+            offset=offset,
+            limit=limit,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error("Error listing %s: %s", kind, e, exc_info=True)
+        return jsonify({"error": "Internal server error reading config"}), 500
+
+    page["items"] = [item.model_dump(mode="json") for item in page["items"]]
+    return jsonify(page)
+
+
+def _create_item(kind: str) -> ResponseType:
+    data: Optional[Dict[str, Any]] = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must contain a JSON object"}), 400
+
+    try:
+        item = _config_manager().create_item(kind, data)
+        logger.info("Created %s item %s", kind, item.id, extra=_sampled(f"{kind}_create"))
+        return jsonify(item.model_dump(mode="json")), 201
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error("Error creating %s item: %s", kind, e, exc_info=True)
+        return jsonify({"error": "Internal server error saving config"}), 500
+
+
+def _item(kind: str, item_id: str) -> ResponseType:
+    manager = _config_manager()
+    try:
+        if request.method == 'GET':
+            return jsonify(manager.get_item(kind, item_id).model_dump(mode="json"))
+
+        if request.method == 'DELETE':
+            manager.delete_item(kind, item_id)
+            logger.info("Deleted %s item %s", kind, item_id, extra=_sampled(f"{kind}_delete"))
+            return jsonify({"status": "deleted", "id": item_id})
+
+        data: Optional[Dict[str, Any]] = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must contain a JSON object"}), 400
+        # PUT replaces the item (omitted fields take their defaults), PATCH merges
+        item = manager.update_item(kind, item_id, data, replace=request.method == 'PUT')
+        logger.info("Updated %s item %s", kind, item_id, extra=_sampled(f"{kind}_update"))
+        return jsonify(item.model_dump(mode="json"))
+    except KeyError:
+        return jsonify({"error": f"No item with id {item_id!r}"}), 404
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors(include_context=False)}), 400
+    except Exception as e:
+        logger.error("Error handling %s %s item %s: %s", request.method, kind, item_id, e, exc_info=True)
+        return jsonify({"error": "Internal server error saving config"}), 500
+
+
+@api_bp.route('/timers', methods=['GET'])
+def list_timers() -> ResponseType:
+    """
+    List custom timers, one page at a time.
+
+    Method: GET /api/timers?sort=order|date|next_completion|label&order=asc|desc&offset=0&limit=50
+    Returns:
+        JSON: { "total", "offset", "limit", "items": [CustomTimer, ...] }
+        400: Invalid sort or paging parameters.
+    """
+    return _list_items("timers")
+
+
+@api_bp.route('/timers', methods=['POST'])
+def create_timer() -> ResponseType:
+    """
+    Add a custom timer.
+
+    Method: POST /api/timers
+    Body: CustomTimer fields (all optional; id is generated if omitted).
+    Returns:
+        201 JSON: The created CustomTimer.
+        400: Validation error, duplicate id or too many timers.
+    """
+    return _create_item("timers")
+
+
+@api_bp.route('/timers/<item_id>', methods=['GET', 'PUT', 'PATCH', 'DELETE'])
+def timer_item(item_id: str) -> ResponseType:
+    """
+    Read, replace (PUT), partially update (PATCH) or delete one custom timer.
+
+    Method: GET|PUT|PATCH|DELETE /api/timers/<id>
+    Returns:
+        JSON: The CustomTimer ({ "status": "deleted", "id" } for DELETE).
+        400: Validation error.
+        404: Unknown id.
+    """
+    return _item("timers", item_id)
+
+
+@api_bp.route('/wheel/options', methods=['GET'])
+def list_wheel_options() -> ResponseType:
+    """
+    List wheel options, one page at a time.
+
+    Method: GET /api/wheel/options?sort=order|label&order=asc|desc&offset=0&limit=50
+    Returns:
+        JSON: { "total", "offset", "limit", "items": [WheelOption, ...] }
+        400: Invalid sort or paging parameters.
+    """
+    return _list_items("wheel_options")
+
+
+@api_bp.route('/wheel/options', methods=['POST'])
+def create_wheel_option() -> ResponseType:
+    """
+    Add a wheel option.
+
+    Method: POST /api/wheel/options
+    Body: WheelOption fields (all optional; id is generated if omitted).
+    Returns:
+        201 JSON: The created WheelOption.
+        400: Validation error, duplicate id or too many options.
+    """
+    return _create_item("wheel_options")
+
+
+@api_bp.route('/wheel/options/<item_id>', methods=['GET', 'PUT', 'PATCH', 'DELETE'])
+def wheel_option_item(item_id: str) -> ResponseType:
+    """
+    Read, replace (PUT), partially update (PATCH) or delete one wheel option.
+
+    Method: GET|PUT|PATCH|DELETE /api/wheel/options/<id>
+    Returns:
+        JSON: The WheelOption ({ "status": "deleted", "id" } for DELETE).
+        400: Validation error.
+        404: Unknown id.
+    """
+    return _item("wheel_options", item_id)
+
+
 # ==============================================================================
 # Calendar API (/api/calendar_log, /api/calendar/*)
 # ==============================================================================
@@ -122,15 +341,44 @@ def get_calendar_log() -> ResponseType:
     Method: GET /api/calendar_log
     Returns:
         JSON: CalendarLogModel object.
+        Header X-Calendar-Version: version to pass to /calendar_log/changes.
     """
     try:
-        current_log = calendar_log.get_log()
-        return jsonify(current_log.model_dump(mode="json"))
+        version, log_dict = _calendar_log().snapshot()
+        response = jsonify(log_dict)
+        response.headers[CALENDAR_VERSION_HEADER] = str(version)
+        return response
     except Exception as e:
-        current_app.logger.error(f"Error getting calendar log: {e}", exc_info=True)
+        logger.error("Error getting calendar log: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error reading calendar log"}), 500
 
 
+@api_bp.route('/calendar_log/changes', methods=['GET'])
+def get_calendar_changes() -> ResponseType:
+    """
+    Retrieve calendar changes made after a known version (incremental sync).
+
+    Method: GET /api/calendar_log/changes?since=<version>
+    Returns:
+        JSON: { "version", "snapshot": false, "changes": [{ "date", "status", "entry"? }] }
+              or { "version", "snapshot": true, "marked_dates": {...} } if the
+              client is too far behind and must replace its copy.
+        400: If 'since' is missing or not an integer.
+    """
+    since = request.args.get('since', type=int)
+    if since is None:
+        return jsonify({"error": "Query parameter 'since' must be an integer version"}), 400
+
+    try:
+        result = _calendar_log().changes_since(since)
+        response = jsonify(result)
+        response.headers[CALENDAR_VERSION_HEADER] = str(result["version"])
+        return response
+    except Exception as e:
+        logger.error("Error getting calendar changes: %s", e, exc_info=True)
+        return jsonify({"error": "Internal server error reading calendar changes"}), 500
+
+
 @api_bp.route('/calendar/toggle', methods=['POST'])
 def toggle_calendar_date() -> ResponseType:
     """
@@ -139,7 +387,7 @@ def toggle_calendar_date() -> ResponseType:
     Method: POST /api/calendar/toggle
     Body: { "date": "YYYY-MM-DD" }
     Returns:
-        JSON: { "status": "added"|"removed", "entry": ... }
+        JSON: { "status": "added"|"removed", "entry": ..., "version": ... }
     """
     data: Optional[Dict[str, Any]] = request.get_json()
     if not data or 'date' not in data:
@@ -149,20 +397,22 @@ def toggle_calendar_date() -> ResponseType:
     try:
         date_obj = date.fromisoformat(date_str)
     except ValueError:
-        current_app.logger.warning(f"Invalid date format in toggle: {date_str}")
+        logger.warning("Invalid date format in toggle: %s", date_str)
         return jsonify({"error": "Invalid date format, use YYYY-MM-DD"}), 400
 
     try:
-        current_config = config_manager.get_config()
-        result = calendar_log.toggle_date(
+        current_config = _config_manager().get_config()
+        result = _calendar_log().toggle_date(
             date_to_toggle=date_obj,
             sticker=current_config.sticker_emoji,
             max_rotation=current_config.sticker_random_rotation_max
         )
-        current_app.logger.info(f"Toggled date {date_str}: {result.get('status')}")
-        return jsonify(result)
+        logger.info("Toggled date %s: %s", date_str, result.get('status'), extra=_sampled("toggle"))
+        response = jsonify(result)
+        response.headers[CALENDAR_VERSION_HEADER] = str(result["version"])
+        return response
     except Exception as e:
-        current_app.logger.error(f"Error toggling date {date_str}: {e}", exc_info=True)
+        logger.error("Error toggling date %s: %s", date_str, e, exc_info=True)
         return jsonify({"error": "Internal server error updating calendar log"}), 500
 
 
@@ -172,14 +422,78 @@ def reset_calendar() -> ResponseType:
     Clear all marked dates from the calendar.
     """
     try:
-        calendar_log.reset_log()
-        current_app.logger.info("Calendar log cleared.")
-        return jsonify(calendar_log.get_log().model_dump(mode="json"))
+        _calendar_log().reset_log()
+        logger.info("Calendar log cleared.")
+        version, log_dict = _calendar_log().snapshot()
+        response = jsonify(log_dict)
+        response.headers[CALENDAR_VERSION_HEADER] = str(version)
+        return response
     except Exception as e:
-        current_app.logger.error(f"Error resetting calendar: {e}", exc_info=True)
+        logger.error("Error resetting calendar: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error resetting calendar log"}), 500
 
 
+@api_bp.route('/calendar/export', methods=['GET'])
+def export_calendar() -> ResponseType:
+    """
+    Stream all marked dates as a downloadable file.
+
+    Method: GET /api/calendar/export?format=ndjson|csv
+    Returns:
+        Chunked NDJSON ({"date", "rotation", "sticker"} per line) or CSV.
+        400: Unsupported format.
+    """
+    try:
+        fmt = resolve_format(request.args.get('format', 'ndjson'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # The export runs while the body streams; iter_export logs and re-raises its errors
+    chunks = iter_export(_calendar_log().iter_entries(), fmt)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename=calendar_log.{fmt}"}
+    )
+
+
+@api_bp.route('/calendar/import', methods=['POST'])
+def import_calendar() -> ResponseType:
+    """
+    Import marked dates from an NDJSON or CSV upload.
+
+    Method: POST /api/calendar/import?format=ndjson|csv&mode=merge|replace
+    Body: multipart form with a 'file' field, or the raw file as the request body.
+    Returns:
+        JSON: { "imported": int, "added": int, "updated": int }
+        400: Unsupported format/mode or row validation errors (nothing is written).
+    """
+    mode = request.args.get('mode', 'merge')
+    if mode not in ('merge', 'replace'):
+        return jsonify({"error": "Invalid mode, use 'merge' or 'replace'"}), 400
+
+    upload = request.files.get('file')
+    stream = upload.stream if upload else request.stream
+    try:
+        fmt = resolve_format(
+            request.args.get('format'),
+            filename=upload.filename if upload else None,
+            mimetype=upload.mimetype if upload else request.mimetype
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        result = _calendar_log().import_entries(iter_import(stream, fmt), replace=(mode == 'replace'))
+        logger.info("Calendar import (%s, %s): %s", fmt, mode, result)
+        return jsonify(result)
+    except CalendarImportError as e:
+        return jsonify({"error": "Validation failed", "details": e.errors}), 400
+    except Exception as e:
+        logger.error("Error importing calendar log: %s", e, exc_info=True)
+        return jsonify({"error": "Internal server error importing calendar log"}), 500
+
+
 # ==============================================================================
 # Audio API (/api/audio_manifest, /api/audio/*)
 # ==============================================================================
@@ -190,14 +504,13 @@ def get_audio_manifest() -> ResponseType:
     Scans the configured audio directory and returns a manifest.
     Returns JSON: { "CategoryName": ["/api/audio/CategoryName/File.mp3", ...] }
     """
-    current_app.logger.info("[AUDIO] Requesting manifest...")
     manifest: Dict[str, List[str]] = {}
 
     try:
         sounds_dir = current_app.config.get('SOUNDS_FOLDER')
 
         if not sounds_dir or not sounds_dir.exists():
-            current_app.logger.warning(f"[AUDIO] Sounds directory not found: {sounds_dir}")
+            logger.warning("[AUDIO] Sounds directory not found: %s", sounds_dir)
             return jsonify({})
 
         for folder_name in SOUND_FOLDERS:
@@ -214,11 +527,13 @@ def get_audio_manifest() -> ResponseType:
 
             manifest[folder_name] = file_paths
 
-        current_app.logger.info("[AUDIO] Manifest generated.")
+        # One sampled record per request (each record spends a SamplingFilter token)
+        logger.info("[AUDIO] Manifest generated (%d files).", sum(map(len, manifest.values())),
+                    extra=_sampled("audio_manifest"))
         return jsonify(manifest)
 
     except Exception as e:
-        current_app.logger.error(f"[AUDIO] Error scanning audio folders: {e}", exc_info=True)
+        logger.error("[AUDIO] Error scanning audio folders: %s", e, exc_info=True)
         return jsonify({"error": "Internal server error scanning audio"}), 500
 
 
@@ -234,7 +549,7 @@ def serve_audio_file(category: str, filename: str) -> ResponseType:
             raise ValueError("SOUNDS_FOLDER not configured.")
 
         if category not in SOUND_FOLDERS:
-            current_app.logger.warning(f"[AUDIO] Access denied for category: {category}")
+            logger.warning("[AUDIO] Access denied for category: %s", category)
             return "Forbidden", 403
 
         directory_path = Path(sounds_dir) / category
@@ -246,8 +561,8 @@ def serve_audio_file(category: str, filename: str) -> ResponseType:
         )
 
     except FileNotFoundError:
-        current_app.logger.error(f"[AUDIO] File not found: {category}/{filename}")
+        logger.error("[AUDIO] File not found: %s/%s", category, filename)
         return "File Not Found", 404
     except Exception as e:
-        current_app.logger.error(f"[AUDIO] Error serving file: {e}", exc_info=True)
+        logger.error("[AUDIO] Error serving file: %s", e, exc_info=True)
         return "Server Error", 500
\ No newline at end of file
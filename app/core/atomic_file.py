@@ -0,0 +1,57 @@
+"""
+Atomic file replacement shared by the core managers.
+
+config.json and calendar_log.json are rewritten whole on every change.
+Writing them in place truncates the file first, so a concurrent reader (or
+a crash mid-write) sees an empty or half-written document. Instead the new
+content goes to a temporary file next to the target, which then replaces
+the target in one os.replace() call.
+"""
+
+import os
+import stat
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@contextlib.contextmanager
+def atomic_writer(path: Path, encoding: str = "utf-8") -> Iterator[IO[str]]:
+    """Open a text file that replaces `path` only once the block completes.
+
+    The data is flushed to disk before the rename, so `path` always holds
+    either the complete old or the complete new content. An existing
+    file's permissions are kept. If the block raises, the temporary file
+    is removed and `path` is left untouched.
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as fp:
+            _copy_mode(path, tmp_name)
+            yield fp
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _copy_mode(path: Path, tmp_name: str):
+    """Give the temporary file the target's permissions (mkstemp creates it as 0600)."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    os.chmod(tmp_name, stat.S_IMODE(mode))
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8"):
+    """Replace the contents of `path` with `text` atomically (see atomic_writer)."""
+    with atomic_writer(path, encoding) as fp:
+        fp.write(text)
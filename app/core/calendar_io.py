@@ -0,0 +1,244 @@
+"""
+Calendar Log Import/Export for the Relationship Countdown Timer.
+
+Streams marked dates out as NDJSON or CSV and parses uploaded files back
+row by row. Rows are validated in fixed-size batches against
+`MarkedDateEntry`, so large files never have to be held as raw text.
+"""
+
+import csv
+import io
+import json
+import codecs
+import logging
+from datetime import date
+from typing import Iterable, Iterator, List, Tuple, Dict, Any, IO, Union
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+from .calendar_log import MarkedDateEntry
+from .config_manager import MAX_STICKER_LENGTH
+from .calendar_store import StoredEntry
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+
+EXPORT_FORMATS: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+CSV_FIELDS: Tuple[str, ...] = ("date", "rotation", "sticker")
+EXPORT_CHUNK_ROWS = 256      # Rows joined into a single response chunk
+IMPORT_BATCH_ROWS = 1000     # Rows validated per Pydantic call
+MAX_REPORTED_ERRORS = 20     # Errors returned to the client before aborting
+
+# --- Pydantic Models ---
+
+class CalendarImportRow(MarkedDateEntry):
+    """Schema for a single imported row: a MarkedDateEntry plus its date.
+
+    Stickers are bounded like AppConfig.sticker_emoji, the only source of
+    stickers inside the app.
+    """
+    date: date
+    sticker: str = Field(..., max_length=MAX_STICKER_LENGTH, description="Sticker symbol (emoji).")
+
+_ROWS_ADAPTER = TypeAdapter(List[CalendarImportRow])
+
+# --- Errors ---
+
+class CalendarImportError(ValueError):
+    """Raised when an uploaded file cannot be parsed or fails validation.
+
+    Attributes:
+        errors: List of {"line": int, "error": str} dictionaries.
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__(f"Calendar import failed with {len(errors)} error(s).")
+
+# --- Export ---
+
+def resolve_format(requested: str | None, filename: str | None = None,
+                   mimetype: str | None = None) -> str:
+    """Pick an import/export format from a query value, filename or mimetype.
+
+    Args:
+        requested: Explicit `format` value ("ndjson" or "csv"), if any.
+        filename: Uploaded file name, used for its suffix.
+        mimetype: Request or upload content type.
+
+    Returns:
+        "ndjson" or "csv".
+
+    Raises:
+        ValueError: If an explicit format is not supported.
+    """
+    if requested:
+        fmt = requested.lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {requested}")
+        return fmt
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    if mimetype and mimetype.split(";")[0].strip() == EXPORT_FORMATS["csv"]:
+        return "csv"
+    return "ndjson"
+
+
+def iter_export(entries: Iterable[Tuple[date, Union[StoredEntry, MarkedDateEntry]]], fmt: str) -> Iterator[str]:
+    """Serialize calendar entries into text chunks.
+
+    Runs while the response is being streamed, after the view has returned,
+    so errors cannot become an error response. They are logged and
+    re-raised, which makes the server drop the connection before the final
+    chunk: the client sees a failed download instead of a short file.
+
+    Args:
+        entries: (date, entry) pairs with `rotation` and `sticker` attributes,
+            usually from CalendarLog.iter_entries().
+        fmt: "ndjson" or "csv".
+
+    Yields:
+        Text chunks of up to EXPORT_CHUNK_ROWS rows each.
+    """
+    try:
+        yield from _iter_export_chunks(entries, fmt)
+    except Exception as e:
+        logger.error(f"Calendar export aborted: {e}", exc_info=True)
+        raise
+
+
+def _iter_export_chunks(entries: Iterable[Tuple[date, Union[StoredEntry, MarkedDateEntry]]],
+                        fmt: str) -> Iterator[str]:
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(CSV_FIELDS)
+        rows = 0
+        for day, entry in entries:
+            writer.writerow((day.isoformat(), entry.rotation, entry.sticker))
+            rows += 1
+            if rows % EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+        return
+
+    chunk: List[str] = []
+    for day, entry in entries:
+        chunk.append(json.dumps(
+            {"date": day.isoformat(), "rotation": entry.rotation, "sticker": entry.sticker},
+            ensure_ascii=False
+        ))
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(chunk) + "\n"
+            chunk.clear()
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+# --- Import ---
+
+def _iter_raw_rows(stream: IO[bytes], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Decode a binary stream incrementally into (line_number, raw_row) pairs."""
+    lines = codecs.iterdecode(stream, "utf-8-sig")
+
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        if reader.fieldnames is None:
+            return
+        missing = [name for name in CSV_FIELDS if name not in reader.fieldnames]
+        if missing:
+            raise CalendarImportError([{"line": 1, "error": f"Missing CSV columns: {', '.join(missing)}"}])
+        for row in reader:
+            if None in row:
+                # DictReader collects fields beyond the header under the None key
+                yield reader.line_num, _InvalidRow(f"Expected {len(reader.fieldnames)} fields, got more")
+            else:
+                yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, _InvalidRow(f"Invalid JSON: {e.msg}")
+
+
+class _InvalidRow:
+    """Placeholder for a row that failed to parse, carrying its error."""
+    __slots__ = ("error",)
+
+    def __init__(self, error: str):
+        self.error = error
+
+
+def _validate_batch(batch: List[Tuple[int, Any]], errors: List[Dict[str, Any]]) -> List[CalendarImportRow]:
+    """Validate one batch of raw rows, appending failures to `errors`."""
+    parsed = [(line, row) for line, row in batch if not isinstance(row, _InvalidRow)]
+    for line, row in batch:
+        if isinstance(row, _InvalidRow):
+            errors.append({"line": line, "error": row.error})
+
+    try:
+        return _ROWS_ADAPTER.validate_python([row for _, row in parsed])
+    except ValidationError as e:
+        for err in e.errors():
+            index = err["loc"][0] if err["loc"] else 0
+            field = ".".join(str(part) for part in err["loc"][1:])
+            line = parsed[index][0] if isinstance(index, int) and index < len(parsed) else 0
+            errors.append({"line": line, "error": f"{field}: {err['msg']}" if field else err["msg"]})
+        return []
+
+
+def iter_import(stream: IO[bytes], fmt: str,
+                batch_size: int = IMPORT_BATCH_ROWS) -> Iterator[Tuple[date, MarkedDateEntry]]:
+    """Parse and validate an uploaded NDJSON/CSV stream in batches.
+
+    Validation errors are accumulated across batches; once the stream is
+    exhausted (or MAX_REPORTED_ERRORS is reached) a CalendarImportError is
+    raised, so callers must stage rows and commit only after full iteration.
+
+    Args:
+        stream: Binary file-like object (request body or uploaded file).
+        fmt: "ndjson" or "csv".
+        batch_size: Number of rows per validation call.
+
+    Yields:
+        Validated (date, MarkedDateEntry) pairs.
+
+    Raises:
+        CalendarImportError: If any row fails to parse or validate.
+    """
+    errors: List[Dict[str, Any]] = []
+    batch: List[Tuple[int, Any]] = []
+
+    def flush() -> Iterator[Tuple[date, MarkedDateEntry]]:
+        for row in _validate_batch(batch, errors):
+            yield row.date, MarkedDateEntry(rotation=row.rotation, sticker=row.sticker)
+        batch.clear()
+
+    try:
+        for line, raw in _iter_raw_rows(stream, fmt):
+            batch.append((line, raw))
+            if len(batch) >= batch_size:
+                yield from flush()
+                if len(errors) >= MAX_REPORTED_ERRORS:
+                    break
+        else:
+            yield from flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        errors.append({"line": 0, "error": f"Unreadable file: {e}"})
+
+    if errors:
+        logger.warning(f"Calendar import rejected: {len(errors)} error(s).")
+        errors.sort(key=lambda err: err["line"])
+        raise CalendarImportError(errors[:MAX_REPORTED_ERRORS])
@@ -3,26 +3,38 @@
 Calendar Log Manager for the Relationship Countdown Timer.
 
 Responsible for loading, saving, and modifying marked date entries
-in the `calendar_log.json` file. Uses Pydantic for data validation.
+in the `calendar_log.json` file. Uses Pydantic for data validation when
+reading the file; in memory, entries live in a compact CalendarStore.
 """
 
 import json
+import time
 import random
 import logging
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Deque, List
 
 from pydantic import BaseModel, Field, ValidationError
 
+from .locking import synchronized
+from .atomic_file import atomic_writer
+from .calendar_store import CalendarStore, StoredEntry, ROTATION_MIN, ROTATION_MAX
+
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# --- Constants ---
+CHANGE_RING_SIZE = 1024  # Recent changes kept for incremental sync (/calendar_log/changes)
+
 # --- Pydantic Models ---
 
 class MarkedDateEntry(BaseModel):
     """Schema for a single marked date entry."""
-    rotation: int = Field(..., description="Rotation angle of the sticker in degrees.")
+    rotation: int = Field(..., ge=ROTATION_MIN, le=ROTATION_MAX,
+                          description="Rotation angle of the sticker in degrees.")
     sticker: str = Field(..., description="Sticker symbol (emoji).")
 
 class CalendarLogModel(BaseModel):
@@ -48,7 +60,19 @@ class CalendarLog:
             log_path: Path to the calendar_log.json file (optional).
         """
         self.log_path: Optional[Path] = log_path
-        self._log: Optional[CalendarLogModel] = None
+        self._log: Optional[CalendarStore] = None
+        self._dirty: bool = False
+        # Guards _log and the file against concurrent requests (threaded server)
+        self._lock = threading.RLock()
+
+        # Change tracking. Versions start from the current time in ms, so they
+        # keep increasing across restarts and a client's old version is never
+        # mistaken for a point in the new history.
+        self._version: int = time.time_ns() // 1_000_000
+        # Clients older than this must reload everything (load/reset/replace)
+        self._snapshot_version: int = self._version
+        # (version, date, entry or None for a removal)
+        self._changes: Deque[Tuple[int, date, Optional[Tuple[int, str]]]] = deque(maxlen=CHANGE_RING_SIZE)
         logger.debug("CalendarLog instance created.")
 
     def init_app(self, log_path: Path):
@@ -78,12 +102,26 @@ class CalendarLog:
             return
 
         try:
-            json_data = self._log.model_dump_json(indent=4)
-            self.log_path.write_text(json_data, encoding="utf-8")
+            with atomic_writer(self.log_path) as fp:
+                self._log.write_json(fp, indent=4)
+            self._dirty = False
             logger.debug(f"Calendar log saved to {self.log_path}")
         except (IOError, TypeError) as e:
+            self._dirty = True
             logger.critical(f"CRITICAL ERROR saving calendar log: {e}", exc_info=True)
 
+    @synchronized
+    def flush(self) -> bool:
+        """Retry saving if the last write failed.
+
+        Returns:
+            True if the in-memory log matches the file on disk.
+        """
+        if self._dirty:
+            self._save()
+        return not self._dirty
+
+    @synchronized
     def load_or_create(self):
         """Load the log from disk or create a new one.
 
@@ -100,25 +138,30 @@ class CalendarLog:
         try:
             logger.info(f"Attempting to load calendar log from {self.log_path}...")
             raw_data = self.log_path.read_text(encoding="utf-8")
-            self._log = CalendarLogModel.model_validate_json(raw_data)
-            logger.info("Calendar log successfully loaded and validated.")
+            # File boundary: validate once, then keep only the compact store
+            model = CalendarLogModel.model_validate_json(raw_data)
+            self._log = CalendarStore.from_items(
+                (day, entry.rotation, entry.sticker) for day, entry in model.marked_dates.items()
+            )
+            logger.info(f"Calendar log successfully loaded and validated ({len(self._log)} entries).")
         except FileNotFoundError:
             logger.warning("Calendar log file not found. Creating a new one...")
-            self._log = CalendarLogModel()
+            self._log = CalendarStore()
             self._save()
-        except (json.JSONDecodeError, ValidationError) as e:
+        except (json.JSONDecodeError, ValidationError, ValueError) as e:
             logger.error(f"Calendar log corrupted or invalid: {e}", exc_info=True)
             logger.error("!!! Loading empty log into memory (corrupt file NOT overwritten).")
-            self._log = CalendarLogModel()
+            self._log = CalendarStore()
         except Exception as e:
             logger.critical(f"Unknown error loading calendar log: {e}", exc_info=True)
-            self._log = CalendarLogModel()
+            self._log = CalendarStore()
 
-    def get_log(self) -> CalendarLogModel:
-        """Retrieve the current log object, loading it if necessary.
+        # Whatever clients saw before no longer matches memory
+        self._start_new_history()
 
-        Returns:
-            The current CalendarLogModel instance.
+    @synchronized
+    def _store(self) -> CalendarStore:
+        """Return the in-memory store, loading it if necessary.
 
         Raises:
             ValueError: If log_path is not set.
@@ -132,15 +175,98 @@ class CalendarLog:
 
         if self._log is None:
             logger.error("Failed to initialize calendar log.")
-            return CalendarLogModel()
+            self._log = CalendarStore()
 
         return self._log
 
+    # --- Change Tracking ---
+
+    def _record_change(self, day: date, entry: Optional[Tuple[int, str]]):
+        """Append one change to the ring (caller holds the lock)."""
+        self._version += 1
+        self._changes.append((self._version, day, entry))
+
+    def _start_new_history(self):
+        """Invalidate incremental sync for every client (caller holds the lock)."""
+        self._version = max(self._version + 1, time.time_ns() // 1_000_000)
+        self._snapshot_version = self._version
+        self._changes.clear()
+
+    @property
+    def version(self) -> int:
+        """Current change version (increases on every modification)."""
+        return self._version
+
+    @synchronized
+    def snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Return (version, to_dict()) taken atomically."""
+        return self._version, self._store().to_dict()
+
+    @synchronized
+    def changes_since(self, since: int) -> Dict[str, Any]:
+        """Describe what changed after version `since`.
+
+        Args:
+            since: Version the client last saw.
+
+        Returns:
+            {"version", "snapshot": False, "changes": [{"date", "status", "entry"?}, ...]}
+            with one item per changed date (latest state wins), or
+            {"version", "snapshot": True, "marked_dates": {...}} when the
+            ring no longer covers `since` (overrun, reset, restart).
+        """
+        store = self._store()
+        oldest_covered = self._changes[0][0] - 1 if self._changes else self._version
+        if since > self._version or since < max(oldest_covered, self._snapshot_version):
+            return {"version": self._version, "snapshot": True, "marked_dates": store.to_dict()["marked_dates"]}
+
+        latest: Dict[date, Optional[Tuple[int, str]]] = {}
+        for version, day, entry in reversed(self._changes):
+            if version <= since:
+                break
+            latest.setdefault(day, entry)
+
+        changes: List[Dict[str, Any]] = []
+        for day in sorted(latest):
+            entry = latest[day]
+            if entry is None:
+                changes.append({"date": day.isoformat(), "status": "removed"})
+            else:
+                changes.append({"date": day.isoformat(), "status": "added",
+                                "entry": {"rotation": entry[0], "sticker": entry[1]}})
+        return {"version": self._version, "snapshot": False, "changes": changes}
+
+    @synchronized
+    def get_log(self) -> CalendarLogModel:
+        """Build a validated CalendarLogModel snapshot of the log.
+
+        This materializes one model per entry; prefer to_dict() or
+        iter_entries() on hot paths.
+
+        Raises:
+            ValueError: If log_path is not set.
+        """
+        return CalendarLogModel(marked_dates={
+            day: MarkedDateEntry(rotation=entry.rotation, sticker=entry.sticker)
+            for day, entry in self._store().items()
+        })
+
+    @synchronized
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the log to a JSON-compatible dict.
+
+        Runs under the lock, so a concurrent toggle cannot change the
+        store while it is being walked.
+        """
+        return self._store().to_dict()
+
+    @synchronized
     def reset_log(self):
         """Clear all marked dates and save changes."""
         if self._log is not None:
             logger.warning("Resetting calendar log...")
-            self._log.marked_dates.clear()
+            self._log.clear()
+            self._start_new_history()
             self._save()
         else:
             logger.error("Attempted to reset log before initialization.")
@@ -148,6 +274,7 @@ class CalendarLog:
             if self._log is not None:
                 self.reset_log()
 
+    @synchronized
     def toggle_date(self, date_to_toggle: date, sticker: str, max_rotation: int) -> Dict[str, Any]:
         """Toggle the marked status for a specific date.
 
@@ -157,23 +284,23 @@ class CalendarLog:
             max_rotation: Maximum random rotation in degrees.
 
         Returns:
-            Dictionary containing operation status ("added" or "removed")
-            and the entry data if added.
+            Dictionary containing operation status ("added" or "removed"),
+            the entry data if added, and the new log version.
 
         Raises:
             RuntimeError: If the log is not initialized.
         """
         if self._log is None:
             logger.error(f"Attempted to toggle date {date_to_toggle} before init.")
-            self.get_log()
+            self._store()
             if self._log is None:
                 raise RuntimeError("Calendar log not initialized.")
 
         operation_status: Dict[str, Any] = {}
         
-        if date_to_toggle in self._log.marked_dates:
-            # Remove
-            del self._log.marked_dates[date_to_toggle]
+        if self._log.remove(date_to_toggle):
+            # Removed
+            self._record_change(date_to_toggle, None)
             logger.info(f"Removed mark for date: {date_to_toggle}")
             operation_status = {"status": "removed"}
         else:
@@ -185,9 +312,71 @@ class CalendarLog:
                 rotation = 0
 
             entry = MarkedDateEntry(rotation=rotation, sticker=sticker)
-            self._log.marked_dates[date_to_toggle] = entry
+            self._log.set(date_to_toggle, entry.rotation, entry.sticker)
+            self._record_change(date_to_toggle, (entry.rotation, entry.sticker))
             logger.info(f"Added mark for date: {date_to_toggle} (rot: {rotation})")
             operation_status = {"status": "added", "entry": entry.model_dump()}
 
+        operation_status["version"] = self._version
         self._save()
-        return operation_status
\ No newline at end of file
+        return operation_status
+
+    def iter_entries(self) -> Iterator[Tuple[date, StoredEntry]]:
+        """Yield marked dates in chronological order.
+
+        Iterates over a snapshot of the store (a few array copies), so
+        toggles made while a consumer is still reading do not affect it.
+
+        Yields:
+            (date, StoredEntry) pairs; StoredEntry has the same `rotation`
+            and `sticker` attributes as MarkedDateEntry.
+        """
+        with self._lock:
+            snapshot = self._store().copy()
+        yield from snapshot.items()
+
+    def import_entries(self, entries: Iterable[Tuple[date, MarkedDateEntry]],
+                       replace: bool = False) -> Dict[str, int]:
+        """Merge (or replace) marked dates from an iterable and save once.
+
+        The iterable is fully consumed into a staging dict before the log is
+        touched, so a validation error raised mid-stream leaves the log intact.
+
+        Args:
+            entries: Validated (date, MarkedDateEntry) pairs.
+            replace: If True, existing marked dates are discarded first.
+
+        Returns:
+            Dictionary with "imported", "added" and "updated" counts and the new log version.
+
+        Raises:
+            RuntimeError: If the log is not initialized.
+        """
+        staged: Dict[date, Tuple[int, str]] = {}
+        for day, entry in entries:
+            staged[day] = (entry.rotation, entry.sticker)
+
+        with self._lock:
+            store = self._store()
+            if self._log is None:
+                raise RuntimeError("Calendar log not initialized.")
+
+            if replace:
+                added, updated = len(staged), 0
+                self._log = CalendarStore.from_items(
+                    (day, rotation, sticker) for day, (rotation, sticker) in staged.items()
+                )
+                self._start_new_history()
+            else:
+                added, updated = store.merge(staged)
+                if len(staged) < CHANGE_RING_SIZE:
+                    for day in sorted(staged):
+                        self._record_change(day, staged[day])
+                else:
+                    # Would overrun the ring anyway: clients resync from a snapshot
+                    self._start_new_history()
+
+            self._save()
+            version = self._version
+        logger.info(f"Imported {len(staged)} calendar entries (added: {added}, updated: {updated}, replace: {replace})")
+        return {"imported": len(staged), "added": added, "updated": updated, "version": version}
@@ -0,0 +1,298 @@
+# /mrhoustontimer/app/core/calendar_store.py
+"""
+Compact in-memory storage for calendar marks.
+
+A marked date costs 12 bytes here (day ordinal, int16 rotation, sticker id)
+instead of a date key plus a Pydantic model per entry. Validation happens at
+the boundaries: files are validated with CalendarLogModel when loaded, API
+input with MarkedDateEntry, and the store itself only holds trusted values.
+"""
+
+import json
+from array import array
+from calendar import monthrange
+from bisect import bisect_left
+from datetime import date
+from typing import Optional, Dict, List, Iterable, Iterator, Tuple, NamedTuple, IO
+
+# --- Constants ---
+
+ROTATION_MIN = -32768          # int16 range of the rotations array
+ROTATION_MAX = 32767
+MAX_STICKERS = 65536           # uint16 sticker ids
+WRITE_CHUNK_ROWS = 4096        # Rows per write() call when serializing
+_DAY_SUFFIXES = [f"{day:02d}" for day in range(32)]
+
+
+class StoredEntry(NamedTuple):
+    """Read-only view of one mark (same attributes as MarkedDateEntry)."""
+    rotation: int
+    sticker: str
+
+
+class CalendarStore:
+    """Marked dates as three parallel arrays sorted by day ordinal.
+
+    Lookups are binary searches; appending a later date (the common case)
+    is amortized O(1), inserting in the middle shifts the tail.
+    Not thread-safe: CalendarLog guards it with its lock.
+    """
+
+    __slots__ = ("_ordinals", "_rotations", "_sticker_ids", "_stickers", "_sticker_index")
+
+    def __init__(self):
+        self._ordinals = array("l")      # date.toordinal(), strictly increasing
+        self._rotations = array("h")     # int16
+        self._sticker_ids = array("H")   # index into _stickers
+        self._stickers: List[str] = []
+        self._sticker_index: Dict[str, int] = {}
+
+    # --- Construction ---
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[date, int, str]]) -> "CalendarStore":
+        """Build a store from (date, rotation, sticker) triples in any order.
+
+        Later duplicates of a date win.
+
+        Raises:
+            ValueError: If a rotation is outside int16 or there are too many distinct stickers.
+        """
+        by_ordinal: Dict[int, Tuple[int, str]] = {}
+        for day, rotation, sticker in items:
+            by_ordinal[day.toordinal()] = (rotation, sticker)
+        store = cls()
+        store._extend_sorted(sorted(by_ordinal.items()))
+        return store
+
+    def copy(self) -> "CalendarStore":
+        """Cheap snapshot (array copies are memcpy)."""
+        clone = CalendarStore()
+        clone._ordinals = array("l", self._ordinals)
+        clone._rotations = array("h", self._rotations)
+        clone._sticker_ids = array("H", self._sticker_ids)
+        clone._stickers = list(self._stickers)
+        clone._sticker_index = dict(self._sticker_index)
+        return clone
+
+    # --- Queries ---
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def _find(self, ordinal: int) -> Tuple[int, bool]:
+        index = bisect_left(self._ordinals, ordinal)
+        return index, index < len(self._ordinals) and self._ordinals[index] == ordinal
+
+    def __contains__(self, day: date) -> bool:
+        return self._find(day.toordinal())[1]
+
+    def get(self, day: date) -> Optional[StoredEntry]:
+        """Return the mark for a date, or None."""
+        index, found = self._find(day.toordinal())
+        if not found:
+            return None
+        return StoredEntry(self._rotations[index], self._stickers[self._sticker_ids[index]])
+
+    def items(self) -> Iterator[Tuple[date, StoredEntry]]:
+        """Yield (date, StoredEntry) pairs in chronological order."""
+        stickers = self._stickers
+        fromordinal = date.fromordinal
+        for ordinal, rotation, sticker_id in zip(self._ordinals, self._rotations, self._sticker_ids):
+            yield fromordinal(ordinal), StoredEntry(rotation, stickers[sticker_id])
+
+    # --- Mutation ---
+
+    def set(self, day: date, rotation: int, sticker: str) -> bool:
+        """Add or overwrite the mark for a date.
+
+        Returns:
+            True if the date was not marked before.
+
+        Raises:
+            ValueError: If rotation is outside int16 or the sticker table is full.
+        """
+        self._check_rotation(rotation)
+        sticker_id = self._sticker_id(sticker)
+        index, found = self._find(day.toordinal())
+        if found:
+            self._rotations[index] = rotation
+            self._sticker_ids[index] = sticker_id
+            return False
+        if index == len(self._ordinals):
+            self._ordinals.append(day.toordinal())
+            self._rotations.append(rotation)
+            self._sticker_ids.append(sticker_id)
+        else:
+            self._ordinals.insert(index, day.toordinal())
+            self._rotations.insert(index, rotation)
+            self._sticker_ids.insert(index, sticker_id)
+        return True
+
+    def remove(self, day: date) -> bool:
+        """Unmark a date.
+
+        Returns:
+            True if the date was marked.
+        """
+        index, found = self._find(day.toordinal())
+        if not found:
+            return False
+        del self._ordinals[index]
+        del self._rotations[index]
+        del self._sticker_ids[index]
+        return True
+
+    def clear(self):
+        """Remove every mark."""
+        self._ordinals = array("l")
+        self._rotations = array("h")
+        self._sticker_ids = array("H")
+        self._stickers = []
+        self._sticker_index = {}
+
+    def merge(self, items: Dict[date, Tuple[int, str]]) -> Tuple[int, int]:
+        """Add or overwrite many marks in one linear pass.
+
+        Args:
+            items: date -> (rotation, sticker).
+
+        Returns:
+            (added, updated) counts.
+
+        Raises:
+            ValueError: On an invalid rotation or a full sticker table
+                (the store is left unchanged).
+        """
+        incoming = sorted((day.toordinal(), value) for day, value in items.items())
+        for _, (rotation, sticker) in incoming:
+            self._check_rotation(rotation)
+        # Drop stickers no longer in use, then resolve ids up front so a full
+        # table fails before anything changes (compacting mid-way would
+        # invalidate ids already resolved)
+        self._compact_stickers()
+        incoming_ids = [(ordinal, rotation, self._sticker_id(sticker, compact=False))
+                        for ordinal, (rotation, sticker) in incoming]
+
+        ordinals, rotations, sticker_ids = array("l"), array("h"), array("H")
+        old_ordinals, old_rotations, old_ids = self._ordinals, self._rotations, self._sticker_ids
+        i, added, updated = 0, 0, 0
+        for ordinal, rotation, sticker_id in incoming_ids:
+            while i < len(old_ordinals) and old_ordinals[i] < ordinal:
+                ordinals.append(old_ordinals[i])
+                rotations.append(old_rotations[i])
+                sticker_ids.append(old_ids[i])
+                i += 1
+            if i < len(old_ordinals) and old_ordinals[i] == ordinal:
+                i += 1
+                updated += 1
+            else:
+                added += 1
+            ordinals.append(ordinal)
+            rotations.append(rotation)
+            sticker_ids.append(sticker_id)
+        ordinals.extend(old_ordinals[i:])
+        rotations.extend(old_rotations[i:])
+        sticker_ids.extend(old_ids[i:])
+
+        self._ordinals, self._rotations, self._sticker_ids = ordinals, rotations, sticker_ids
+        return added, updated
+
+    def _extend_sorted(self, items: List[Tuple[int, Tuple[int, str]]]):
+        """Append (ordinal, (rotation, sticker)) pairs that sort after every stored date."""
+        for ordinal, (rotation, sticker) in items:
+            self._check_rotation(rotation)
+            self._ordinals.append(ordinal)
+            self._rotations.append(rotation)
+            self._sticker_ids.append(self._sticker_id(sticker))
+
+    def _sticker_id(self, sticker: str, compact: bool = True) -> int:
+        sticker_id = self._sticker_index.get(sticker)
+        if sticker_id is None:
+            if len(self._stickers) >= MAX_STICKERS and compact:
+                self._compact_stickers()
+            if len(self._stickers) >= MAX_STICKERS:
+                raise ValueError(f"Too many distinct stickers in use (max {MAX_STICKERS}).")
+            sticker_id = len(self._stickers)
+            self._stickers.append(sticker)
+            self._sticker_index[sticker] = sticker_id
+        return sticker_id
+
+    def _compact_stickers(self):
+        """Rebuild the sticker table with only the stickers still referenced.
+
+        Removals leave unused entries behind; they are dropped here (when
+        the table fills up and before merges) instead of on every removal.
+        """
+        used = sorted(set(self._sticker_ids))
+        if len(used) == len(self._stickers):
+            return
+        remap = {old_id: new_id for new_id, old_id in enumerate(used)}
+        self._sticker_ids = array("H", [remap[sticker_id] for sticker_id in self._sticker_ids])
+        self._stickers = [self._stickers[old_id] for old_id in used]
+        self._sticker_index = {sticker: sticker_id for sticker_id, sticker in enumerate(self._stickers)}
+
+    @staticmethod
+    def _check_rotation(rotation: int):
+        if not ROTATION_MIN <= rotation <= ROTATION_MAX:
+            raise ValueError(f"Rotation {rotation} is outside {ROTATION_MIN}..{ROTATION_MAX}.")
+
+    # --- Serialization ---
+
+    def _iso_days(self) -> Iterator[str]:
+        """Yield "YYYY-MM-DD" for every stored date.
+
+        Builds one date object per month instead of one per entry; the
+        ordinals are sorted, so each month is a contiguous range.
+        """
+        month_first, month_next, prefix = 0, 0, ""
+        for ordinal in self._ordinals:
+            if not month_first <= ordinal < month_next:
+                day = date.fromordinal(ordinal)
+                month_first = ordinal - day.day + 1
+                month_next = month_first + monthrange(day.year, day.month)[1]
+                prefix = day.isoformat()[:8]
+            yield prefix + _DAY_SUFFIXES[ordinal - month_first + 1]
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """JSON-compatible dict in the calendar_log.json shape."""
+        stickers = self._stickers
+        return {"marked_dates": {
+            iso_day: {"rotation": rotation, "sticker": stickers[sticker_id]}
+            for iso_day, rotation, sticker_id in zip(self._iso_days(), self._rotations, self._sticker_ids)
+        }}
+
+    def write_json(self, fp: IO[str], indent: int = 4):
+        """Write the calendar_log.json document (same layout as model_dump_json(indent=4)).
+
+        Rows are formatted from the arrays directly; each sticker is
+        JSON-encoded once and date strings are built per month.
+        """
+        pad = " " * indent
+        pad2, pad3 = pad * 2, pad * 3
+        encoded_stickers = [json.dumps(sticker, ensure_ascii=False) for sticker in self._stickers]
+
+        if not self._ordinals:
+            fp.write('{\n' + pad + '"marked_dates": {}\n}')
+            return
+
+        fp.write('{\n' + pad + '"marked_dates": {')
+        rows: List[str] = []
+        separator = ""
+        for iso_day, rotation, sticker_id in zip(self._iso_days(), self._rotations, self._sticker_ids):
+            rows.append(
+                f'\n{pad2}"{iso_day}": {{\n'
+                f'{pad3}"rotation": {rotation},\n'
+                f'{pad3}"sticker": {encoded_stickers[sticker_id]}\n{pad2}}}'
+            )
+            if len(rows) >= WRITE_CHUNK_ROWS:
+                fp.write(separator + ",".join(rows))
+                separator = ","
+                rows.clear()
+        if rows:
+            fp.write(separator + ",".join(rows))
+        fp.write('\n' + pad + '}\n}')
+
+    def nbytes(self) -> int:
+        """Approximate payload size of the arrays (for diagnostics)."""
+        return sum(a.itemsize * len(a) for a in (self._ordinals, self._rotations, self._sticker_ids))
@@ -9,15 +9,28 @@ settings via `config.json`. Uses Pydantic for schema validation.
 import json
 import uuid
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Literal, List, Dict, Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from .locking import synchronized
+from .atomic_file import atomic_write_text
+
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# --- Constants ---
+# Caps for create_item() and the UI only; config.json itself is not limited, so
+# larger lists written by older versions still load.
+MAX_CUSTOM_TIMERS = 500
+MAX_WHEEL_OPTIONS = 500  # Keep in sync with wheelController.MAX_OPTIONS in static/js/app.js
+MAX_STICKER_LENGTH = 2  # Characters in a calendar sticker (one emoji, optionally with a variation selector)
+TIMER_SORT_KEYS = ("order", "date", "next_completion", "label")
+WHEEL_OPTION_SORT_KEYS = ("order", "label")
+
 # --- Helper Functions ---
 
 def _now_factory() -> datetime:
@@ -122,7 +135,7 @@ class AppConfig(BaseModel):
     wheel_options: List[WheelOption] = Field(default_factory=list)
 
     # Calendar Settings
-    sticker_emoji: str = Field(default="X", max_length=2)
+    sticker_emoji: str = Field(default="X", max_length=MAX_STICKER_LENGTH)
     sticker_color: str = "#F48FB1"
     sticker_scale: float = Field(default=1.0, ge=0.1, le=10.0)
     sticker_random_rotation_max: int = Field(default=15, ge=0, le=180)
@@ -138,6 +151,20 @@ class AppConfig(BaseModel):
     # Colors
     colors: ColorConfig = Field(default_factory=ColorConfig)
 
+    # Diagnostics
+    # Per-logger levels, e.g. {"app.api": "WARNING"}; applied at startup,
+    # LOVETIMER_LOG_LEVELS overrides them.
+    log_levels: Dict[str, str] = Field(default_factory=dict)
+
+    @field_validator('log_levels')
+    @classmethod
+    def check_log_levels(cls, value: Dict[str, str]) -> Dict[str, str]:
+        """Ensures every value is a known logging level name."""
+        for name, level in value.items():
+            if not isinstance(logging.getLevelName(str(level).upper()), int):
+                raise ValueError(f'Unknown log level for {name!r}: {level!r}')
+        return {name: str(level).upper() for name, level in value.items()}
+
 
 # --- Configuration Manager ---
 
@@ -152,6 +179,12 @@ class ConfigManager:
         """
         self.config_path: Optional[Path] = config_path
         self._config: Optional[AppConfig] = None
+        self._dirty: bool = False
+        # Guards _config and the file against concurrent requests (threaded server)
+        self._lock = threading.RLock()
+        # id -> list position for custom timers and wheel options (see _item_index)
+        self._item_indexes: Dict[str, Dict[str, int]] = {}
+        self._indexed_config: Optional[AppConfig] = None
 
     def init_app(self, config_path: Path):
         """Set config path after instantiation."""
@@ -168,11 +201,25 @@ class ConfigManager:
 
         try:
             json_data = self._config.model_dump_json(indent=4)
-            self.config_path.write_text(json_data, encoding="utf-8")
+            atomic_write_text(self.config_path, json_data)
+            self._dirty = False
             logger.debug(f"Config saved to {self.config_path}")
         except (IOError, TypeError) as e:
+            self._dirty = True
             logger.critical(f"CRITICAL ERROR saving config: {e}", exc_info=True)
 
+    @synchronized
+    def flush(self) -> bool:
+        """Retry saving if the last write failed.
+
+        Returns:
+            True if the in-memory config matches the file on disk.
+        """
+        if self._dirty:
+            self._save()
+        return not self._dirty
+
+    @synchronized
     def backup_and_reset_config(self) -> AppConfig:
         """Create a backup and reset config to defaults.
 
@@ -215,6 +262,7 @@ class ConfigManager:
                     logger.critical(f"FATAL: Backup restore failed: {restore_e}")
             raise e
 
+    @synchronized
     def load_or_create_defaults(self):
         """Load config from file or create defaults if missing/invalid."""
         if not self.config_path:
@@ -249,6 +297,7 @@ class ConfigManager:
         )
         logger.info("Default config object created.")
 
+    @synchronized
     def get_config(self) -> AppConfig:
         """Retrieve current configuration."""
         if not self.config_path:
@@ -263,9 +312,14 @@ class ConfigManager:
 
         return self._config
 
+    @synchronized
     def update_config(self, new_config_data: Dict[str, Any]) -> AppConfig:
         """Update configuration with new data.
 
+        `custom_timers` and `wheel_options` left out of the data keep their
+        current items, so a settings save that does not touch them cannot
+        overwrite edits made through the item methods meanwhile.
+
         Args:
             new_config_data: Dictionary containing new settings.
 
@@ -282,6 +336,14 @@ class ConfigManager:
             raise TypeError("new_config_data must be a dictionary")
 
         try:
+            # Keep collections the caller did not send
+            current = self.get_config()
+            new_config_data = dict(new_config_data)
+            new_config_data.setdefault("wheel_options", current.wheel_options)
+            timers = new_config_data.get("timers", {})
+            if isinstance(timers, dict) and "custom_timers" not in timers:
+                new_config_data["timers"] = {**timers, "custom_timers": current.timers.custom_timers}
+
             # Validate and update
             updated_config = AppConfig.model_validate(new_config_data)
 
@@ -298,4 +360,141 @@ class ConfigManager:
             raise e
         except Exception as e:
             logger.error(f"Error updating config: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to update config: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Failed to update config: {e}") from e
+
+    # --- Item-level access (custom timers, wheel options) ---
+
+    def _items(self, kind: str) -> List[BaseModel]:
+        """The live list for "timers" or "wheel_options" (caller holds the lock)."""
+        config = self.get_config()
+        return config.timers.custom_timers if kind == "timers" else config.wheel_options
+
+    def _item_index(self, kind: str) -> Dict[str, int]:
+        """id -> position map for a collection, rebuilt when the config object is replaced."""
+        self.get_config()
+        if self._indexed_config is not self._config:
+            self._item_indexes = {}
+            self._indexed_config = self._config
+        index = self._item_indexes.get(kind)
+        if index is None:
+            index = {item.id: position for position, item in enumerate(self._items(kind))}
+            self._item_indexes[kind] = index
+        return index
+
+    @staticmethod
+    def _item_model(kind: str):
+        return CustomTimer if kind == "timers" else WheelOption
+
+    @staticmethod
+    def _item_limit(kind: str) -> int:
+        return MAX_CUSTOM_TIMERS if kind == "timers" else MAX_WHEEL_OPTIONS
+
+    @synchronized
+    def get_item(self, kind: str, item_id: str) -> BaseModel:
+        """Look up one timer/option by id.
+
+        Raises:
+            KeyError: If no item has this id.
+        """
+        position = self._item_index(kind).get(item_id)
+        if position is None:
+            raise KeyError(item_id)
+        return self._items(kind)[position]
+
+    @synchronized
+    def list_items(self, kind: str, sort: str = "order", descending: bool = False,
+                   offset: int = 0, limit: int = 50, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Return one page of a collection.
+
+        Args:
+            kind: "timers" or "wheel_options".
+            sort: One of TIMER_SORT_KEYS / WHEEL_OPTION_SORT_KEYS. "next_completion"
+                lists upcoming timers soonest first, then finished ones, most recent first.
+            descending: Reverse the sort order.
+            offset: Number of items to skip.
+            limit: Page size.
+            now: Reference time for "next_completion" (defaults to now).
+
+        Returns:
+            {"total", "offset", "limit", "items": [model, ...]}
+
+        Raises:
+            ValueError: On an unknown sort key.
+        """
+        allowed = TIMER_SORT_KEYS if kind == "timers" else WHEEL_OPTION_SORT_KEYS
+        if sort not in allowed:
+            raise ValueError(f"sort must be one of: {', '.join(allowed)}")
+
+        items = list(self._items(kind))
+        if sort == "date":
+            items.sort(key=lambda timer: timer.date.timestamp())
+        elif sort == "next_completion":
+            now_ts = (now or datetime.now()).timestamp()
+            items.sort(key=lambda timer: (0, timer.date.timestamp()) if timer.date.timestamp() >= now_ts
+                       else (1, -timer.date.timestamp()))
+        elif sort == "label":
+            items.sort(key=lambda item: item.label.casefold())
+        if descending:
+            items.reverse()
+
+        return {"total": len(items), "offset": offset, "limit": limit, "items": items[offset:offset + limit]}
+
+    @synchronized
+    def create_item(self, kind: str, data: Dict[str, Any]) -> BaseModel:
+        """Validate and append one timer/option, then save.
+
+        Raises:
+            ValidationError: If the item is invalid.
+            ValueError: If the id already exists or the collection is full.
+        """
+        item = self._item_model(kind).model_validate(data)
+        index = self._item_index(kind)
+        if item.id in index:
+            raise ValueError(f"Item with id {item.id!r} already exists.")
+        items = self._items(kind)
+        if len(items) >= self._item_limit(kind):
+            raise ValueError(f"At most {self._item_limit(kind)} items are allowed.")
+
+        items.append(item)
+        index[item.id] = len(items) - 1
+        self._save()
+        return item
+
+    @synchronized
+    def update_item(self, kind: str, item_id: str, changes: Dict[str, Any], replace: bool = False) -> BaseModel:
+        """Update one timer/option (only that item is validated), then save.
+
+        Args:
+            changes: Fields to change; the id cannot be changed.
+            replace: Replace the whole item instead of merging into it.
+
+        Raises:
+            KeyError: If no item has this id.
+            ValidationError: If the result is invalid.
+        """
+        position = self._item_index(kind).get(item_id)
+        if position is None:
+            raise KeyError(item_id)
+        items = self._items(kind)
+        base = {} if replace else items[position].model_dump()
+        merged = {**base, **changes, "id": item_id}
+        items[position] = self._item_model(kind).model_validate(merged)
+        self._save()
+        return items[position]
+
+    @synchronized
+    def delete_item(self, kind: str, item_id: str):
+        """Remove one timer/option, then save.
+
+        Raises:
+            KeyError: If no item has this id.
+        """
+        index = self._item_index(kind)
+        position = index.pop(item_id, None)
+        if position is None:
+            raise KeyError(item_id)
+        items = self._items(kind)
+        del items[position]
+        for shifted in range(position, len(items)):
+            index[items[shifted].id] = shifted
+        self._save()
@@ -0,0 +1,20 @@
+"""
+Locking helpers shared by the core managers.
+
+Managers are used from several request threads at once (threaded/pooled
+servers), so their public mutators run under a per-instance re-entrant lock.
+"""
+
+import functools
+from typing import Callable, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+def synchronized(method: F) -> F:
+    """Run a manager method while holding the instance's `_lock` (an RLock)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
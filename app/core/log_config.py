@@ -0,0 +1,229 @@
+# /mrhoustontimer/app/core/log_config.py
+"""
+Logging setup for the application.
+
+Request threads only put log records on an in-memory queue; a background
+QueueListener thread formats them and writes to the console and to a
+rotating log file in the save directory. Levels can be set per logger via
+the `log_levels` config field or the LOVETIMER_LOG_LEVELS environment
+variable, and hot routes are rate-limited with SamplingFilter.
+"""
+
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional, Dict, Mapping, Tuple
+
+# --- Constants ---
+
+LOG_LEVELS_ENV = "LOVETIMER_LOG_LEVELS"   # e.g. "INFO,app.api=WARNING,werkzeug=ERROR"
+LOG_DIR_NAME = "logs"
+LOG_FILE_NAME = "lovetimer.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_FORMAT = "%(asctime)s %(levelname)-8s %(threadName)s %(name)s: %(message)s"
+
+DEFAULT_LEVEL = logging.INFO
+# Per-request access lines from the dev server are noise at normal levels
+DEFAULT_LOGGER_LEVELS: Dict[str, int] = {"werkzeug": logging.WARNING}
+
+SAMPLE_RATE_PER_S = 1.0    # Sustained records per second per sample key
+SAMPLE_BURST = 5           # Records allowed through before throttling starts
+
+_listener: Optional[QueueListener] = None
+_configured_levels: Dict[str, int] = {}
+
+
+# --- Level Parsing ---
+
+def parse_level(value) -> int:
+    """Converts a level name ("warning") or number to a logging level.
+
+    Raises:
+        ValueError: If the level is unknown.
+    """
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value).strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {value!r}")
+    return level
+
+
+def parse_level_spec(spec: str) -> Dict[str, int]:
+    """Parses "INFO,app.api=WARNING" into {"": INFO, "app.api": WARNING}.
+
+    An entry without a logger name sets the root level.
+
+    Raises:
+        ValueError: On unknown level names.
+    """
+    levels: Dict[str, int] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, sep, level = part.rpartition("=")
+        levels[name.strip() if sep else ""] = parse_level(level)
+    return levels
+
+
+def apply_levels(levels: Mapping[str, object]):
+    """Sets logger levels; "" (or "root") addresses the root logger.
+
+    Invalid entries are logged and skipped.
+    """
+    for name, value in levels.items():
+        try:
+            level = parse_level(value)
+        except ValueError as e:
+            logging.getLogger(__name__).warning("Ignoring log level for %r: %s", name, e)
+            continue
+        logger_name = None if name in ("", "root") else name
+        logging.getLogger(logger_name).setLevel(level)
+        _configured_levels[name or "root"] = level
+
+
+def apply_config_levels(config_levels: Optional[Mapping[str, str]]):
+    """Applies levels from config.json, then re-applies the environment
+    overrides so LOVETIMER_LOG_LEVELS always wins."""
+    if config_levels:
+        apply_levels(config_levels)
+    apply_levels(_env_levels())
+
+
+def _env_levels() -> Dict[str, int]:
+    spec = os.environ.get(LOG_LEVELS_ENV, "")
+    try:
+        return parse_level_spec(spec)
+    except ValueError as e:
+        logging.getLogger(__name__).warning("Ignoring %s=%r: %s", LOG_LEVELS_ENV, spec, e)
+        return {}
+
+
+# --- Sampling ---
+
+class SamplingFilter(logging.Filter):
+    """Token-bucket rate limit for records logged with extra={"sample_key": ...}.
+
+    Each key may emit SAMPLE_BURST records at once and SAMPLE_RATE_PER_S
+    afterwards. The next record that passes reports how many were dropped.
+    Records without a sample_key, and WARNING or above, always pass.
+    """
+
+    def __init__(self, rate_per_s: float = SAMPLE_RATE_PER_S, burst: int = SAMPLE_BURST):
+        super().__init__()
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self._lock = threading.Lock()
+        # key -> (tokens, last_refill_time, suppressed_count)
+        self._buckets: Dict[str, Tuple[float, float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None)
+        if key is None or record.levelno >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, last, suppressed = self._buckets.get(key, (float(self.burst), now, 0))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate_per_s)
+            if tokens < 1.0:
+                self._buckets[key] = (tokens, now, suppressed + 1)
+                return False
+            self._buckets[key] = (tokens - 1.0, now, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} similar suppressed)"
+        return True
+
+
+# --- Queue Handler ---
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() merges msg and args on the caller's thread (to make
+    records picklable); the queue here never leaves the process, so the
+    record is passed through untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# --- Setup ---
+
+def configure_logging(save_dir: Optional[Path] = None, debug: bool = False,
+                      console: bool = True) -> QueueListener:
+    """Routes all logging through a queue to a background writer thread.
+
+    Safe to call more than once (e.g. one app per test); the previous
+    listener is stopped and replaced.
+
+    Args:
+        save_dir: Directory for logs/lovetimer.log (None = console only).
+        debug: Lower the default level to DEBUG and show access logs.
+        console: Also write to stderr.
+
+    Returns:
+        The running QueueListener.
+    """
+    global _listener
+
+    handlers = []
+    formatter = logging.Formatter(LOG_FORMAT)
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+
+    log_file = None
+    if save_dir is not None:
+        try:
+            log_dir = Path(save_dir) / LOG_DIR_NAME
+            log_dir.mkdir(parents=True, exist_ok=True)
+            log_file = log_dir / LOG_FILE_NAME
+            file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES,
+                                               backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            log_file = None
+            logging.getLogger(__name__).warning("File logging disabled: %s", e)
+
+    shutdown_logging()
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    apply_levels({"": logging.DEBUG if debug else DEFAULT_LEVEL})
+    apply_levels({name: logging.NOTSET for name in DEFAULT_LOGGER_LEVELS} if debug else DEFAULT_LOGGER_LEVELS)
+    apply_levels(_env_levels())
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    logging.getLogger(__name__).info("Logging configured (file: %s, levels: %s)", log_file, _configured_levels)
+    return _listener
+
+
+def shutdown_logging():
+    """Drains the queue and stops the writer thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
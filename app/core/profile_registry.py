@@ -0,0 +1,274 @@
+"""
+Profile Registry for the Relationship Countdown Timer.
+
+Keeps one ConfigManager/CalendarLog pair per named profile, each bound to
+its own directory under `<save_dir>/profiles/<name>/`. Profiles are created
+explicitly (create()), loaded lazily on first access and evicted
+least-recently-used first once more than `max_loaded` are resident; unsaved
+state is flushed to disk on eviction.
+"""
+
+import re
+import atexit
+import logging
+import threading
+import contextlib
+from pathlib import Path
+from collections import OrderedDict
+from typing import Optional, List, Dict, Iterator
+
+from .config_manager import ConfigManager
+from .calendar_log import CalendarLog
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+
+DEFAULT_MAX_LOADED_PROFILES = 8
+PROFILE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$")
+
+# --- Profile ---
+
+class Profile:
+    """A loaded profile: its managers, the number of requests using it and
+    the number of eviction flushes still running for it."""
+    __slots__ = ("name", "config_manager", "calendar_log", "in_use", "pending_flushes")
+
+    def __init__(self, name: str, config_manager: ConfigManager, calendar_log: CalendarLog):
+        self.name = name
+        self.config_manager = config_manager
+        self.calendar_log = calendar_log
+        self.in_use = 0
+        self.pending_flushes = 0
+
+    def flush(self) -> bool:
+        """Write any unsaved config/log state to disk.
+
+        Returns:
+            True if nothing is left unsaved.
+        """
+        config_ok = self.config_manager.flush()
+        log_ok = self.calendar_log.flush()
+        return config_ok and log_ok
+
+# --- Profile Registry ---
+
+class ProfileRegistry:
+    """Lazily loads profiles and keeps at most `max_loaded` of them in memory."""
+
+    def __init__(self, profiles_dir: Optional[Path] = None,
+                 max_loaded: int = DEFAULT_MAX_LOADED_PROFILES):
+        """Initialize the ProfileRegistry.
+
+        Args:
+            profiles_dir: Directory containing one sub-directory per profile (optional).
+            max_loaded: Maximum number of idle profiles kept in memory.
+        """
+        self.profiles_dir: Optional[Path] = profiles_dir
+        self.max_loaded: int = max_loaded
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._lock = threading.RLock()
+        # One lock per profile being loaded: the files are read outside _lock,
+        # and concurrent requests for the same new profile load it only once
+        self._load_locks: Dict[str, threading.Lock] = {}
+        # Evicted profiles whose flush has not finished yet. They are flushed
+        # outside _lock; a request for one of them takes it back instead of
+        # reading files that may not hold its latest state yet
+        self._evicting: Dict[str, Profile] = {}
+        self._atexit_registered = False
+
+    def init_app(self, profiles_dir: Path, max_loaded: int = DEFAULT_MAX_LOADED_PROFILES):
+        """Set the profiles directory and cache size after instantiation.
+
+        Raises:
+            TypeError: If profiles_dir is not a Path object.
+            ValueError: If max_loaded is less than 1.
+        """
+        if not isinstance(profiles_dir, Path):
+            raise TypeError("profiles_dir must be a pathlib.Path object")
+        if max_loaded < 1:
+            raise ValueError("max_loaded must be at least 1")
+
+        self.flush_all()
+        with self._lock:
+            self._profiles.clear()
+            self._evicting.clear()
+            self.profiles_dir = profiles_dir
+            self.max_loaded = max_loaded
+
+        if not self._atexit_registered:
+            atexit.register(self.flush_all)
+            self._atexit_registered = True
+        logger.info(f"Profiles directory set to: {self.profiles_dir} (max loaded: {self.max_loaded})")
+
+    @staticmethod
+    def is_valid_name(name: str) -> bool:
+        """Check that a profile name is safe to use as a directory name."""
+        return bool(name) and PROFILE_NAME_PATTERN.match(name) is not None
+
+    def _profile_dir(self, name: str) -> Path:
+        """Directory of a profile.
+
+        Raises:
+            ValueError: If the registry is not initialized or the name is invalid.
+        """
+        if not self.profiles_dir:
+            raise ValueError("Profiles directory not set.")
+        if not self.is_valid_name(name):
+            raise ValueError(f"Invalid profile name: {name!r}")
+        return self.profiles_dir / name
+
+    def exists(self, name: str) -> bool:
+        """Check that a profile has been created (invalid names never exist)."""
+        try:
+            return self._profile_dir(name).is_dir()
+        except ValueError:
+            return False
+
+    def create(self, name: str):
+        """Create a profile's directory so that it can be acquired.
+
+        Its files are written with defaults on first access. Creating an
+        existing profile does nothing.
+
+        Raises:
+            ValueError: If the registry is not initialized or the name is invalid.
+        """
+        profile_dir = self._profile_dir(name)
+        if not profile_dir.is_dir():
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Profile '{name}' created in {profile_dir}")
+
+    def _load(self, name: str) -> Profile:
+        """Create managers for a profile and load (or create) its files."""
+        profile_dir = self.profiles_dir / name
+
+        config_manager = ConfigManager(profile_dir / "config.json")
+        calendar_log = CalendarLog(profile_dir / "calendar_log.json")
+        config_manager.load_or_create_defaults()
+        calendar_log.load_or_create()
+
+        logger.info(f"Profile '{name}' loaded from {profile_dir}")
+        return Profile(name, config_manager, calendar_log)
+
+    def _evict_idle(self) -> List[Profile]:
+        """Take least-recently-used idle profiles out until the cap is respected.
+
+        Profiles still held by a request are skipped, so the cap may be
+        exceeded temporarily under load. The caller holds _lock and must
+        pass the result to _flush_evicted() once it has released it.
+
+        Returns:
+            The profiles taken out.
+        """
+        evicted: List[Profile] = []
+        overflow = len(self._profiles) - self.max_loaded
+        for name in list(self._profiles.keys()):
+            if overflow <= 0:
+                break
+            profile = self._profiles[name]
+            if profile.in_use > 0:
+                continue
+            del self._profiles[name]
+            self._evicting[name] = profile
+            profile.pending_flushes += 1
+            evicted.append(profile)
+            overflow -= 1
+        return evicted
+
+    def _flush_evicted(self, evicted: List[Profile]):
+        """Write evicted profiles to disk without holding _lock.
+
+        A profile that cannot be flushed is put back as the next candidate
+        for eviction, so its unsaved state stays in memory.
+        """
+        for profile in evicted:
+            flushed = profile.flush()
+            with self._lock:
+                profile.pending_flushes -= 1
+                if profile.pending_flushes or self._evicting.get(profile.name) is not profile:
+                    continue  # Taken back by a request, or evicted again and still flushing
+                del self._evicting[profile.name]
+                if flushed:
+                    logger.info(f"Profile '{profile.name}' evicted from memory.")
+                else:
+                    logger.error(f"Profile '{profile.name}' could not be flushed; keeping it loaded.")
+                    self._profiles[profile.name] = profile
+                    self._profiles.move_to_end(profile.name, last=False)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold _lock, evict down to the cap, then flush the evicted profiles after releasing it."""
+        with self._lock:
+            yield
+            evicted = self._evict_idle()
+        self._flush_evicted(evicted)
+
+    def acquire(self, name: str) -> Profile:
+        """Return a loaded profile and mark it as in use.
+
+        Every call must be paired with release(). Only profiles that exist
+        on disk (see create()) are loaded; nothing is created here.
+
+        Raises:
+            ValueError: If the registry is not initialized or the name is invalid.
+            KeyError: If the profile does not exist.
+        """
+        profile_dir = self._profile_dir(name)
+
+        with self._locked():
+            profile = self._checkout(name)
+        if profile is not None:
+            return profile
+        if not profile_dir.is_dir():
+            raise KeyError(name)
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+
+        # Disk I/O happens outside the registry lock so other profiles stay available
+        with load_lock:
+            with self._locked():
+                profile = self._checkout(name)  # Loaded by another request while we waited
+            if profile is not None:
+                return profile
+            loaded = self._load(name)
+
+            with self._locked():
+                if self._load_locks.get(name) is load_lock:
+                    del self._load_locks[name]
+                profile = self._checkout(name)
+                if profile is None:
+                    self._profiles[name] = loaded
+                    profile = self._checkout(name)
+                return profile
+
+    def _checkout(self, name: str) -> Optional[Profile]:
+        """Mark a resident profile as used and most recent (caller holds _lock)."""
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._evicting.pop(name, None)  # Still being flushed: take it back
+            if profile is None:
+                return None
+            self._profiles[name] = profile
+        self._profiles.move_to_end(name)
+        profile.in_use += 1
+        return profile
+
+    def release(self, profile: Profile):
+        """Mark a profile as no longer used by the caller."""
+        with self._locked():
+            profile.in_use = max(0, profile.in_use - 1)
+
+    def loaded_names(self) -> List[str]:
+        """Names of resident profiles, least-recently-used first."""
+        with self._lock:
+            return list(self._profiles.keys())
+
+    def flush_all(self):
+        """Write unsaved state of every loaded profile to disk."""
+        with self._lock:
+            for profile in self._profiles.values():
+                if not profile.flush():
+                    logger.error(f"Profile '{profile.name}' has unsaved changes after flush.")
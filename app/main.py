@@ -4,7 +4,12 @@ Blueprint for serving the main HTML pages of the application.
 """
 
 import logging
-from flask import Blueprint, render_template, Response, current_app
+from flask import Blueprint, render_template, Response, abort
+
+from . import profile_registry
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
 
 # Create a Blueprint named 'main'
 main_bp = Blueprint('main', __name__)
@@ -18,7 +23,25 @@ def index() -> Response | str:
         Flask Response containing the rendered 'index.html'.
     """
     try:
-        return render_template('index.html')
+        return render_template('index.html', api_base='/api')
+    except Exception as e:
+        logger.error("Rendering error in main/index: %s", e, exc_info=True)
+        return f"<h1>Interface Load Error</h1><p>{e}</p>", 500
+
+
+@main_bp.route('/p/<profile>/')
+def profile_index(profile: str) -> Response | str:
+    """
+    Renders the SPA for a named profile.
+    The page talks to the profile-scoped API under /api/p/<profile>.
+
+    Returns:
+        Flask Response containing the rendered 'index.html', or 404 for unknown profiles.
+    """
+    if not profile_registry.exists(profile):
+        abort(404)
+    try:
+        return render_template('index.html', api_base=f'/api/p/{profile}')
     except Exception as e:
-        current_app.logger.error(f"Rendering error in main/index: {e}", exc_info=True)
+        logger.error("Rendering error in main/profile_index: %s", e, exc_info=True)
         return f"<h1>Interface Load Error</h1><p>{e}</p>", 500
\ No newline at end of file
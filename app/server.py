@@ -0,0 +1,102 @@
+"""
+Pooled WSGI server for headless mode.
+
+Serves the Flask app without pywebview so several browsers can use one
+instance. Connections are handled by a fixed pool of worker threads
+instead of one new thread per connection.
+"""
+
+import logging
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_THREADS = 8
+SOCKET_TIMEOUT_S = 5      # A client that stalls while sending its request releases the worker after this
+LISTEN_BACKLOG = 128
+
+
+class PooledRequestHandler(WSGIRequestHandler):
+    """Request handler with a socket timeout.
+
+    Werkzeug answers every request with "Connection: close", so each
+    connection carries one request and holds a worker only while it is
+    being served.
+    """
+    timeout = SOCKET_TIMEOUT_S
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug server that dispatches accepted connections to a thread pool."""
+
+    multithread = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, host: str, port: int, app: Flask, threads: int = DEFAULT_THREADS):
+        """Bind the server and create the worker pool.
+
+        Args:
+            host: Interface to bind (e.g. "0.0.0.0" to accept remote clients).
+            port: TCP port to bind (0 picks a free port).
+            app: WSGI application to serve.
+            threads: Number of worker threads.
+
+        Raises:
+            ValueError: If threads is less than 1.
+        """
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        super().__init__(host, port, app, handler=PooledRequestHandler)
+        self.threads = threads
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="http-worker")
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a pool worker instead of handling it inline."""
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        """Serve the connection's request, then close it."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Stop accepting connections and wait for in-flight requests."""
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def serve(app: Flask, host: Optional[str] = None, port: Optional[int] = None,
+          threads: Optional[int] = None):
+    """Serve the app until interrupted (Ctrl+C).
+
+    Args:
+        app: Flask application created by create_app().
+        host: Interface to bind (None = DEFAULT_HOST).
+        port: TCP port to bind (None = DEFAULT_PORT).
+        threads: Number of worker threads (None = DEFAULT_THREADS).
+    """
+    host = DEFAULT_HOST if host is None else host
+    port = DEFAULT_PORT if port is None else port
+    threads = DEFAULT_THREADS if threads is None else threads
+    server = PooledWSGIServer(host, port, app, threads=threads)
+    logger.info("Serving on http://%s:%s with %s worker threads. Press Ctrl+C to stop.",
+                host, server.server_port, threads)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
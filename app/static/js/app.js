@@ -10,8 +10,13 @@
    ========================================================================== */
 
 const AudioManager = {
-    sounds: {},      // Store for { soundId: new Howl(...) }
-    soundsCache: {}, // Cache for categories { categoryName: [Howl, Howl] }
+    manifest: {},      // { categoryName: [filePath, ...] } from /api/audio_manifest
+    sounds: {},        // Loaded (or loading) sounds { soundId: Howl }; evicted sounds are recreated on demand
+    voices: {},        // Started (or queued) plays per category, oldest first { categoryName: [{ sound, playId }] }
+    lastUsed: {},      // { soundId: timestamp } for LRU eviction
+    decodedBytes: {},  // { soundId: estimated decoded size }
+    totalDecodedBytes: 0,
+    idleQueue: [],     // Categories waiting to be preloaded when the browser is idle
 
     // Audio Constants
     SOUND_MAX_VOLUME: 0.8,      // Target volume (0.0 - 1.0)
@@ -20,8 +25,21 @@ const AudioManager = {
     CLICK_FADE_IN_MS: 10,       // Anti-click fade-in duration
     CLICK_FADE_OUT_MS: 50,      // Smooth fade-out duration
 
+    // Loading Constants
+    PRIORITY_CATEGORIES: ['Heartbeat', 'switchPage'], // Loaded at startup and never evicted
+    DECODED_BUDGET_BYTES: 64 * 1024 * 1024,           // Estimated decoded PCM kept in memory
+    DECODED_BYTES_PER_SECOND: 48000 * 2 * 4,          // 48 kHz, stereo, float32
+    IDLE_TIMEOUT_MS: 2000,                            // requestIdleCallback deadline
+
+    // Polyphony: simultaneous voices per category (the oldest voice is stolen)
+    MAX_VOICES_DEFAULT: 4,
+    MAX_VOICES: { Heartbeat: 1, switchPage: 2, Wheel: 3, WheelBoost: 2, WheelEnd: 1, WheelStop: 1 },
+    VOICE_STEAL_FADE_MS: 30,    // Fade-out for a stolen voice (avoids clicks)
+
     /**
      * Initializes the audio system. Called after audioManifest is loaded.
+     * Only the priority categories are fetched now; the rest load on first
+     * use or when the browser is idle.
      * @param {object} manifest - The audio manifest from the store.
      */
     init(manifest) {
@@ -35,41 +53,180 @@ const AudioManager = {
             return;
         }
 
+        this.manifest = manifest;
         try {
-            // 1. Create Howl objects
-            for (const category in manifest) {
-                if (!manifest[category] || manifest[category].length === 0) continue;
-
-                manifest[category].forEach((filePath, index) => {
-                    const soundId = `${category}_${index}`;
-                    this.sounds[soundId] = new Howl({
-                        src: [filePath],
-                        volume: 0, // Start silent
-                        loop: (category === 'Heartbeat')
-                    });
-                });
-            }
-
-            // 2. Cache sounds by category
-            this.soundsCache = {};
-            for (const soundId in this.sounds) {
-                const category = soundId.split('_')[0];
-                if (!this.soundsCache[category]) {
-                    this.soundsCache[category] = [];
-                }
-                this.soundsCache[category].push(this.sounds[soundId]);
-            }
+            this.PRIORITY_CATEGORIES.forEach(category => this.loadCategory(category));
+            this.idleQueue = Object.keys(manifest).filter(category => !this.PRIORITY_CATEGORIES.includes(category));
+            this._scheduleIdleLoad();
         } catch (error) {
             console.error("[AudioManager] Critical error loading sounds:", error);
         }
     },
 
+    // --- Loading & Budget ---
+
+    /**
+     * Creates (and starts loading) every sound of a category that is not loaded yet.
+     * @param {string} category
+     */
+    loadCategory(category) {
+        const files = this.manifest[category] || [];
+        files.forEach((_, index) => this._getSound(category, index));
+    },
+
+    /**
+     * Returns the Howl for manifest[category][index], creating it if needed.
+     * Howler queues play() calls until the file has loaded.
+     * @private
+     */
+    _getSound(category, index) {
+        const soundId = `${category}_${index}`;
+        let sound = this.sounds[soundId];
+        if (!sound) {
+            const filePath = (this.manifest[category] || [])[index];
+            if (!filePath) return null;
+            sound = new Howl({
+                src: [filePath],
+                volume: 0, // Start silent
+                loop: (category === 'Heartbeat')
+            });
+            sound.once('loaderror', () => this._releaseSound(sound));
+            sound.once('load', () => {
+                if (this.sounds[soundId] !== sound) return; // Evicted while loading
+                this.decodedBytes[soundId] = Math.ceil(sound.duration() * this.DECODED_BYTES_PER_SECOND);
+                this.totalDecodedBytes += this.decodedBytes[soundId];
+                this._enforceBudget();
+            });
+            this.sounds[soundId] = sound;
+        }
+        this.lastUsed[soundId] = performance.now();
+        return sound;
+    },
+
+    /**
+     * Unloads least recently used sounds until the decoded size fits the budget.
+     * Priority categories and sounds that are currently playing are kept.
+     * @private
+     */
+    _enforceBudget() {
+        if (this.totalDecodedBytes <= this.DECODED_BUDGET_BYTES) return;
+
+        const candidates = Object.keys(this.decodedBytes)
+            .filter(soundId => !this.PRIORITY_CATEGORIES.includes(soundId.split('_')[0]))
+            .sort((a, b) => (this.lastUsed[a] || 0) - (this.lastUsed[b] || 0));
+
+        for (const soundId of candidates) {
+            if (this.totalDecodedBytes <= this.DECODED_BUDGET_BYTES) break;
+            const sound = this.sounds[soundId];
+            if (sound && (sound.playing() || this._hasVoices(sound))) continue;
+            this._unload(soundId);
+        }
+    },
+
+    /** @private */
+    _unload(soundId) {
+        const sound = this.sounds[soundId];
+        if (sound) {
+            this._releaseSound(sound);
+            sound.unload(); // Also drops Howler's decoded buffer cache entry
+        }
+        this.totalDecodedBytes -= this.decodedBytes[soundId] || 0;
+        delete this.sounds[soundId];
+        delete this.decodedBytes[soundId];
+        delete this.lastUsed[soundId];
+    },
+
+    /**
+     * Preloads one queued category per idle period while under budget.
+     * @private
+     */
+    _scheduleIdleLoad() {
+        if (this.idleQueue.length === 0) return;
+        const runWhenIdle = window.requestIdleCallback
+            ? (callback) => window.requestIdleCallback(callback, { timeout: this.IDLE_TIMEOUT_MS })
+            : (callback) => setTimeout(callback, this.IDLE_TIMEOUT_MS);
+
+        runWhenIdle(() => {
+            if (this.totalDecodedBytes >= this.DECODED_BUDGET_BYTES) {
+                this.idleQueue = []; // Remaining categories load on first use
+                return;
+            }
+            const category = this.idleQueue.shift();
+            if (category) this.loadCategory(category);
+            this._scheduleIdleLoad();
+        });
+    },
+
+    // --- Voices ---
+
+    /**
+     * Registers a new voice, stealing the oldest one if the category is at its limit.
+     * Voices are tracked from play() until their 'end'/'stop' event, so plays
+     * still queued while the file loads count towards the limit too.
+     * @private
+     */
+    _claimVoice(category, sound, playId) {
+        const limit = this.MAX_VOICES[category] || this.MAX_VOICES_DEFAULT;
+        const active = this.voices[category] || (this.voices[category] = []);
+
+        while (active.length >= limit) {
+            const oldest = active.shift();
+            this._fadeOutVoice(oldest);
+        }
+
+        const voice = { sound: sound, playId: playId };
+        active.push(voice);
+        const release = () => this._releaseVoice(category, voice);
+        sound.once('end', release, playId);
+        sound.once('stop', release, playId);
+    },
+
+    /** @private */
+    _releaseVoice(category, voice) {
+        const active = this.voices[category];
+        if (!active) return;
+        const position = active.indexOf(voice);
+        if (position !== -1) active.splice(position, 1);
+    },
+
+    /**
+     * Drops every voice of a sound (it failed to load or is being unloaded).
+     * @private
+     */
+    _releaseSound(sound) {
+        for (const category of Object.keys(this.voices)) {
+            this.voices[category] = this.voices[category].filter(voice => voice.sound !== sound);
+        }
+    },
+
+    /** @private */
+    _hasVoices(sound) {
+        return Object.values(this.voices).some(active => active.some(voice => voice.sound === sound));
+    },
+
+    /**
+     * Stops a stolen voice after a short fade (it no longer counts towards the limit).
+     * @private
+     */
+    _fadeOutVoice(voice) {
+        const { sound, playId } = voice;
+        if (sound.state() === 'unloaded') return;
+        if (!sound.playing(playId)) {
+            sound.stop(playId); // Still queued: drop it before it starts
+            return;
+        }
+        sound.fade(sound.volume(playId), 0, this.VOICE_STEAL_FADE_MS, playId);
+        setTimeout(() => {
+            if (sound.state() !== 'unloaded') sound.stop(playId);
+        }, this.VOICE_STEAL_FADE_MS);
+    },
+
     /**
      * Starts the heartbeat sound with a fade-in.
      * @param {number} duration - Fade-in duration in ms.
      */
     playHeartbeat(duration) {
-        const sound = this.sounds['Heartbeat_0'];
+        const sound = this._getSound('Heartbeat', 0);
         if (!sound) return;
 
         if (sound.playing()) {
@@ -101,16 +258,24 @@ const AudioManager = {
 
     /**
      * Plays a random sound from a category with pitch variation.
+     * The category is loaded on first use; at most MAX_VOICES[category]
+     * clips of a category play at once.
      * @param {string} category - The sound category (e.g., 'switchPage').
      * @param {boolean} usePitch - Whether to apply random pitch shifting.
      */
     playRandom(category, usePitch = false) {
         if (typeof Alpine !== 'undefined' && !Alpine.store('app').config.effects_enabled) return;
 
-        const soundList = this.soundsCache[category];
-        if (!soundList || soundList.length === 0) return;
+        const files = this.manifest[category];
+        if (!files || files.length === 0) return;
 
-        const sound = soundList[Math.floor(Math.random() * soundList.length)];
+        const sound = this._getSound(category, Math.floor(Math.random() * files.length));
+        if (!sound) return;
+        // First use of this category: fetch its other variations in the background
+        if (this.idleQueue.includes(category)) {
+            this.idleQueue = this.idleQueue.filter(queued => queued !== category);
+            this.loadCategory(category);
+        }
 
         // Apply pitch
         if (usePitch) {
@@ -123,10 +288,12 @@ const AudioManager = {
         // Play with fade-in/out to avoid clicking artifacts
         sound.volume(0);
         const playId = sound.play();
+        this._claimVoice(category, sound, playId);
 
         sound.fade(0, this.SOUND_MAX_VOLUME, this.CLICK_FADE_IN_MS, playId);
 
         setTimeout(() => {
+            if (sound.state() === 'unloaded') return;
             sound.fade(this.SOUND_MAX_VOLUME, 0, this.CLICK_FADE_OUT_MS, playId);
         }, this.MAX_SOUND_DURATION_MS - this.CLICK_FADE_OUT_MS);
     }
@@ -166,6 +333,16 @@ function hexToRgb(hex) {
     return `${r}, ${g}, ${b}`;
 }
 
+/**
+ * Builds an API URL for the active profile.
+ * Profile pages (/p/<name>/) set window.API_BASE to '/api/p/<name>'.
+ * @param {string} path - Path relative to the API root (e.g., "/config").
+ * @returns {string} - The absolute API URL.
+ */
+function apiUrl(path) {
+    return `${window.API_BASE || '/api'}${path}`;
+}
+
 /**
  * Safely accesses nested properties of an object.
  * @param {object} obj - The source object.
@@ -427,23 +604,16 @@ function wheelController() {
     return {
         // State
         options: [],
+        MAX_OPTIONS: 500,   // Keep in sync with MAX_WHEEL_OPTIONS in core/config_manager.py
         wheelData: {
             gradient: 'background-color: var(--color-accent-secondary)',
             textSectors: []
         },
 
-        // Physics State
-        angle: 0,
-        velocity: 0,
-        friction: 0.998,
+        // Physics (see wheel_engine.js)
+        angle: 0,           // Rendered angle, updated once per animation frame
         isSpinning: false,
-        animationFrameId: null,
-
-        // Physics Constants
-        MIN_VELOCITY: 0.05,
-        MAX_VELOCITY: 70,
-        FRICTION_FAST: 0.998,
-        FRICTION_SLOW: 0.99,
+        engine: null,
 
         particleList: [
             '👉', '👈', '🌚', '💕', '❤️', '🫦', '😶‍🌫️', '😍', '👍', '🤦‍♂️',
@@ -451,11 +621,23 @@ function wheelController() {
             '🦉', '👁️', '👀', '🧌', '🤷‍♂️', '🙆‍♂️', '🕺', '💃', '👃', '🤌'
         ],
 
-        previousAngle: 0,
-        boundaryAngles: [],
-
         // --- Initialization ---
         init() {
+            this.engine = new WheelEngine({
+                onSectorCross: () => this.triggerSectorCross(),
+                onStop: () => {
+                    this.isSpinning = false;
+                    this.triggerStopEffect();
+                },
+                onFrame: (angle) => { this.angle = angle; },
+                isActive: () => store.ui.currentPage === 'page-wheel'
+            });
+
+            // The engine sleeps off-page and in hidden tabs; resume a pending spin on return
+            Alpine.watch(() => store.ui.currentPage, () => this.engine.wake());
+            this.onVisibilityChange = () => this.engine.wake();
+            document.addEventListener('visibilitychange', this.onVisibilityChange);
+
             Alpine.nextTick(() => {
                 const storeConfig = Alpine.store('app').config;
                 if (storeConfig && storeConfig.wheel_options && storeConfig.wheel_options.length > 0) {
@@ -481,14 +663,16 @@ function wheelController() {
                     this.options = JSON.parse(JSON.stringify(newConfig.wheel_options || []));
                 }
             }, { deep: true });
+        },
 
-            this.update = this.update.bind(this);
-            this.update();
+        destroy() {
+            this.engine.sleep();
+            document.removeEventListener('visibilitychange', this.onVisibilityChange);
         },
 
         // --- Option Management ---
         addOption() {
-            if (this.options.length >= 30) return;
+            if (this.options.length >= this.MAX_OPTIONS) return;
             AudioManager.playRandom('PlusButtons', true);
             this.options.push({ id: crypto.randomUUID(), label: "New Option" });
         },
@@ -499,12 +683,7 @@ function wheelController() {
         },
 
         async saveToDefaults() {
-            const store = Alpine.store('app');
-            if (!store.form) return;
-
-            store.form.wheel_options = JSON.parse(JSON.stringify(this.options));
-            store.markDirty();
-            const success = await store.saveSettings(store.form, false);
+            const success = await Alpine.store('app').saveWheelOptions(this.options);
 
             if (typeof spawnParticles === 'function' && this.$refs.saveButton) {
                 const symbol = success ? '✅' : '❌';
@@ -518,74 +697,29 @@ function wheelController() {
 
         // --- Physics & Animation ---
         spin() {
-            if (this.isSpinning) {
-                // "Boost" logic if already spinning
-                this.friction = Math.random() * (this.FRICTION_FAST - this.FRICTION_SLOW) + this.FRICTION_SLOW;
-                let boost;
-
-                if (this.velocity > 30) boost = (Math.random() * 2.5) + 2.5;
-                else if (this.velocity > 15) boost = (Math.random() * 5) + 5;
-                else boost = (Math.random() * 7.5) + 10;
-
-                this.velocity += boost;
-
-                let particleCount = 0;
-                if (this.velocity > 30) particleCount = 6;
-                else if (this.velocity > 20) particleCount = 4;
-                else if (this.velocity > 10) particleCount = 2;
-                else if (this.velocity > 0) particleCount = 1;
-
-                AudioManager.playRandom('WheelBoost', true);
-                if (particleCount > 0 && typeof spawnParticles === 'function' && this.$refs.spinButton) {
-                    spawnParticles({
-                        originElement: this.$refs.spinButton,
-                        symbol: '🔥',
-                        count: particleCount, spread: 360, distance: 250, duration: 5000
-                    });
-                }
-            } else {
-                // Initial Spin
-                this.friction = Math.random() * (this.FRICTION_FAST - this.FRICTION_SLOW) + this.FRICTION_SLOW;
-                this.velocity = (Math.random() * 50) + 30;
-                this.isSpinning = true;
-            }
-
-            if (this.velocity > this.MAX_VELOCITY) {
-                this.velocity = this.MAX_VELOCITY;
+            const result = this.engine.spin();
+            this.isSpinning = true;
+            if (!result.boosted) return;
+
+            let particleCount = 0;
+            if (result.velocity > 30) particleCount = 6;
+            else if (result.velocity > 20) particleCount = 4;
+            else if (result.velocity > 10) particleCount = 2;
+            else if (result.velocity > 0) particleCount = 1;
+
+            AudioManager.playRandom('WheelBoost', true);
+            if (particleCount > 0 && typeof spawnParticles === 'function' && this.$refs.spinButton) {
+                spawnParticles({
+                    originElement: this.$refs.spinButton,
+                    symbol: '🔥',
+                    count: particleCount, spread: 360, distance: 250, duration: 5000
+                });
             }
         },
 
         stopSpin() {
-            if (!this.isSpinning) return;
+            if (!this.engine.brake()) return;
             AudioManager.playRandom('WheelStop', true);
-            this.velocity = Math.min(this.velocity, 1);
-            this.friction = 0.95; // High friction to stop quickly
-        },
-
-        update() {
-            if (this.velocity > this.MIN_VELOCITY) {
-                this.isSpinning = true;
-                this.velocity *= this.friction;
-                this.angle += this.velocity;
-                this.angle %= 360;
-
-                // Check boundary crossings for clicking sound
-                if (this.angle < this.previousAngle) {
-                    this.triggerSectorCross();
-                }
-                for (const boundary of this.boundaryAngles) {
-                    if (this.previousAngle < boundary && this.angle >= boundary) {
-                        this.triggerSectorCross();
-                    }
-                }
-            } else if (this.isSpinning) {
-                this.isSpinning = false;
-                this.velocity = 0;
-                this.triggerStopEffect();
-            }
-
-            this.previousAngle = this.angle;
-            this.animationFrameId = requestAnimationFrame(this.update);
         },
 
         triggerSectorCross() {
@@ -629,7 +763,6 @@ function wheelController() {
 
             let gradientString = 'conic-gradient(';
             let textSectors = [];
-            let newBoundaryAngles = [];
             const textRadiusPercent = 25;
             const angleOffsetRad = -Math.PI / 2;
 
@@ -647,8 +780,6 @@ function wheelController() {
                 gradientString += `${color} ${startAngle}deg ${endAngle}deg`;
                 if (i < total - 1) gradientString += ', ';
 
-                if (startAngle > 0) newBoundaryAngles.push(startAngle);
-
                 const textAngleDeg = startAngle + (segmentAngle / 2);
                 const textAngleRad = (textAngleDeg * Math.PI / 180) + angleOffsetRad;
                 const x = 50 + (textRadiusPercent * Math.cos(textAngleRad));
@@ -666,20 +797,245 @@ function wheelController() {
 
             gradientString += ')';
             this.wheelData = { gradient: gradientString, textSectors: textSectors };
-            this.boundaryAngles = newBoundaryAngles;
+            this.engine.setSectorCount(total);
+        }
+    };
+}
+
+/* ==========================================================================
+   5. Alpine Component: Calendar View (windowed month rendering)
+   ========================================================================== */
+
+/**
+ * Renders only the months in or near the viewport. Every month keeps a
+ * lightweight slot element; off-screen slots are empty boxes sized to the
+ * month's last measured height so the scroll height stays exact.
+ */
+function calendarView() {
+    const slots = new Map();   // monthKey -> observed slot element (kept out of Alpine's reactivity)
+
+    return {
+        // State
+        visible: {},        // { monthKey: true } for months that currently have DOM nodes
+        heights: {},        // { monthKey: px } measured while rendered
+        slotHeight: 0,      // Last measured month height (fallback for never-rendered months)
+        hasScrolledToToday: false,
+
+        // Constants
+        PRELOAD_MARGIN_PX: 800, // Render months this far outside the viewport
+
+        intersectionObserver: null,
+        resizeObserver: null,
+
+        init() {
+            const root = document.querySelector('.app-main');
+
+            this.intersectionObserver = new IntersectionObserver((entries) => {
+                for (const entry of entries) {
+                    const key = entry.target.dataset.monthKey;
+                    if (!key) continue;
+                    if (entry.isIntersecting) {
+                        this.visible[key] = true;
+                    } else if (this.visible[key]) {
+                        delete this.visible[key];
+                    }
+                }
+            }, { root: root, rootMargin: `${this.PRELOAD_MARGIN_PX}px 0px` });
+
+            // Slots are stable elements; while a month is rendered its slot takes the month's size
+            this.resizeObserver = new ResizeObserver((entries) => {
+                for (const entry of entries) {
+                    const key = entry.target.dataset.monthKey;
+                    const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.offsetHeight;
+                    if (!key || !height || !this.visible[key]) continue;
+                    this.heights[key] = height;
+                    this.slotHeight = height;
+                }
+            });
+
+            // Slots of months that left the date range are removed by x-for: stop observing them
+            this.$watch('$store.app.calendarMonths', () => Alpine.nextTick(() => this.pruneSlots()));
+
+            // Zoom changes every month's size: forget stale measurements
+            window.addEventListener('calendar-zoom', () => {
+                this.heights = {};
+                this.slotHeight = 0;
+            });
+
+            // Jump to the current month the first time the calendar is opened
+            Alpine.effect(() => {
+                if (Alpine.store('app').ui.currentPage === 'page-calendar' && !this.hasScrolledToToday) {
+                    this.hasScrolledToToday = true;
+                    Alpine.nextTick(() => this.scrollToToday());
+                }
+            });
+        },
+
+        destroy() {
+            this.intersectionObserver?.disconnect();
+            this.resizeObserver?.disconnect();
+            slots.clear();
+        },
+
+        /** Registers a month slot (x-init on each slot). */
+        observeSlot(el) {
+            const previous = slots.get(el.dataset.monthKey);
+            if (previous && previous !== el) {
+                this.intersectionObserver?.unobserve(previous);
+                this.resizeObserver?.unobserve(previous);
+            }
+            slots.set(el.dataset.monthKey, el);
+            this.intersectionObserver?.observe(el);
+            this.resizeObserver?.observe(el);
+        },
+
+        /** Unobserves slots no longer in the document and drops their visibility/height entries. */
+        pruneSlots() {
+            for (const [key, el] of slots) {
+                if (el.isConnected) continue;
+                this.intersectionObserver?.unobserve(el);
+                this.resizeObserver?.unobserve(el);
+                slots.delete(key);
+                delete this.visible[key];
+                delete this.heights[key];
+            }
+        },
+
+        isVisible(monthKey) {
+            return this.visible[monthKey] === true;
+        },
+
+        /** Inline style for an off-screen slot (CSS min-height covers never-measured months). */
+        placeholderStyle(monthKey) {
+            if (this.isVisible(monthKey)) return {};
+            const height = this.heights[monthKey] || this.slotHeight;
+            return height ? { height: `${height}px`, minHeight: '0' } : {};
+        },
+
+        /**
+         * Scrolls to the month containing today (or the nearest month in range).
+         * Works for unrendered months because their slots always exist.
+         */
+        scrollToToday() {
+            const months = Alpine.store('app').calendarMonths;
+            if (!months || months.length === 0) return;
+
+            const today = new Date();
+            const todayKey = `${today.getFullYear()}-${today.getMonth()}`;
+            let target = months.find(month => month.key === todayKey);
+            if (!target) {
+                const todayIndex = today.getFullYear() * 12 + today.getMonth();
+                const first = months[0];
+                target = (first.year * 12 + first.month > todayIndex) ? first : months[months.length - 1];
+            }
+
+            const slot = this.$el.querySelector(`.month-slot[data-month-key="${target.key}"]`);
+            if (slot) slot.scrollIntoView({ block: 'start' });
         }
     };
 }
 
 /* ==========================================================================
-   5. Alpine Component: Ticker
+   6. Alpine Component: Windowed List
+   ========================================================================== */
+
+/**
+ * Renders only the rows of a long list that are inside (or near) its
+ * scroll container. The container gets x-data="windowedList(() => items)",
+ * loops over `windowItems` and binds `windowStyle`; rows carry a
+ * data-window-row attribute so their height (plus gap) can be measured.
+ * Skipped rows are replaced by top/bottom padding of the same height.
+ * @param {() => Array} getItems - Returns the full (reactive) item array.
+ * @param {object} [options]
+ * @param {number} [options.rowHeight=60] - Row pitch to assume until rows are measured.
+ * @param {number} [options.overscan=6] - Extra rows rendered above and below the viewport.
+ */
+function windowedList(getItems, options = {}) {
+    return {
+        // State
+        scrollTop: 0,
+        viewportHeight: 0,
+        rowPitch: options.rowHeight || 60,  // Row height + gap, in px
+
+        // Constants
+        OVERSCAN_ROWS: options.overscan ?? 6,
+
+        resizeObserver: null,
+
+        init() {
+            this.viewportHeight = this.$el.clientHeight;
+            this.$el.addEventListener('scroll', () => {
+                this.scrollTop = this.$el.scrollTop;
+            }, { passive: true });
+
+            this.resizeObserver = new ResizeObserver(() => {
+                this.viewportHeight = this.$el.clientHeight;
+                this.measureRows();
+            });
+            this.resizeObserver.observe(this.$el);
+
+            // New items are appended: scroll them into view
+            Alpine.watch(() => this.allItems().length, (length, previousLength) => {
+                Alpine.nextTick(() => {
+                    this.measureRows();
+                    if (length > previousLength) this.$el.scrollTop = this.$el.scrollHeight;
+                });
+            });
+
+            Alpine.nextTick(() => this.measureRows());
+        },
+
+        destroy() {
+            this.resizeObserver?.disconnect();
+        },
+
+        allItems() {
+            return getItems() || [];
+        },
+
+        /** Updates rowPitch from the rendered rows (offset between two rows includes the gap). */
+        measureRows() {
+            const rows = this.$el.querySelectorAll(':scope > [data-window-row]');
+            let pitch = 0;
+            if (rows.length >= 2) pitch = rows[1].offsetTop - rows[0].offsetTop;
+            else if (rows.length === 1) pitch = rows[0].offsetHeight;
+            if (pitch > 0) this.rowPitch = pitch;
+        },
+
+        get windowStart() {
+            const first = Math.floor(this.scrollTop / this.rowPitch) - this.OVERSCAN_ROWS;
+            return Math.max(0, Math.min(first, this.allItems().length - 1));
+        },
+
+        get windowEnd() {
+            const rowsInView = Math.ceil(this.viewportHeight / this.rowPitch);
+            return Math.min(this.allItems().length, this.windowStart + rowsInView + 2 * this.OVERSCAN_ROWS);
+        },
+
+        /** The rows to render. */
+        get windowItems() {
+            return this.allItems().slice(this.windowStart, this.windowEnd);
+        },
+
+        /** Padding that stands in for the rows outside the window. */
+        get windowStyle() {
+            const hiddenBelow = this.allItems().length - this.windowEnd;
+            return {
+                paddingTop: `${this.windowStart * this.rowPitch}px`,
+                paddingBottom: `${hiddenBelow * this.rowPitch}px`
+            };
+        }
+    };
+}
+
+/* ==========================================================================
+   7. Alpine Component: Ticker
    ========================================================================== */
 
 function alpineTicker(elementId, getTargetDate, getMode, getCompletedMsg) {
     return {
         element: null,
-        intervalId: null,
-        previousTimeString: '--:--:--:--',
+        ticker: null,
 
         get targetDate() { return new Date(getTargetDate()); },
         get mode() { return getMode(); },
@@ -690,100 +1046,54 @@ function alpineTicker(elementId, getTargetDate, getMode, getCompletedMsg) {
                 this.element = document.getElementById(elementId);
                 if (!this.element) return;
 
-                // Initialize spans
-                this.element.innerHTML = this.previousTimeString.split('')
-                    .map((char, i) => `<span class="digit-char digit-${i}">${char}</span>`)
-                    .join('');
-
                 // Watch for changes
                 Alpine.watch(() => [this.targetDate, this.mode, this.completedMessage], () => {
-                    this.stop();
-                    if (this.targetDate && !isNaN(this.targetDate.getTime())) {
-                        this.start();
-                    }
+                    this.restart();
                 });
 
-                if (this.targetDate && !isNaN(this.targetDate.getTime())) {
-                    this.start();
-                }
+                this.restart();
             });
         },
 
-        start() {
-            if (this.intervalId) return;
-            this.update();
-            this.intervalId = setInterval(() => this.update(), 1000);
+        /**
+         * Replaces the Ticker with one for the current date/mode.
+         * Ticks come from the shared TickScheduler (timer.js).
+         */
+        restart() {
+            this.stop();
+            if (!this.element || !this.targetDate || isNaN(this.targetDate.getTime())) return;
+            this.ticker = new Ticker(this.element, this.targetDate, this.mode, this.completedMessage, elementId);
+            this.ticker.start();
         },
 
         stop() {
-            clearInterval(this.intervalId);
-            this.intervalId = null;
-        },
-
-        update() {
-            if (!this.element) return;
-
-            const now = new Date();
-            let diffMs;
-
-            if (this.mode === 'countdown') {
-                diffMs = this.targetDate.getTime() - now.getTime();
-            } else {
-                diffMs = now.getTime() - this.targetDate.getTime();
-            }
-
-            if (this.mode === 'countdown' && diffMs < 0) {
-                this.element.innerHTML = this.completedMessage;
-                this.stop();
-                return;
+            if (this.ticker) {
+                this.ticker.stop();
+                this.ticker = null;
             }
+        },
 
-            const totalSeconds = Math.floor(Math.abs(diffMs) / 1000);
-            const days = Math.floor(totalSeconds / 86400);
-            const hours = Math.floor((totalSeconds % 86400) / 3600);
-            const minutes = Math.floor((totalSeconds % 3600) / 60);
-            const seconds = totalSeconds % 60;
-
-            const pad = (num) => (num < 10 ? '0' + num : num.toString());
-            const currentTimeString = `${pad(days)}:${pad(hours)}:${pad(minutes)}:${pad(seconds)}`;
-
-            if (currentTimeString !== this.previousTimeString) {
-                const spans = this.element.querySelectorAll('.digit-char');
-                const currentChars = currentTimeString.split('');
-
-                currentChars.forEach((newChar, index) => {
-                    const span = spans[index];
-                    if (span && newChar !== (this.previousTimeString[index] || '')) {
-                        span.textContent = newChar;
-
-                        const isMainTimer = (elementId === 'timer-arrival-display' || elementId === 'timer-relationship-display');
-                        const store = Alpine.store('app');
-
-                        if (isMainTimer && store?.config?.effects_enabled && store.ui.currentPage === 'page-main') {
-                            if (typeof spawnParticles === 'function') {
-                                spawnParticles({
-                                    originElement: span,
-                                    symbol: store.config.effect_particle_day || '💖',
-                                    count: 1, spread: 30, distance: 300, duration: 1200
-                                });
-                            }
-                        }
-                    }
-                });
-                this.previousTimeString = currentTimeString;
-            }
+        // Called by Alpine when the timer is removed (x-if / x-for)
+        destroy() {
+            this.stop();
         }
     };
 }
 
 /* ==========================================================================
-   6. Alpine Store: App
+   8. Alpine Store: App
    ========================================================================== */
 
+// Memoized result of the store's calendarMonths getter (kept outside the
+// reactive store so filling it during render does not trigger effects).
+const calendarMonthsCache = { key: null, months: [] };
+
 document.addEventListener('alpine:init', () => {
     Alpine.store('app', {
         config: null,
         log: null,
+        logVersion: null,   // Server calendar version this.log reflects (X-Calendar-Version)
+        isSyncingLog: false,
         lang: {},
         form: null,
         defaults: null,
@@ -803,10 +1113,10 @@ document.addEventListener('alpine:init', () => {
         async init() {
             try {
                 const [configRes, logRes, defaultsRes, audioRes] = await Promise.all([
-                    fetch('/api/config'),
-                    fetch('/api/calendar_log'),
-                    fetch('/api/config/defaults'),
-                    fetch('/api/audio_manifest')
+                    fetch(apiUrl('/config')),
+                    fetch(apiUrl('/calendar_log')),
+                    fetch(apiUrl('/config/defaults')),
+                    fetch(apiUrl('/audio_manifest'))
                 ]);
 
                 if (!configRes.ok) throw new Error(`API /api/config Error: ${configRes.status}`);
@@ -816,6 +1126,7 @@ document.addEventListener('alpine:init', () => {
 
                 this.config = await configRes.json();
                 this.log = await logRes.json();
+                this.logVersion = this.readLogVersion(logRes);
                 this.defaults = await defaultsRes.json();
                 this.audioManifest = await audioRes.json();
 
@@ -830,6 +1141,11 @@ document.addEventListener('alpine:init', () => {
                 this.applyDynamicStyles();
                 this.ui.isLoaded = true;
 
+                // Timers only live on the main page; the shared scheduler sleeps elsewhere
+                if (typeof TickScheduler !== 'undefined') {
+                    TickScheduler.setActivePredicate(() => this.ui.currentPage === 'page-main');
+                }
+
                 this.form = Alpine.reactive(JSON.parse(JSON.stringify(this.config)));
 
                 if (typeof resetCalendarZoom === 'function') resetCalendarZoom();
@@ -837,6 +1153,12 @@ document.addEventListener('alpine:init', () => {
 
                 if (AudioManager) AudioManager.init(this.audioManifest);
 
+                // Catch up on marks made in other windows while this one was hidden
+                document.addEventListener('visibilitychange', () => {
+                    if (!document.hidden) this.syncCalendarLog();
+                });
+                window.addEventListener('focus', () => this.syncCalendarLog());
+
                 if (this.config.is_first_launch) {
                     Alpine.deferLoading = false;
                     Alpine.nextTick(() => {
@@ -859,10 +1181,11 @@ document.addEventListener('alpine:init', () => {
             if (!confirm(confirmText)) return;
 
             try {
-                const response = await fetch('/api/calendar/reset', { method: 'POST' });
+                const response = await fetch(apiUrl('/calendar/reset'), { method: 'POST' });
                 if (!response.ok) throw new Error('API Error');
 
                 this.log = await response.json();
+                this.logVersion = this.readLogVersion(response);
                 const successText = this.lang['settings_danger_reset_calendar_success'] || "Calendar reset!";
                 alert(successText);
             } catch (error) {
@@ -874,6 +1197,7 @@ document.addEventListener('alpine:init', () => {
             if (this.ui.currentPage === pageId) return;
             AudioManager.playRandom('switchPage', true);
             this.ui.currentPage = pageId;
+            if (typeof TickScheduler !== 'undefined') TickScheduler.refresh();
         },
 
         applyDynamicStyles() {
@@ -910,7 +1234,7 @@ document.addEventListener('alpine:init', () => {
             cell.style.opacity = '0.5';
 
             try {
-                const response = await fetch('/api/calendar/toggle', {
+                const response = await fetch(apiUrl('/calendar/toggle'), {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify({ date: dateString })
@@ -925,6 +1249,13 @@ document.addEventListener('alpine:init', () => {
                     delete this.log.marked_dates[dateString];
                 }
 
+                // Someone else changed the log in between: pick up their changes too
+                if (this.logVersion !== null && result.version !== this.logVersion + 1) {
+                    this.syncCalendarLog();
+                } else {
+                    this.logVersion = result.version;
+                }
+
                 if (this.config.effects_enabled && result.status === 'added') {
                     if (typeof spawnParticles === 'function') {
                         spawnParticles({
@@ -942,6 +1273,49 @@ document.addEventListener('alpine:init', () => {
             }
         },
 
+        /**
+         * Applies calendar changes made since this.logVersion (other windows,
+         * devices, imports). Falls back to the full snapshot the server sends
+         * when its change history no longer reaches back that far.
+         */
+        async syncCalendarLog() {
+            if (!this.ui.isLoaded || this.logVersion === null || this.isSyncingLog) return;
+            this.isSyncingLog = true;
+
+            try {
+                const response = await fetch(apiUrl(`/calendar_log/changes?since=${this.logVersion}`));
+                if (!response.ok) throw new Error(`API Error: ${response.status}`);
+                const result = await response.json();
+
+                if (result.snapshot) {
+                    this.log = { marked_dates: result.marked_dates };
+                } else {
+                    // Per-date updates: only the affected calendar cells re-render
+                    for (const change of result.changes) {
+                        if (change.status === 'added') {
+                            this.log.marked_dates[change.date] = change.entry;
+                        } else {
+                            delete this.log.marked_dates[change.date];
+                        }
+                    }
+                }
+                this.logVersion = result.version;
+            } catch (error) {
+                console.error("[Store.syncCalendarLog] Error:", error);
+            } finally {
+                this.isSyncingLog = false;
+            }
+        },
+
+        /**
+         * @param {Response} response
+         * @returns {number | null} Calendar version from the X-Calendar-Version header.
+         */
+        readLogVersion(response) {
+            const version = parseInt(response.headers.get('X-Calendar-Version'), 10);
+            return isNaN(version) ? null : version;
+        },
+
         // --- Getters & Helpers ---
 
         getCustomTimerMode(dateString) {
@@ -964,6 +1338,14 @@ document.addEventListener('alpine:init', () => {
         get calendarMonths() {
             if (!this.config || !this.lang?.weekdays_short) return [];
 
+            const cacheKey = [
+                this.config.date_vova_departure,
+                this.config.date_vova_arrival,
+                this.config.language,
+                this.lang.weekdays_short.join(',')
+            ].join('|');
+            if (calendarMonthsCache.key === cacheKey) return calendarMonthsCache.months;
+
             try {
                 // Helper to parse ISO strings (YYYY-MM-DD...) into a Date object representing UTC Midnight.
                 const parseDateStrToUTCMidnight = (isoString) => {
@@ -979,23 +1361,24 @@ document.addEventListener('alpine:init', () => {
                 const departureDateUTC = parseDateStrToUTCMidnight(this.config.date_vova_departure);
                 const arrivalDateUTC = parseDateStrToUTCMidnight(this.config.date_vova_arrival);
 
-                if (!departureDateUTC || !arrivalDateUTC) return [];
-
-                // Calendar starts day AFTER departure
-                const startDateUTC = new Date(departureDateUTC.getTime() + 86400000);
-                const endDateUTC = arrivalDateUTC;
-
-                if (startDateUTC.getTime() > endDateUTC.getTime()) return [];
-
                 const months = [];
-                let currentDateUTC = new Date(Date.UTC(startDateUTC.getUTCFullYear(), startDateUTC.getUTCMonth(), 1));
-
-                while (currentDateUTC.getTime() <= endDateUTC.getTime()) {
-                    const year = currentDateUTC.getUTCFullYear();
-                    const month = currentDateUTC.getUTCMonth();
-                    months.push(this.generateMonthGrid(year, month, startDateUTC.getTime(), endDateUTC.getTime()));
-                    currentDateUTC.setUTCMonth(currentDateUTC.getUTCMonth() + 1);
+                if (departureDateUTC && arrivalDateUTC) {
+                    // Calendar starts day AFTER departure
+                    const startDateUTC = new Date(departureDateUTC.getTime() + 86400000);
+                    const endDateUTC = arrivalDateUTC;
+
+                    let currentDateUTC = new Date(Date.UTC(startDateUTC.getUTCFullYear(), startDateUTC.getUTCMonth(), 1));
+
+                    while (currentDateUTC.getTime() <= endDateUTC.getTime()) {
+                        const year = currentDateUTC.getUTCFullYear();
+                        const month = currentDateUTC.getUTCMonth();
+                        months.push(this.generateMonthGrid(year, month, startDateUTC.getTime(), endDateUTC.getTime()));
+                        currentDateUTC.setUTCMonth(currentDateUTC.getUTCMonth() + 1);
+                    }
                 }
+
+                calendarMonthsCache.key = cacheKey;
+                calendarMonthsCache.months = months;
                 return months;
             } catch (e) {
                 console.error("[Store.calendarMonths] Critical Error:", e);
@@ -1046,9 +1429,13 @@ document.addEventListener('alpine:init', () => {
 
             return {
                 key: `${year}-${month}`,
+                year: year,
+                month: month,
                 title: `${monthName.toUpperCase()} ${year}`,
                 weekdays: this.lang.weekdays_short,
-                days: daysArray
+                days: daysArray,
+                // Precomputed for isMonthCompleted()
+                inRangeDates: daysArray.filter(day => day.isInRange).map(day => day.dateString)
             };
         },
 
@@ -1072,11 +1459,10 @@ document.addEventListener('alpine:init', () => {
         },
 
         isMonthCompleted(month) {
-            if (!this.log?.marked_dates || !month?.days) return false;
-            const notMarkedDay = month.days.find(day =>
-                day.isInRange && !this.log.marked_dates[day.dateString]
-            );
-            return !notMarkedDay && month.days.some(day => day.isInRange);
+            if (!this.log?.marked_dates || !month?.inRangeDates) return false;
+            const markedDates = this.log.marked_dates;
+            // Stops at the first unmarked day, so only those keys are tracked reactively
+            return month.inRangeDates.length > 0 && month.inRangeDates.every(dateString => markedDates[dateString]);
         },
 
         triggerMonthCompletionEffect(monthElement, monthData) {
@@ -1134,15 +1520,73 @@ document.addEventListener('alpine:init', () => {
             }
         },
 
+        /**
+         * Brings a collection on the server from `saved` to `edited` through its
+         * item API: removed items are deleted, new ones created and changed ones
+         * patched with just their changed fields. Items not edited here are never
+         * sent, so edits made elsewhere in the meantime survive.
+         * @param {string} path - Collection path ('/timers' or '/wheel/options').
+         * @param {Array<object>} saved - Items as last loaded; updated in place as requests succeed.
+         * @param {Array<object>} edited - Items as edited in the UI.
+         * @returns {Promise<boolean>} - False if a request failed (the remaining ones are skipped).
+         */
+        async syncCollection(path, saved, edited) {
+            const itemUrl = (id) => apiUrl(`${path}/${encodeURIComponent(id)}`);
+            const send = (url, method, body) => fetch(url, {
+                method,
+                headers: { 'Content-Type': 'application/json' },
+                body: body && JSON.stringify(body)
+            });
+            const editedIds = new Set(edited.map(item => item.id));
+
+            for (const item of saved.filter(item => !editedIds.has(item.id))) {
+                const response = await send(itemUrl(item.id), 'DELETE');
+                if (!response.ok && response.status !== 404) return false;  // 404: already deleted
+                saved.splice(saved.indexOf(item), 1);
+            }
+
+            const savedById = new Map(saved.map(item => [item.id, item]));
+            for (const item of edited) {
+                const previous = savedById.get(item.id);
+                if (!previous) {
+                    const response = await send(apiUrl(path), 'POST', item);
+                    if (!response.ok) return false;
+                    saved.push(await response.json());
+                    continue;
+                }
+
+                const changes = Object.fromEntries(Object.entries(item).filter(
+                    ([key, value]) => JSON.stringify(value) !== JSON.stringify(previous[key])
+                ));
+                if (Object.keys(changes).length === 0) continue;
+                const response = await send(itemUrl(item.id), 'PATCH', changes);
+                if (!response.ok) return false;
+                saved[saved.indexOf(previous)] = await response.json();
+            }
+            return true;
+        },
+
         async saveSettings(formData, doReload = true) {
             if (!formData || this.ui.isSaving) return false;
             this.ui.isSaving = true;
 
             try {
-                const response = await fetch('/api/config', {
+                // Custom timers go item by item; the config POST below leaves
+                // the stored list (and the wheel options) untouched.
+                const timers = formData.timers?.custom_timers;
+                if (timers && !(await this.syncCollection('/timers', this.config.timers.custom_timers, timers))) {
+                    this.ui.isSaving = false;
+                    return false;
+                }
+
+                const settings = JSON.parse(JSON.stringify(formData));
+                if (settings.timers) delete settings.timers.custom_timers;
+                delete settings.wheel_options;
+
+                const response = await fetch(apiUrl('/config'), {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(formData)
+                    body: JSON.stringify(settings)
                 });
 
                 if (!response.ok) {
@@ -1170,6 +1614,30 @@ document.addEventListener('alpine:init', () => {
             }
         },
 
+        /**
+         * Saves the wheel options item by item. Other settings are not sent.
+         * @param {Array<object>} options - Options as edited on the wheel page.
+         * @returns {Promise<boolean>} - Success status.
+         */
+        async saveWheelOptions(options) {
+            if (!this.config || this.ui.isSaving) return false;
+            this.ui.isSaving = true;
+
+            try {
+                const saved = JSON.parse(JSON.stringify(this.config.wheel_options));
+                const success = await this.syncCollection('/wheel/options', saved, JSON.parse(JSON.stringify(options)));
+                // Reflect whatever reached the server, also after a partial failure
+                this.config.wheel_options = saved;
+                if (this.form) this.form.wheel_options = JSON.parse(JSON.stringify(saved));
+                return success;
+            } catch (error) {
+                console.error("[Store.saveWheelOptions] Error:", error);
+                return false;
+            } finally {
+                this.ui.isSaving = false;
+            }
+        },
+
         revertSettings() {
             if (this.config) {
                 this.form = Alpine.reactive(JSON.parse(JSON.stringify(this.config)));
@@ -1186,7 +1654,7 @@ document.addEventListener('alpine:init', () => {
             this.ui.isSaving = true;
 
             try {
-                const response = await fetch('/api/config/reset_all', { method: 'POST' });
+                const response = await fetch(apiUrl('/config/reset_all'), { method: 'POST' });
                 if (!response.ok) throw new Error('API Error');
 
                 alert("All settings reset. Reloading...");
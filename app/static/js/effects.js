@@ -1,20 +1,276 @@
 // /mrhoustontimer/app/static/js/effects.js
 /**
  * @fileoverview Utilities for creating and animating visual particle effects.
+ * Particles are pooled objects drawn on a single full-screen canvas layer.
  */
 
+/* ==========================================================================
+   1. Particle System (pooled canvas renderer)
+   ========================================================================== */
+
+const ParticleSystem = {
+    // Limits
+    MAX_PARTICLES: 600,          // Global cap on live particles (pool size)
+    ANIMATION_MS: 1200,          // Matches the 1.2s 'particle-fly-out' CSS animation
+    DEFAULT_FONT_PX: 24,         // .particle font-size
+    CLASS_FONT_PX: { 'month-particle': 32 },
+    GLYPH_CACHE_LIMIT: 64,
+
+    // Adaptive budget
+    // Measured as script time spent inside _frame, so it is independent of
+    // the display refresh rate (a 30/50 Hz screen is not a slow frame).
+    FRAME_BUDGET_MS: 8,          // Frames costing more than this reduce particle counts
+    FRAME_RECOVER_MS: 5,         // Frames cheaper than this let counts recover
+    MIN_QUALITY: 0.1,
+    quality: 1.0,                // Multiplier applied to requested counts
+    frameCostAvg: 0,             // Smoothed per-frame drawing cost (ms)
+
+    // State
+    canvas: null,
+    ctx: null,
+    dpr: 1,
+    pool: [],
+    free: [],
+    live: [],
+    glyphCache: new Map(),
+    rectCache: new Map(),
+    rafId: null,
+    easeLut: null,
+    isSupported: null,
+
+    /**
+     * Lazily creates the canvas layer and the particle pool.
+     * @returns {boolean} False if canvas rendering is unavailable.
+     */
+    ensureReady() {
+        if (this.isSupported !== null) return this.isSupported;
+
+        const canvas = document.createElement('canvas');
+        const ctx = canvas.getContext && canvas.getContext('2d');
+        if (!ctx) {
+            this.isSupported = false;
+            return false;
+        }
+
+        canvas.className = 'particle-layer';
+        canvas.setAttribute('aria-hidden', 'true');
+        document.body.appendChild(canvas);
+        this.canvas = canvas;
+        this.ctx = ctx;
+        this.resize();
+        window.addEventListener('resize', () => this.resize());
+
+        for (let i = 0; i < this.MAX_PARTICLES; i++) {
+            this.pool.push({ index: i, x: 0, y: 0, dx: 0, dy: 0, start: 0, life: 0, glyph: null });
+            this.free.push(i);
+        }
+
+        // CSS 'ease-out' = cubic-bezier(0, 0, 0.58, 1), sampled once
+        this.easeLut = new Float32Array(101);
+        for (let i = 0; i <= 100; i++) {
+            this.easeLut[i] = this._cubicBezierY(i / 100, 0.58);
+        }
+
+        this.isSupported = true;
+        return true;
+    },
+
+    resize() {
+        if (!this.canvas) return;
+        this.dpr = window.devicePixelRatio || 1;
+        this.canvas.width = Math.round(window.innerWidth * this.dpr);
+        this.canvas.height = Math.round(window.innerHeight * this.dpr);
+        this.glyphCache.clear();
+    },
+
+    /**
+     * Solves y(x) for cubic-bezier(0, 0, x2, 1).
+     * @private
+     */
+    _cubicBezierY(x, x2) {
+        let lo = 0, hi = 1, t = x;
+        for (let i = 0; i < 20; i++) {
+            t = (lo + hi) / 2;
+            const bx = 3 * (1 - t) * t * t * x2 + t * t * t;
+            if (bx < x) lo = t; else hi = t;
+        }
+        return 3 * (1 - t) * t * t + t * t * t;
+    },
+
+    _ease(progress) {
+        return this.easeLut[Math.round(progress * 100)];
+    },
+
+    /**
+     * Pre-renders a symbol to an offscreen canvas (device pixels).
+     * @private
+     */
+    _glyph(symbol, fontPx) {
+        const key = `${symbol}|${fontPx}`;
+        let glyph = this.glyphCache.get(key);
+        if (glyph) return glyph;
+
+        if (this.glyphCache.size >= this.GLYPH_CACHE_LIMIT) this.glyphCache.clear();
+
+        const size = Math.ceil(fontPx * 1.4 * this.dpr);
+        glyph = document.createElement('canvas');
+        glyph.width = size;
+        glyph.height = size;
+        const gctx = glyph.getContext('2d');
+        gctx.font = `${fontPx * this.dpr}px sans-serif`;
+        gctx.textAlign = 'center';
+        gctx.textBaseline = 'middle';
+        gctx.fillStyle = getComputedStyle(document.body).color || '#fff';
+        gctx.fillText(symbol, size / 2, size / 2);
+
+        this.glyphCache.set(key, glyph);
+        return glyph;
+    },
+
+    /**
+     * Viewport rect of an element, cached until the next animation frame.
+     * @param {Element} element
+     * @returns {DOMRect}
+     */
+    rectOf(element) {
+        let rect = this.rectCache.get(element);
+        if (!rect) {
+            rect = element.getBoundingClientRect();
+            this.rectCache.set(element, rect);
+            this._requestFrame();
+        }
+        return rect;
+    },
+
+    /**
+     * Scales a requested count by the current quality (stochastic rounding,
+     * so single-particle effects thin out instead of disappearing entirely).
+     * @param {number} count
+     * @returns {number}
+     */
+    budgetedCount(count) {
+        const scaled = count * this.quality;
+        const whole = Math.floor(scaled);
+        return whole + (Math.random() < scaled - whole ? 1 : 0);
+    },
+
+    /**
+     * Activates pooled particles. Silently drops particles over the global cap.
+     */
+    spawn(originX, originY, symbol, count, spread, duration, distance, particleClass, aim, deg_aim) {
+        const fontPx = this.CLASS_FONT_PX[particleClass] || this.DEFAULT_FONT_PX;
+        const glyph = this._glyph(symbol, fontPx);
+        const now = performance.now();
+        const life = Math.min(duration, this.ANIMATION_MS);
+        const angleOffset = 90 * aim + deg_aim;
+        const total = Math.min(this.budgetedCount(count), this.free.length);
+
+        for (let i = 0; i < total; i++) {
+            const particle = this.pool[this.free.pop()];
+
+            // Random spread angle and distance (50% - 100% of max), as before
+            const randomAngleDeg = (Math.random() * spread - (spread / 2)) + angleOffset;
+            const angleRad = randomAngleDeg * (Math.PI / 180);
+            const currentDistance = (Math.random() * 0.5 + 0.5) * distance;
+
+            particle.x = originX;
+            particle.y = originY;
+            particle.dx = Math.cos(angleRad) * currentDistance;
+            particle.dy = Math.sin(angleRad) * currentDistance;
+            particle.start = now;
+            particle.life = life;
+            particle.glyph = glyph;
+            this.live.push(particle);
+        }
+
+        if (total > 0) this._requestFrame();
+    },
+
+    _requestFrame() {
+        if (this.rafId === null) {
+            this.rafId = requestAnimationFrame(() => this._frame());
+        }
+    },
+
+    /**
+     * Draws every live particle, recycles finished ones and adapts quality.
+     * @private
+     */
+    _frame() {
+        this.rafId = null;
+        this.rectCache.clear();
+
+        const ctx = this.ctx;
+        const dpr = this.dpr;
+        const now = performance.now();
+        const drawnCount = this.live.length;
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
+
+        for (let i = this.live.length - 1; i >= 0; i--) {
+            const particle = this.live[i];
+            const elapsed = now - particle.start;
+
+            if (elapsed >= particle.life) {
+                // Swap-remove and return to the pool
+                this.live[i] = this.live[this.live.length - 1];
+                this.live.pop();
+                particle.glyph = null;
+                this.free.push(particle.index);
+                continue;
+            }
+
+            // translate(x, y) scale(1 - e) rotate(360deg * e), opacity 1 - e
+            const eased = this._ease(elapsed / this.ANIMATION_MS);
+            const scale = (1 - eased) * dpr;
+            const angle = eased * 2 * Math.PI;
+            const cos = Math.cos(angle) * scale;
+            const sin = Math.sin(angle) * scale;
+            const half = particle.glyph.width / dpr / 2;
+
+            ctx.globalAlpha = 1 - eased;
+            ctx.setTransform(cos, sin, -sin, cos,
+                (particle.x + particle.dx * eased) * dpr,
+                (particle.y + particle.dy * eased) * dpr);
+            ctx.drawImage(particle.glyph, -half, -half, half * 2, half * 2);
+        }
+        ctx.globalAlpha = 1;
+
+        if (drawnCount > 0) this._adaptQuality(performance.now() - now);
+        if (this.live.length > 0) this._requestFrame();
+    },
+
+    /**
+     * Adaptive budget: lowers quality while drawing is expensive, recovers slowly otherwise.
+     * @param {number} costMs - Time spent in the last _frame call.
+     * @private
+     */
+    _adaptQuality(costMs) {
+        this.frameCostAvg = this.frameCostAvg * 0.9 + Math.min(costMs, 100) * 0.1;
+        if (this.frameCostAvg > this.FRAME_BUDGET_MS) {
+            this.quality = Math.max(this.MIN_QUALITY, this.quality * 0.9);
+        } else if (this.frameCostAvg < this.FRAME_RECOVER_MS) {
+            this.quality = Math.min(1, this.quality + 0.02);
+        }
+    }
+};
+
+/* ==========================================================================
+   2. Public API
+   ========================================================================== */
+
 /**
  * Creates and animates a set of particles (symbols) flying out from a specified element.
- * Particles are positioned absolutely relative to the viewport and removed after animation.
- * Animation is driven by CSS (`particle-fly-out` keyframes) using CSS variables
- * `--particle-x` and `--particle-y` for the destination.
+ * Particles are drawn by ParticleSystem on a shared canvas; the requested count is
+ * scaled down automatically when frames run over budget. Falls back to animated
+ * DOM elements (`particle-fly-out` keyframes) where canvas is unavailable.
  *
  * @param {object} options - Configuration object for particle spawning.
  * @param {HTMLElement | null} options.originElement - The DOM element from which particles originate.
  * @param {string} options.symbol - The symbol (e.g., emoji '💖') to use as a particle.
  * @param {number} [options.count=10] - Number of particles to create. Default is 10.
  * @param {number} [options.spread=180] - Spread angle in degrees. 180 is a semicircle. Default is 180.
- * @param {number} [options.duration=1200] - Animation duration in ms. Default is 1200ms.
+ * @param {number} [options.duration=1200] - Particle lifetime in ms (animation itself lasts 1200ms). Default is 1200ms.
  * @param {number} [options.distance=300] - Maximum fly-out distance in pixels. Default is 300px.
  * @param {string} [options.particleClass=''] - Additional CSS class for styling.
  * @param {number} [options.aim=1] - Direction multiplier (vertical orientation).
@@ -41,48 +297,57 @@ function spawnParticles({
     }
 
     try {
-        const originRect = originElement.getBoundingClientRect();
+        if (!ParticleSystem.ensureReady()) {
+            spawnDomParticles({ originElement, symbol, count, spread, duration, distance, particleClass, aim, deg_aim });
+            return;
+        }
+
+        const originRect = ParticleSystem.rectOf(originElement);
         // Calculate center point relative to the viewport
         const originX = originRect.left + originRect.width / 2;
         const originY = originRect.top + originRect.height / 2;
 
-        for (let i = 0; i < count; i++) {
-            const particle = document.createElement('span');
-            particle.className = `particle ${particleClass || ''}`.trim();
-            particle.textContent = symbol;
+        ParticleSystem.spawn(originX, originY, symbol, count, spread, duration, distance, particleClass, aim, deg_aim);
+    } catch (error) {
+        console.error("[spawnParticles] Error creating particles:", error);
+    }
+}
 
-            // Set initial position to the center of the origin element
-            particle.style.position = 'fixed';
-            particle.style.left = `${originX}px`;
-            particle.style.top = `${originY}px`;
+/**
+ * Fallback renderer: one absolutely positioned element per particle, animated by CSS.
+ * Uses the same options as spawnParticles().
+ */
+function spawnDomParticles({ originElement, symbol, count, spread, duration, distance, particleClass, aim, deg_aim }) {
+    const originRect = originElement.getBoundingClientRect();
+    const originX = originRect.left + originRect.width / 2;
+    const originY = originRect.top + originRect.height / 2;
 
-            // Calculate random spread angle
-            // Offset 90 degrees based on 'aim' parameter
-            const angleOffset = 90 * aim + deg_aim;
-            const randomAngleDeg = (Math.random() * spread - (spread / 2)) + angleOffset;
-            const angleRad = randomAngleDeg * (Math.PI / 180);
+    for (let i = 0; i < count; i++) {
+        const particle = document.createElement('span');
+        particle.className = `particle ${particleClass || ''}`.trim();
+        particle.textContent = symbol;
 
-            // Calculate random distance (between 50% and 100% of max distance)
-            const currentDistance = (Math.random() * 0.5 + 0.5) * distance;
+        // Set initial position to the center of the origin element
+        particle.style.position = 'fixed';
+        particle.style.left = `${originX}px`;
+        particle.style.top = `${originY}px`;
 
-            // Calculate destination coordinates
-            const endX = Math.cos(angleRad) * currentDistance;
-            const endY = Math.sin(angleRad) * currentDistance;
+        const angleOffset = 90 * aim + deg_aim;
+        const randomAngleDeg = (Math.random() * spread - (spread / 2)) + angleOffset;
+        const angleRad = randomAngleDeg * (Math.PI / 180);
+        const currentDistance = (Math.random() * 0.5 + 0.5) * distance;
 
-            // Set CSS variables for the @keyframes animation
-            particle.style.setProperty('--particle-x', `${endX.toFixed(2)}px`);
-            particle.style.setProperty('--particle-y', `${endY.toFixed(2)}px`);
+        // Set CSS variables for the @keyframes animation
+        particle.style.setProperty('--particle-x', `${(Math.cos(angleRad) * currentDistance).toFixed(2)}px`);
+        particle.style.setProperty('--particle-y', `${(Math.sin(angleRad) * currentDistance).toFixed(2)}px`);
 
-            document.body.appendChild(particle);
+        document.body.appendChild(particle);
 
-            // cleanup after animation finishes
-            setTimeout(() => {
-                if (particle.parentNode) {
-                    particle.remove();
-                }
-            }, duration);
-        }
-    } catch (error) {
-        console.error("[spawnParticles] Error creating particles:", error);
+        // cleanup after animation finishes
+        setTimeout(() => {
+            if (particle.parentNode) {
+                particle.remove();
+            }
+        }, duration);
     }
-}
\ No newline at end of file
+}
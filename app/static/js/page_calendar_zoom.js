@@ -7,14 +7,22 @@ const DEFAULT_MIN_WIDTH = 320; // Default minimum module width in px
 let currentMinModuleWidth = DEFAULT_MIN_WIDTH;
 
 /**
- * Resets the CSS variable '--calendar-module-min-width' to default.
+ * Applies the current width and tells the calendar view that month sizes changed.
  */
-function resetCalendarZoom() {
-    currentMinModuleWidth = DEFAULT_MIN_WIDTH;
+function applyCalendarZoom() {
     document.documentElement.style.setProperty(
         '--calendar-module-min-width',
         `${currentMinModuleWidth}px`
     );
+    window.dispatchEvent(new CustomEvent('calendar-zoom', { detail: { minWidth: currentMinModuleWidth } }));
+}
+
+/**
+ * Resets the CSS variable '--calendar-module-min-width' to default.
+ */
+function resetCalendarZoom() {
+    currentMinModuleWidth = DEFAULT_MIN_WIDTH;
+    applyCalendarZoom();
 }
 
 /**
@@ -49,10 +57,7 @@ function initCalendarZoom() {
         // Clamp values
         currentMinModuleWidth = Math.max(minWidth, Math.min(maxWidth, currentMinModuleWidth));
 
-        document.documentElement.style.setProperty(
-            '--calendar-module-min-width',
-            `${currentMinModuleWidth}px`
-        );
+        applyCalendarZoom();
 
     }, { passive: false });
 }
@@ -1,8 +1,140 @@
 // /mrhoustontimer/app/static/js/timer.js
 /**
  * @fileoverview Ticker class for tracking time and generating particle effects on digit changes.
+ * All tickers are driven by one shared TickScheduler aligned to wall-clock seconds.
  */
 
+/* ==========================================================================
+   1. Tick Scheduler
+   ========================================================================== */
+
+/**
+ * Single timer loop shared by every registered Ticker.
+ * Fires just after each wall-clock second boundary, computes all tickers first
+ * and then writes their DOM changes in one batch. Sleeps while the document is
+ * hidden or while the active-page predicate reports the timers as off-screen.
+ */
+const TickScheduler = {
+    tickers: new Set(),
+    timeoutId: null,
+    BOUNDARY_SLACK_MS: 5, // Fire slightly after the boundary so Date.now() is already in the new second
+
+    /** @type {() => boolean} Returns false while the timers are not visible. */
+    isActive: () => true,
+
+    /**
+     * Sets the predicate that decides whether timers are on-screen.
+     * @param {() => boolean} predicate
+     */
+    setActivePredicate(predicate) {
+        this.isActive = predicate;
+        this.refresh();
+    },
+
+    /**
+     * @param {Ticker} ticker - Ticker to drive. Paints it immediately.
+     */
+    register(ticker) {
+        this.tickers.add(ticker);
+        if (this._canRun()) {
+            this._runFrame([ticker], true);
+        }
+        this._schedule();
+    },
+
+    /**
+     * @param {Ticker} ticker - Ticker to stop driving.
+     */
+    unregister(ticker) {
+        this.tickers.delete(ticker);
+        if (this.tickers.size === 0) this._cancel();
+    },
+
+    /**
+     * Re-evaluates visibility. Call after page switches; on resume every ticker
+     * is repainted at once (without particle effects) before the loop restarts.
+     */
+    refresh() {
+        if (!this._canRun()) {
+            this._cancel();
+            return;
+        }
+        if (this.timeoutId === null && this.tickers.size > 0) {
+            this._runFrame(this.tickers, true);
+            this._schedule();
+        }
+    },
+
+    _canRun() {
+        if (typeof document !== 'undefined' && document.hidden) return false;
+        try {
+            return this.isActive();
+        } catch (e) {
+            return true;
+        }
+    },
+
+    _schedule() {
+        if (this.timeoutId !== null || this.tickers.size === 0 || !this._canRun()) return;
+        const delay = 1000 - (Date.now() % 1000) + this.BOUNDARY_SLACK_MS;
+        this.timeoutId = window.setTimeout(() => this._tick(), delay);
+    },
+
+    _cancel() {
+        if (this.timeoutId !== null) {
+            window.clearTimeout(this.timeoutId);
+            this.timeoutId = null;
+        }
+    },
+
+    _tick() {
+        this.timeoutId = null;
+        this._runFrame(this.tickers, false);
+        this._schedule();
+    },
+
+    /**
+     * Computes every ticker, then applies all DOM writes, then spawns effects
+     * (effects read layout, so they run after the writes to avoid thrashing).
+     * @param {Iterable<Ticker>} tickers
+     * @param {boolean} quiet - Skip particle effects (initial paint / resume).
+     */
+    _runFrame(tickers, quiet) {
+        const now = Date.now();
+        const changed = [];
+        for (const ticker of tickers) {
+            if (ticker.prepare(now)) changed.push(ticker);
+        }
+
+        const effectOrigins = [];
+        for (const ticker of changed) {
+            ticker.commit(quiet ? null : effectOrigins);
+        }
+
+        if (effectOrigins.length > 0 && typeof spawnParticles === 'function') {
+            const symbol = Ticker.particleSymbol();
+            for (const span of effectOrigins) {
+                spawnParticles({
+                    originElement: span,
+                    symbol: symbol,
+                    count: 1,
+                    spread: 30,
+                    distance: 300,
+                    duration: 1200
+                });
+            }
+        }
+    }
+};
+
+if (typeof document !== 'undefined') {
+    document.addEventListener('visibilitychange', () => TickScheduler.refresh());
+}
+
+/* ==========================================================================
+   2. Ticker
+   ========================================================================== */
+
 class Ticker {
     /**
      * Creates a Ticker instance.
@@ -18,11 +150,17 @@ class Ticker {
         this.mode = mode;
         this.completedMessage = completedMessage;
         this.elementId = elementId;
-        this.intervalId = null;
+        this.isRunning = false;
         /** @private @type {string | null} */
         this.previousTimeString = null;
-
-        this._update = this._update.bind(this);
+        /** @private @type {string | null} Computed by prepare(), written by commit(). */
+        this.pendingTimeString = null;
+        /** @private @type {boolean} */
+        this.pendingCompleted = false;
+        /** @private @type {HTMLElement[]} Cached digit spans. */
+        this.spans = [];
+        /** @private @type {boolean} Main timers emit particles on digit changes. */
+        this.isMainTimer = (elementId === 'timer-arrival-display' || elementId === 'timer-relationship-display');
 
         // Validation
         if (!this.element || !(this.element instanceof HTMLElement)) {
@@ -36,14 +174,35 @@ class Ticker {
 
         // Initialize span structure without animation
         if (this.element) {
-            const initialString = '--:--:--:--';
-            this.element.innerHTML = initialString.split('')
-                .map((char, index) => `<span class="digit-char digit-${index}">${char}</span>`)
-                .join('');
-            this.previousTimeString = initialString;
+            this._buildSpans('--:--:--:--');
         }
     }
 
+    /**
+     * Particle symbol for digit changes (from the store, or the legacy APP_CONFIG global).
+     * @returns {string}
+     */
+    static particleSymbol() {
+        const config = Ticker._config();
+        return (config && config.effect_particle_day) || '💖';
+    }
+
+    /** @private */
+    static _config() {
+        if (typeof Alpine !== 'undefined' && Alpine.store('app')) return Alpine.store('app').config;
+        if (typeof APP_CONFIG !== 'undefined') return APP_CONFIG;
+        return null;
+    }
+
+    /** @private */
+    _buildSpans(text) {
+        this.element.innerHTML = text.split('')
+            .map((char, index) => `<span class="digit-char digit-${index}">${char}</span>`)
+            .join('');
+        this.spans = Array.from(this.element.children);
+        this.previousTimeString = text;
+    }
+
     _pad(num) {
         const number = Number(num);
         if (isNaN(number)) return "00";
@@ -51,98 +210,104 @@ class Ticker {
     }
 
     /**
-     * [v3.1] Updates the DOM and spawns particles if digits have changed.
-     * @private
+     * Formats a millisecond difference as DD:HH:MM:SS.
+     * @param {number} diffMs
+     * @returns {string}
      */
-    _update() {
-        if (!this.element) return;
+    _format(diffMs) {
+        const SECONDS_IN_MINUTE = 60;
+        const SECONDS_IN_HOUR = 3600;
+        const SECONDS_IN_DAY = 86400;
 
-        const now = new Date();
-        let diffMs;
-        if (this.mode === 'countdown') {
-            diffMs = this.referenceDate.getTime() - now.getTime();
-        } else {
-            diffMs = now.getTime() - this.referenceDate.getTime();
-        }
+        const totalSeconds = Math.floor(Math.abs(diffMs) / 1000);
+        const days = Math.floor(totalSeconds / SECONDS_IN_DAY);
+        const hours = Math.floor((totalSeconds % SECONDS_IN_DAY) / SECONDS_IN_HOUR);
+        const minutes = Math.floor((totalSeconds % SECONDS_IN_HOUR) / SECONDS_IN_MINUTE);
+        const seconds = totalSeconds % SECONDS_IN_MINUTE;
+
+        return `${this._pad(days)}:${this._pad(hours)}:${this._pad(minutes)}:${this._pad(seconds)}`;
+    }
+
+    /**
+     * Read phase: computes the display for `nowMs` without touching the DOM.
+     * @param {number} nowMs - Shared timestamp for this frame.
+     * @returns {boolean} True if commit() has something to write.
+     */
+    prepare(nowMs) {
+        if (!this.element) return false;
+
+        const diffMs = this.mode === 'countdown'
+            ? this.referenceDate.getTime() - nowMs
+            : nowMs - this.referenceDate.getTime();
 
         // Handle completion
         if (this.mode === 'countdown' && diffMs < 0) {
-            if (this.element.innerText !== this.completedMessage) {
-                 this.element.innerHTML = this.completedMessage;
+            this.pendingCompleted = true;
+            return true;
+        }
+
+        const currentTimeString = this._format(diffMs);
+        if (currentTimeString === this.previousTimeString) return false;
+        this.pendingTimeString = currentTimeString;
+        return true;
+    }
+
+    /**
+     * [v4.0] Write phase: updates only the changed digit spans.
+     * @param {HTMLElement[] | null} effectOrigins - Collects spans that should emit particles (null = no effects).
+     */
+    commit(effectOrigins) {
+        if (this.pendingCompleted) {
+            this.pendingCompleted = false;
+            if (this.element.textContent !== this.completedMessage) {
+                this.element.textContent = this.completedMessage;
             }
+            this.spans = [];
             this.stop();
             return;
         }
 
-        // Calculate D:H:M:S
-        const MS_IN_SECOND = 1000;
-        const SECONDS_IN_MINUTE = 60;
-        const MINUTES_IN_HOUR = 60;
-        const HOURS_IN_DAY = 24;
-        const SECONDS_IN_HOUR = SECONDS_IN_MINUTE * MINUTES_IN_HOUR;
-        const SECONDS_IN_DAY = SECONDS_IN_HOUR * HOURS_IN_DAY;
+        const currentTimeString = this.pendingTimeString;
+        this.pendingTimeString = null;
+        if (currentTimeString === null) return;
 
-        const totalSeconds = Math.floor(Math.abs(diffMs) / MS_IN_SECOND);
-        const days = Math.floor(totalSeconds / SECONDS_IN_DAY);
-        const hours = Math.floor((totalSeconds % SECONDS_IN_DAY) / SECONDS_IN_HOUR);
-        const minutes = Math.floor((totalSeconds % SECONDS_IN_HOUR) / SECONDS_IN_MINUTE);
-        const seconds = totalSeconds % SECONDS_IN_MINUTE;
+        // Rebuild spans if structure is broken (e.g. length changed past 99 days)
+        if (this.spans.length !== currentTimeString.length) {
+            this._buildSpans(currentTimeString);
+            return;
+        }
 
-        const currentTimeString = `${this._pad(days)}:${this._pad(hours)}:${this._pad(minutes)}:${this._pad(seconds)}`;
-
-        // --- Update Digits & Trigger Effects ---
-        if (currentTimeString !== this.previousTimeString) {
-            const currentChars = currentTimeString.split('');
-            const previousChars = (this.previousTimeString || '').split('');
-            const spans = this.element.querySelectorAll('.digit-char');
-
-            // Check if span count matches char count
-            if (spans.length === currentChars.length) {
-                currentChars.forEach((newChar, index) => {
-                    const span = spans[index];
-                    const oldChar = previousChars[index];
-
-                    // If character changed
-                    if (newChar !== oldChar) {
-                        span.textContent = newChar;
-
-                        // --- Trigger Particle Effect ---
-                        // Only for main timers and if effects are enabled in config
-                        const isMainTimer = (this.elementId === 'timer-arrival-display' || this.elementId === 'timer-relationship-display');
-                        const isMainPageActive = document.getElementById('page-main')?.classList.contains('active');
-
-                        if (isMainTimer && typeof APP_CONFIG !== 'undefined' && APP_CONFIG.effects_enabled && isMainPageActive) {
-                            spawnParticles({
-                                originElement: span,
-                                symbol: APP_CONFIG.effect_particle_day || '💖',
-                                count: 1,
-                                spread: 30,
-                                distance: 300,
-                                duration: 1200
-                            });
-                        }
-                    }
-                });
-            } else {
-                 // Fallback: Rebuild spans if structure is broken
-                 this.element.innerHTML = currentChars.map((char, index) => `<span class="digit-char digit-${index}">${char}</span>`).join('');
-            }
-            this.previousTimeString = currentTimeString;
+        const previous = this.previousTimeString || '';
+        const emitEffects = effectOrigins !== null && this.isMainTimer && this._effectsAllowed();
+        for (let index = 0; index < currentTimeString.length; index++) {
+            const newChar = currentTimeString[index];
+            if (newChar === previous[index]) continue;
+            this.spans[index].textContent = newChar;
+            if (emitEffects) effectOrigins.push(this.spans[index]);
         }
+        this.previousTimeString = currentTimeString;
+    }
+
+    /** @private */
+    _effectsAllowed() {
+        const config = Ticker._config();
+        if (!config || !config.effects_enabled) return false;
+        if (typeof Alpine !== 'undefined' && Alpine.store('app')) {
+            return Alpine.store('app').ui.currentPage === 'page-main';
+        }
+        return !!document.getElementById('page-main')?.classList.contains('active');
     }
 
     start() {
-        if (!this.element) return;
-        if (this.intervalId !== null) return;
-        this._update();
-        this.intervalId = window.setInterval(this._update, 1000);
+        if (!this.element || this.isRunning) return;
+        if (this.spans.length === 0) this._buildSpans('--:--:--:--');
+        this.isRunning = true;
+        TickScheduler.register(this);
     }
 
     stop() {
-        if (this.intervalId !== null) {
-            window.clearInterval(this.intervalId);
-            this.intervalId = null;
-            this.previousTimeString = null;
-        }
+        if (!this.isRunning) return;
+        this.isRunning = false;
+        TickScheduler.unregister(this);
     }
-}
\ No newline at end of file
+}
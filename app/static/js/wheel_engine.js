@@ -0,0 +1,268 @@
+// /mrhoustontimer/app/static/js/wheel_engine.js
+/**
+ * @fileoverview Wheel of fortune physics.
+ * Fixed-timestep integrator (frame-rate independent), a requestAnimationFrame
+ * loop that only runs while the wheel is moving and visible, O(1) sector
+ * crossing detection and an optional seeded RNG for reproducible spins.
+ * Has no DOM dependencies, so it also runs under Node for tests/benchmarks.
+ */
+
+/* ==========================================================================
+   1. Seeded Random
+   ========================================================================== */
+
+/**
+ * Small, fast 32-bit PRNG (mulberry32).
+ * @param {number} seed - Any integer.
+ * @returns {() => number} Function returning floats in [0, 1).
+ */
+function mulberry32(seed) {
+    let state = seed >>> 0;
+    return function () {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/* ==========================================================================
+   2. Wheel Engine
+   ========================================================================== */
+
+class WheelEngine {
+    /**
+     * Creates a WheelEngine instance.
+     * Velocities are in degrees per step and friction is applied once per step,
+     * with one step = 1/60 s (the values the wheel was originally tuned with at 60 Hz).
+     * @param {object} [options]
+     * @param {number} [options.sectorCount=1] - Number of equal sectors.
+     * @param {number | null} [options.seed=null] - Seed for reproducible spins (null = Math.random).
+     * @param {(count: number) => void} [options.onSectorCross] - Called once per step in which the pointer passed sector boundaries.
+     * @param {() => void} [options.onStop] - Called when the wheel comes to rest.
+     * @param {(angle: number) => void} [options.onFrame] - Called with the angle to render after each animation frame.
+     * @param {() => boolean} [options.isActive] - Returns false while the wheel is off-screen (loop pauses).
+     */
+    constructor(options = {}) {
+        this.sectorCount = 1;
+        this.segmentAngle = 360;
+        this.setSectorCount(options.sectorCount || 1);
+        this.setSeed(options.seed ?? null);
+
+        this.onSectorCross = options.onSectorCross || null;
+        this.onStop = options.onStop || null;
+        this.onFrame = options.onFrame || null;
+        this.isActive = options.isActive || (() => true);
+
+        // Physics state
+        this.angle = 0;             // [0, 360)
+        this.previousAngle = 0;     // Angle before the last step (render interpolation)
+        this.velocity = 0;          // Degrees per step
+        this.friction = WheelEngine.FRICTION_FAST;
+        this.isSpinning = false;
+
+        // Loop state
+        /** @private */ this.frameId = null;
+        /** @private */ this.lastFrameTime = null;
+        /** @private */ this.accumulatorMs = 0;
+    }
+
+    /**
+     * @param {number} count - Number of sectors (at least 1).
+     */
+    setSectorCount(count) {
+        this.sectorCount = Math.max(1, Math.floor(count) || 1);
+        this.segmentAngle = 360 / this.sectorCount;
+    }
+
+    /**
+     * @param {number | null} seed - Seed for reproducible spins, or null for Math.random.
+     */
+    setSeed(seed) {
+        this.random = (seed === null || seed === undefined) ? Math.random : mulberry32(seed);
+    }
+
+    /**
+     * Index of the sector under the pointer for a given angle.
+     * The wheel is drawn with rotate(angle) (clockwise) and the pointer sits at
+     * the top, so the point under it is at -angle in wheel coordinates.
+     * @param {number} [angle=this.angle]
+     * @returns {number}
+     */
+    sectorAt(angle = this.angle) {
+        const underPointer = (((-angle) % 360) + 360) % 360;
+        return Math.min(this.sectorCount - 1, Math.floor(underPointer / this.segmentAngle));
+    }
+
+    // --- Controls ---
+
+    /**
+     * Starts a spin, or boosts a wheel that is already spinning.
+     * @returns {{ boosted: boolean, velocity: number }}
+     */
+    spin() {
+        const boosted = this.isSpinning;
+        this.friction = this._randomFriction();
+
+        if (boosted) {
+            let boost;
+            if (this.velocity > 30) boost = (this.random() * 2.5) + 2.5;
+            else if (this.velocity > 15) boost = (this.random() * 5) + 5;
+            else boost = (this.random() * 7.5) + 10;
+            this.velocity += boost;
+        } else {
+            this.velocity = (this.random() * 50) + 30;
+            this.isSpinning = true;
+        }
+
+        this.velocity = Math.min(this.velocity, WheelEngine.MAX_VELOCITY);
+        this.wake();
+        return { boosted: boosted, velocity: this.velocity };
+    }
+
+    /**
+     * Brakes hard: the wheel stops within a few degrees.
+     * @returns {boolean} False if the wheel was not spinning.
+     */
+    brake() {
+        if (!this.isSpinning) return false;
+        this.velocity = Math.min(this.velocity, 1);
+        this.friction = WheelEngine.FRICTION_BRAKE;
+        return true;
+    }
+
+    // --- Integration ---
+
+    /**
+     * Advances the simulation by one fixed step.
+     * @returns {boolean} True while the wheel is still moving.
+     */
+    step() {
+        this.previousAngle = this.angle;
+
+        if (this.velocity <= WheelEngine.MIN_VELOCITY) {
+            if (this.isSpinning) {
+                this.isSpinning = false;
+                this.velocity = 0;
+                if (this.onStop) this.onStop();
+            }
+            return false;
+        }
+
+        this.isSpinning = true;
+        this.velocity *= this.friction;
+
+        // Sector boundaries sit at multiples of segmentAngle (0 included), so the
+        // number crossed is just the difference of the floored sector positions.
+        const unwrapped = this.angle + this.velocity;
+        const crossed = Math.floor(unwrapped / this.segmentAngle) - Math.floor(this.angle / this.segmentAngle);
+        this.angle = unwrapped % 360;
+        if (this.previousAngle > this.angle) this.previousAngle -= 360; // Keep interpolation monotonic
+
+        if (crossed > 0 && this.onSectorCross) this.onSectorCross(crossed);
+        return true;
+    }
+
+    /**
+     * Runs the simulation to rest without rendering (tests, benchmarks).
+     * @param {number} [maxSteps=100000] - Safety limit.
+     * @returns {{ steps: number, crossings: number, angle: number, sector: number }}
+     */
+    runUntilRest(maxSteps = 100000) {
+        const userCallback = this.onSectorCross;
+        let crossings = 0;
+        this.onSectorCross = (count) => {
+            crossings += count;
+            if (userCallback) userCallback(count);
+        };
+
+        let steps = 0;
+        try {
+            while (steps < maxSteps && (this.step() || this.isSpinning)) steps++;
+        } finally {
+            this.onSectorCross = userCallback;
+        }
+        return { steps: steps, crossings: crossings, angle: this.angle, sector: this.sectorAt() };
+    }
+
+    // --- Animation Loop ---
+
+    /**
+     * Starts the frame loop if there is something to animate.
+     * Call after spin() and whenever isActive() may have become true.
+     */
+    wake() {
+        if (this.frameId !== null || !this.isSpinning || !this._canRun()) return;
+        this.lastFrameTime = null;
+        this.accumulatorMs = 0;
+        this.frameId = requestAnimationFrame((time) => this._frame(time));
+    }
+
+    /**
+     * Stops the frame loop; the wheel keeps its state and resumes on wake().
+     */
+    sleep() {
+        if (this.frameId !== null) {
+            cancelAnimationFrame(this.frameId);
+            this.frameId = null;
+        }
+    }
+
+    /** @private */
+    _frame(time) {
+        this.frameId = null;
+        if (!this._canRun()) return; // Paused off-screen; wake() resumes
+
+        const elapsed = this.lastFrameTime === null ? WheelEngine.STEP_MS : time - this.lastFrameTime;
+        this.lastFrameTime = time;
+        // Clamp long gaps (tab switch, debugger) instead of fast-forwarding
+        this.accumulatorMs += Math.min(elapsed, WheelEngine.STEP_MS * WheelEngine.MAX_STEPS_PER_FRAME);
+
+        let moving = this.isSpinning;
+        while (this.accumulatorMs >= WheelEngine.STEP_MS && moving) {
+            this.accumulatorMs -= WheelEngine.STEP_MS;
+            moving = this.step() || this.isSpinning;
+        }
+
+        if (this.onFrame) {
+            // Interpolate between the last two steps so the motion is smooth at any refresh rate
+            const alpha = moving ? this.accumulatorMs / WheelEngine.STEP_MS : 1;
+            const rendered = this.previousAngle + (this.angle - this.previousAngle) * alpha;
+            this.onFrame(((rendered % 360) + 360) % 360);
+        }
+
+        if (moving) {
+            this.frameId = requestAnimationFrame((nextTime) => this._frame(nextTime));
+        }
+    }
+
+    /** @private */
+    _canRun() {
+        if (typeof requestAnimationFrame === 'undefined') return false; // Headless: drive with step()/runUntilRest()
+        if (typeof document !== 'undefined' && document.hidden) return false;
+        try {
+            return this.isActive();
+        } catch (e) {
+            return true;
+        }
+    }
+
+    /** @private */
+    _randomFriction() {
+        return this.random() * (WheelEngine.FRICTION_FAST - WheelEngine.FRICTION_SLOW) + WheelEngine.FRICTION_SLOW;
+    }
+}
+
+// Physics Constants
+WheelEngine.STEP_MS = 1000 / 60;
+WheelEngine.MAX_STEPS_PER_FRAME = 8;
+WheelEngine.MIN_VELOCITY = 0.05;
+WheelEngine.MAX_VELOCITY = 70;
+WheelEngine.FRICTION_FAST = 0.998;
+WheelEngine.FRICTION_SLOW = 0.99;
+WheelEngine.FRICTION_BRAKE = 0.95;
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { WheelEngine, mulberry32 };
+}
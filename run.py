@@ -7,14 +7,22 @@ Tasks:
 2. Resolve AppData directory for user data storage.
 3. Initialize Flask app.
 4. Launch PyWebView window.
+
+The single-instance lock socket doubles as a tiny IPC listener: a second
+launch connects to it *before* importing Flask, pywebview or Pydantic,
+asks the running window to focus (and optionally switch page), and exits.
+
+With --headless, steps 1 and 4 are skipped and the app is served over HTTP
+by a pooled, threaded server instead (see app/server.py).
 """
 
 import os
+import json
 import socket
 import logging
-import appdirs
-import webview
-from app import create_app
+import argparse
+import threading
+from typing import Callable, Optional
 
 # --- Constants ---
 APP_NAME = "LoveTimer"
@@ -22,8 +30,38 @@ APP_AUTHOR = "MrHouston"
 SINGLE_INSTANCE_PORT = 47567  # Port used for the lock
 MIN_WINDOW_WIDTH = 700
 MIN_WINDOW_HEIGHT = 900
+IPC_TIMEOUT_S = 0.5           # Connect/reply timeout for the second-launch handoff
+IPC_MAX_MESSAGE_BYTES = 4096
+PAGES = ("main", "calendar", "wheel", "settings")  # --page values -> 'page-<name>'
 # -----------------
 
+# Output is configured by create_app(); before that only warnings reach stderr
+logger = logging.getLogger(APP_NAME)
+
+def request_handoff(port: int, page: Optional[str] = None) -> Optional[bool]:
+    """
+    Asks an already running instance to focus its window (and switch page).
+
+    Args:
+        port: Single-instance lock port.
+        page: Optional page name from PAGES.
+
+    Returns:
+        True if a running instance accepted the request,
+        False if something is listening but did not answer as expected,
+        None if nothing is listening (no running instance).
+    """
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=IPC_TIMEOUT_S) as sock:
+            message = {"cmd": "activate", "page": f"page-{page}" if page else None}
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            reply = sock.makefile("rb").readline(IPC_MAX_MESSAGE_BYTES)
+            return json.loads(reply or b"{}").get("ok") is True
+    except ConnectionRefusedError:
+        return None  # Nobody holds the lock
+    except (OSError, ValueError):
+        return False  # Occupied, but not by a responsive instance
+
 def check_single_instance(port: int) -> socket.socket | None:
     """
     Checks if another instance is running by attempting to bind a local port.
@@ -40,9 +78,67 @@ def check_single_instance(port: int) -> socket.socket | None:
         # Keep socket open to maintain the lock
         return sock
     except socket.error:
-        print(f"[{APP_NAME}] Application is already running.")
+        logger.warning("Application is already running.")
         return None
 
+def serve_instance_requests(lock_socket: socket.socket, on_activate: Callable[[Optional[str]], None]):
+    """
+    Turns the lock socket into a listener for second-launch requests.
+    Runs in a daemon thread until the socket is closed.
+
+    Args:
+        lock_socket: Bound socket returned by check_single_instance().
+        on_activate: Called with the requested page id (or None) for each "activate" message.
+    """
+    lock_socket.listen(4)
+
+    def accept_loop():
+        while True:
+            try:
+                conn, _ = lock_socket.accept()
+            except OSError:
+                return  # Socket closed on shutdown
+            with conn:
+                try:
+                    conn.settimeout(IPC_TIMEOUT_S)
+                    message = json.loads(conn.makefile("rb").readline(IPC_MAX_MESSAGE_BYTES) or b"{}")
+                    ok = message.get("cmd") == "activate"
+                    if ok:
+                        page = message.get("page")
+                        on_activate(page if page in {f"page-{name}" for name in PAGES} else None)
+                    conn.sendall(json.dumps({"ok": ok}).encode("utf-8") + b"\n")
+                except (OSError, ValueError) as e:
+                    logger.warning("Ignored malformed instance request: %s", e)
+
+    threading.Thread(target=accept_loop, name="instance-ipc", daemon=True).start()
+
+def navigate_js(page: str) -> str:
+    """
+    JS snippet that switches the SPA to `page` once the Alpine store has loaded.
+    """
+    return (
+        "(function go() {"
+        " const store = window.Alpine && Alpine.store('app');"
+        f" if (store && store.ui.isLoaded) store.navigateTo({json.dumps(page)});"
+        " else setTimeout(go, 100);"
+        " })()"
+    )
+
+def activate_window(window, page: Optional[str]):
+    """
+    Brings the PyWebView window to the front and optionally switches page.
+    """
+    try:
+        window.restore()
+        window.show()
+        # Toggling on_top is the portable way to raise a window above others
+        window.on_top = True
+        window.on_top = False
+        if page:
+            window.evaluate_js(navigate_js(page))
+    except Exception as e:
+        logger.warning("Could not activate window: %s", e)
+
 def get_save_directory(app_name: str, app_author: str) -> str:
     """
     Resolves the user data directory (AppData/Roaming on Windows).
@@ -51,46 +147,101 @@ def get_save_directory(app_name: str, app_author: str) -> str:
     Returns:
         Absolute path to the storage directory.
     """
+    import appdirs
+
     save_dir = appdirs.user_data_dir(app_name, app_author, roaming=True)
     try:
         os.makedirs(save_dir, exist_ok=True)
     except OSError as e:
-        print(f"CRITICAL: Could not create save directory {save_dir}: {e}")
+        logger.critical("Could not create save directory %s: %s", save_dir, e)
         exit(1)
     return save_dir
 
+def parse_args() -> argparse.Namespace:
+    """Parses command-line options."""
+    parser = argparse.ArgumentParser(description=f"{APP_NAME} - Relationship Countdown Timer")
+    parser.add_argument("--page", choices=PAGES, default=None,
+                        help="Page to open (also switches the page of an already running window).")
+    parser.add_argument("--headless", action="store_true",
+                        help="Serve the app over HTTP without opening a window.")
+    # Headless defaults live in app.server (not imported here to keep the second-launch path light)
+    parser.add_argument("--host", default=None,
+                        help="Headless: interface to bind (default: localhost only).")
+    parser.add_argument("--port", type=int, default=None,
+                        help="Headless: port to bind (default: the server default port).")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Headless: worker threads (default: the server default).")
+    parser.add_argument("--data-dir", default=None,
+                        help="Directory for config/calendar/sounds (default: user AppData).")
+    parser.add_argument("--debug", action="store_true",
+                        help="Debug logging, request logs and Flask debug mode.")
+    return parser.parse_args()
+
 # --- Main Execution ---
 if __name__ == '__main__':
+    args = parse_args()
+
+    if args.headless:
+        from app import create_app
+        from app.server import serve
+
+        save_directory = args.data_dir or get_save_directory(APP_NAME, APP_AUTHOR)
+        os.makedirs(save_directory, exist_ok=True)
+        flask_app = create_app(save_directory, debug=args.debug)
+        logger.info("--- %s Headless Startup ---", APP_NAME)
+        logger.info("Data Directory: %s", save_directory)
+
+        serve(flask_app, host=args.host, port=args.port, threads=args.threads)
+        logger.info("--- %s Terminated ---", APP_NAME)
+        exit()
+
     # 1. Single Instance Check
+    # Fast path: hand off to a running instance before any heavy import.
+    # Only a confirmed handoff ends this launch: a connect that times out
+    # (Windows can take ~2 s to refuse a closed port) or an unexpected reply
+    # falls through to the bind below, which is the authoritative check.
+    if request_handoff(SINGLE_INSTANCE_PORT, args.page) is True:
+        logger.warning("Application is already running.")
+        exit()
+
     instance_socket = check_single_instance(SINGLE_INSTANCE_PORT)
     if instance_socket is None:
+        # Lost a race with a concurrent launch; it may be listening by now.
+        request_handoff(SINGLE_INSTANCE_PORT, args.page)
         exit()
 
-    # 2. Setup Data Directory
-    save_directory = get_save_directory(APP_NAME, APP_AUTHOR)
+    import webview
+    from app import create_app
 
-    print(f"--- {APP_NAME} Startup ---")
-    print(f"Data Directory: {save_directory}")
+    # 2. Setup Data Directory
+    save_directory = args.data_dir or get_save_directory(APP_NAME, APP_AUTHOR)
+    os.makedirs(save_directory, exist_ok=True)
 
     # 3. Create Flask App
-    # Pass the resolved data directory to the factory
-    flask_app = create_app(save_directory)
-    
-    # Enable Flask debug for API error visibility in console.
-    # Set to False for production/release builds.
-    flask_app.debug = True
+    # Pass the resolved data directory to the factory (also configures logging)
+    flask_app = create_app(save_directory, debug=args.debug)
+
+    logger.info("--- %s Startup ---", APP_NAME)
+    logger.info("Data Directory: %s", save_directory)
 
     # 4. Launch PyWebView
-    print("Launching GUI...")
+    logger.info("Launching GUI...")
     window = webview.create_window(
         APP_NAME,
         flask_app,
         min_size=(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT),
     )
 
-    webview.start(debug=False, icon="icon.ico")
+    # Answer later launches: focus this window instead of starting a new one
+    serve_instance_requests(instance_socket, lambda page: activate_window(window, page))
+
+    if args.page:
+        # Initial page for this launch, applied once the store is ready
+        window.events.loaded += lambda: window.evaluate_js(navigate_js(f"page-{args.page}"))
+
+    webview.start(debug=args.debug, icon="icon.ico")
 
-    print(f"--- {APP_NAME} Terminated ---")
+    logger.info("--- %s Terminated ---", APP_NAME)
 
     # Release the lock
-    instance_socket.close()
\ No newline at end of file
+    instance_socket.close()
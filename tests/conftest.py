@@ -0,0 +1,19 @@
+"""Shared fixtures: a fresh app on a temporary data directory per test."""
+
+import pytest
+
+from app import create_app
+from app.core.log_config import LOG_LEVELS_ENV, shutdown_logging
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv(LOG_LEVELS_ENV, "WARNING")
+    flask_app = create_app(str(tmp_path), max_loaded_profiles=2)
+    yield flask_app
+    shutdown_logging()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,40 @@
+"""Tests for atomic file replacement (core/atomic_file.py)."""
+
+import os
+import stat
+
+import pytest
+
+from app.core.atomic_file import atomic_write_text, atomic_writer
+
+
+def test_replaces_content_and_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "config.json"
+    atomic_write_text(target, "one")
+    atomic_write_text(target, "two")
+    assert target.read_text(encoding="utf-8") == "two"
+    assert os.listdir(tmp_path) == ["config.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_keeps_existing_permissions(tmp_path):
+    target = tmp_path / "config.json"
+    target.write_text("old", encoding="utf-8")
+    target.chmod(0o640)
+
+    atomic_write_text(target, "new")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    target = tmp_path / "calendar_log.json"
+    target.write_text("old", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with atomic_writer(target) as fp:
+            fp.write("partial")
+            raise RuntimeError("serialization failed")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["calendar_log.json"]
@@ -0,0 +1,118 @@
+"""Tests for calendar NDJSON/CSV export and import (core/calendar_io.py, /api/calendar/*)."""
+
+import io
+import json
+from datetime import date
+
+import pytest
+
+from app.core.calendar_io import CalendarImportError, iter_export, iter_import
+from app.core.calendar_log import MarkedDateEntry
+
+ENTRIES = [
+    (date(2024, 1, 1), MarkedDateEntry(rotation=-5, sticker="💖")),
+    (date(2024, 2, 29), MarkedDateEntry(rotation=0, sticker='",')),
+    (date(2025, 12, 31), MarkedDateEntry(rotation=15, sticker="X")),
+]
+
+
+def export_bytes(entries, fmt):
+    return "".join(iter_export(entries, fmt)).encode("utf-8")
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_export_import_round_trip(fmt):
+    imported = list(iter_import(io.BytesIO(export_bytes(ENTRIES, fmt)), fmt, batch_size=2))
+    assert imported == ENTRIES
+
+
+def test_csv_export_has_header():
+    assert export_bytes(ENTRIES[:1], "csv").decode().splitlines() == ["date,rotation,sticker", "2024-01-01,-5,💖"]
+
+
+def test_export_error_is_raised():
+    def broken_entries():
+        yield ENTRIES[0]
+        raise RuntimeError("disk gone")
+
+    # Re-raised so the chunked response is cut off instead of ending cleanly
+    with pytest.raises(RuntimeError, match="disk gone"):
+        list(iter_export(broken_entries(), "ndjson"))
+
+
+def test_import_reports_invalid_rows_with_line_numbers():
+    body = "\n".join([
+        json.dumps({"date": "2024-01-01", "rotation": 1, "sticker": "X"}),
+        "{not json",
+        json.dumps({"date": "2024-13-01", "rotation": 1, "sticker": "X"}),
+        "",
+        json.dumps({"date": "2024-01-03", "rotation": 99999, "sticker": "X"}),
+    ]).encode()
+
+    with pytest.raises(CalendarImportError) as excinfo:
+        list(iter_import(io.BytesIO(body), "ndjson", batch_size=2))
+
+    assert [error["line"] for error in excinfo.value.errors] == [2, 3, 5]
+
+
+def test_import_rejects_missing_csv_columns():
+    with pytest.raises(CalendarImportError) as excinfo:
+        list(iter_import(io.BytesIO(b"date,sticker\n2024-01-01,X\n"), "csv"))
+    assert "rotation" in excinfo.value.errors[0]["error"]
+
+
+def test_import_rejects_extra_csv_fields():
+    body = b"date,rotation,sticker\n2024-01-01,1,X\n2024-01-03,1,X,foo\n"
+
+    with pytest.raises(CalendarImportError) as excinfo:
+        list(iter_import(io.BytesIO(body), "csv"))
+
+    assert [error["line"] for error in excinfo.value.errors] == [3]
+
+
+def test_import_rejects_long_stickers():
+    body = "\n".join([
+        json.dumps({"date": "2024-01-01", "rotation": 1, "sticker": "❤️"}),
+        json.dumps({"date": "2024-01-02", "rotation": 1, "sticker": "X" * 1000}),
+    ]).encode()
+
+    with pytest.raises(CalendarImportError) as excinfo:
+        list(iter_import(io.BytesIO(body), "ndjson"))
+
+    assert [error["line"] for error in excinfo.value.errors] == [2]
+    assert "sticker" in excinfo.value.errors[0]["error"]
+
+
+def test_api_import_is_all_or_nothing(client):
+    client.post("/api/calendar/toggle", json={"date": "2030-05-05"})
+    body = b"date,rotation,sticker\n2024-01-01,1,X\n2024-01-02,oops,X\n"
+
+    response = client.post("/api/calendar/import?format=csv", data=body, content_type="text/csv")
+
+    assert response.status_code == 400
+    assert response.json["details"][0]["line"] == 3
+    assert list(client.get("/api/calendar_log").json["marked_dates"]) == ["2030-05-05"]
+
+
+def test_api_import_merge_and_replace(client):
+    client.post("/api/calendar/toggle", json={"date": "2030-05-05"})
+    body = export_bytes(ENTRIES, "ndjson")
+
+    merged = client.post("/api/calendar/import?format=ndjson", data=body).json
+    assert (merged["imported"], merged["added"], merged["updated"]) == (3, 3, 0)
+    assert len(client.get("/api/calendar_log").json["marked_dates"]) == 4
+
+    replaced = client.post("/api/calendar/import?format=ndjson&mode=replace", data=body).json
+    assert replaced["imported"] == 3
+    assert sorted(client.get("/api/calendar_log").json["marked_dates"]) == [d.isoformat() for d, _ in ENTRIES]
+
+
+def test_api_export_streams_every_date(client):
+    client.post("/api/calendar/import?format=ndjson", data=export_bytes(ENTRIES, "ndjson"))
+
+    response = client.get("/api/calendar/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.get_data(as_text=True) == export_bytes(ENTRIES, "csv").decode()
+    assert client.get("/api/calendar/export?format=xml").status_code == 400
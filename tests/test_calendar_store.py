@@ -0,0 +1,114 @@
+"""Tests for the compact calendar store (core/calendar_store.py) against the dict-based model."""
+
+import io
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.calendar_log import CalendarLogModel, MarkedDateEntry
+from app.core.calendar_store import CalendarStore, MAX_STICKERS, ROTATION_MAX, ROTATION_MIN
+
+STICKERS = ["X", "💖", "❤️", "🌚", 'q"uote\\', "✨"]
+START = date(2020, 1, 1)
+
+
+def as_model(reference):
+    """The previous in-memory form: a CalendarLogModel built from a plain dict."""
+    return CalendarLogModel(marked_dates={
+        day: MarkedDateEntry(rotation=rotation, sticker=sticker)
+        for day, (rotation, sticker) in sorted(reference.items())
+    })
+
+
+def assert_matches(store, reference):
+    model = as_model(reference)
+    assert len(store) == len(reference)
+    assert [(day, (entry.rotation, entry.sticker)) for day, entry in store.items()] == sorted(reference.items())
+    assert store.to_dict() == model.model_dump(mode="json")
+    buffer = io.StringIO()
+    store.write_json(buffer)
+    assert buffer.getvalue() == model.model_dump_json(indent=4)
+
+
+def random_entry(rng):
+    return rng.randint(-15, 15), rng.choice(STICKERS)
+
+
+def test_random_operations_match_dict_model():
+    rng = random.Random(1234)
+    store, reference = CalendarStore(), {}
+
+    for step in range(3000):
+        day = START + timedelta(days=rng.randrange(400))
+        action = rng.random()
+        if action < 0.6:
+            rotation, sticker = random_entry(rng)
+            assert store.set(day, rotation, sticker) == (day not in reference)
+            reference[day] = (rotation, sticker)
+        elif action < 0.9:
+            assert store.remove(day) == (day in reference)
+            reference.pop(day, None)
+        elif action < 0.99:
+            batch = {START + timedelta(days=rng.randrange(400)): random_entry(rng) for _ in range(rng.randrange(20))}
+            added, updated = store.merge(batch)
+            assert (added, updated) == (len(batch.keys() - reference.keys()), len(batch.keys() & reference.keys()))
+            reference.update(batch)
+        else:
+            store.clear()
+            reference.clear()
+
+        looked_up = store.get(day)
+        assert (tuple(looked_up) if looked_up else None) == reference.get(day)
+        if step % 250 == 0:
+            assert_matches(store, reference)
+
+    assert_matches(store, reference)
+
+
+def test_from_items_and_copy():
+    items = [(START + timedelta(days=offset), offset % 7, STICKERS[offset % 3]) for offset in (5, 1, 3, 1)]
+    store = CalendarStore.from_items(items)
+    reference = {day: (rotation, sticker) for day, rotation, sticker in items}
+    assert_matches(store, reference)
+
+    clone = store.copy()
+    clone.set(START, 0, "X")
+    assert START not in store
+    assert START in clone
+
+
+def test_empty_store_serializes_like_model():
+    assert_matches(CalendarStore(), {})
+
+
+def test_rotation_limits():
+    store = CalendarStore()
+    store.set(START, ROTATION_MIN, "X")
+    store.set(START, ROTATION_MAX, "X")
+    with pytest.raises(ValueError):
+        store.set(START, ROTATION_MAX + 1, "X")
+    with pytest.raises(ValueError):
+        store.merge({START: (ROTATION_MIN - 1, "X")})
+    assert store.get(START).rotation == ROTATION_MAX
+
+
+def test_unused_stickers_do_not_exhaust_the_table():
+    store = CalendarStore()
+    for index in range(MAX_STICKERS + 100):
+        store.set(START, 0, f"s{index}")
+    assert store.get(START).sticker == f"s{MAX_STICKERS + 99}"
+
+    store.clear()
+    store.merge({START + timedelta(days=index): (0, f"m{index}") for index in range(10)})
+    assert len(store._stickers) == 10
+
+
+def test_full_sticker_table_raises_without_changes():
+    store = CalendarStore.from_items((START + timedelta(days=index), 0, f"s{index}") for index in range(MAX_STICKERS))
+    with pytest.raises(ValueError):
+        store.set(START - timedelta(days=1), 0, "one too many")
+    with pytest.raises(ValueError):
+        store.merge({START - timedelta(days=1): (0, "one too many")})
+    assert len(store) == MAX_STICKERS
+    assert START - timedelta(days=1) not in store
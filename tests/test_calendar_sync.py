@@ -0,0 +1,90 @@
+"""Tests for incremental calendar sync (CalendarLog.changes_since, /api/calendar_log/changes)."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.calendar_log import CalendarLog, CHANGE_RING_SIZE
+
+DAY = date(2024, 3, 1)
+
+
+@pytest.fixture
+def log(tmp_path):
+    calendar_log = CalendarLog(tmp_path / "calendar_log.json")
+    calendar_log.load_or_create()
+    return calendar_log
+
+
+def toggle(log, day):
+    return log.toggle_date(day, "X", 0)
+
+
+def test_changes_since_returns_latest_state_per_date(log):
+    start = log.version
+    toggle(log, DAY)
+    toggle(log, DAY + timedelta(days=1))
+    toggle(log, DAY)  # Added then removed
+
+    result = log.changes_since(start)
+
+    assert result["snapshot"] is False
+    assert result["version"] == start + 3
+    assert result["changes"] == [
+        {"date": "2024-03-01", "status": "removed"},
+        {"date": "2024-03-02", "status": "added", "entry": {"rotation": 0, "sticker": "X"}},
+    ]
+    assert log.changes_since(result["version"])["changes"] == []
+
+
+def test_toggle_versions_are_consecutive(log):
+    first = toggle(log, DAY)["version"]
+    assert toggle(log, DAY)["version"] == first + 1
+
+
+def test_ring_overflow_falls_back_to_snapshot(log):
+    start = log.version
+    for offset in range(CHANGE_RING_SIZE + 1):
+        toggle(log, DAY + timedelta(days=offset))
+
+    assert log.changes_since(start)["snapshot"] is True
+    # A client that saw the first change is still covered by the ring
+    recent = log.changes_since(start + 1)
+    assert recent["snapshot"] is False
+    assert len(recent["changes"]) == CHANGE_RING_SIZE
+
+    snapshot = log.changes_since(start)
+    assert len(snapshot["marked_dates"]) == CHANGE_RING_SIZE + 1
+    assert snapshot["version"] == log.version
+
+
+@pytest.mark.parametrize("make_stale", [
+    lambda log: log.reset_log(),
+    lambda log: log.load_or_create(),
+])
+def test_reset_and_reload_start_a_new_history(log, make_stale):
+    toggle(log, DAY)
+    seen = log.version
+    make_stale(log)
+
+    assert log.version > seen
+    assert log.changes_since(seen)["snapshot"] is True
+
+
+def test_future_version_gets_snapshot(log):
+    assert log.changes_since(log.version + 10)["snapshot"] is True
+
+
+def test_changes_endpoint(client):
+    response = client.get("/api/calendar_log")
+    version = int(response.headers["X-Calendar-Version"])
+
+    toggled = client.post("/api/calendar/toggle", json={"date": "2024-03-01"})
+    assert int(toggled.headers["X-Calendar-Version"]) == version + 1
+
+    changes = client.get(f"/api/calendar_log/changes?since={version}")
+    assert changes.json["changes"][0]["date"] == "2024-03-01"
+    assert changes.headers["X-Calendar-Version"] == str(version + 1)
+
+    assert client.get("/api/calendar_log/changes?since=abc").status_code == 400
+    assert client.get("/api/calendar_log/changes").status_code == 400
@@ -0,0 +1,148 @@
+"""Tests for item-level custom timer / wheel option access (ConfigManager items, /api/timers, /api/wheel/options)."""
+
+from datetime import datetime
+
+import pytest
+
+from app.core import config_manager as config_module
+
+COLLECTIONS = [("/api/timers", "timers"), ("/api/wheel/options", "wheel_options")]
+
+
+def ids(page):
+    return [item["id"] for item in page["items"]]
+
+
+@pytest.mark.parametrize("url, _", COLLECTIONS)
+def test_crud_round_trip(client, url, _):
+    created = client.post(url, json={"label": "first"})
+    assert created.status_code == 201
+    item_id = created.json["id"]
+
+    assert client.get(f"{url}/{item_id}").json["label"] == "first"
+    assert client.patch(f"{url}/{item_id}", json={"label": "second"}).json["label"] == "second"
+    assert client.delete(f"{url}/{item_id}").json == {"status": "deleted", "id": item_id}
+    assert client.get(f"{url}/{item_id}").status_code == 404
+    assert client.patch(f"{url}/{item_id}", json={"label": "x"}).status_code == 404
+    assert client.delete(f"{url}/{item_id}").status_code == 404
+
+
+@pytest.mark.parametrize("url, _", COLLECTIONS)
+def test_id_cannot_be_changed_or_duplicated(client, url, _):
+    item_id = client.post(url, json={"id": "fixed", "label": "a"}).json["id"]
+    assert item_id == "fixed"
+
+    patched = client.patch(f"{url}/fixed", json={"id": "other", "label": "b"})
+    assert patched.json["id"] == "fixed"
+    assert client.put(f"{url}/fixed", json={"id": "other"}).json["id"] == "fixed"
+    assert client.get(f"{url}/other").status_code == 404
+    assert client.post(url, json={"id": "fixed"}).status_code == 400
+
+
+def test_put_replaces_and_patch_merges(client):
+    item_id = client.post("/api/timers", json={"label": "a", "enabled": False}).json["id"]
+
+    assert client.patch(f"/api/timers/{item_id}", json={"label": "b"}).json["enabled"] is False
+    replaced = client.put(f"/api/timers/{item_id}", json={"label": "c"}).json
+    assert (replaced["label"], replaced["enabled"]) == ("c", True)
+
+
+def test_invalid_item_is_rejected_without_changes(client):
+    item_id = client.post("/api/timers", json={"label": "ok"}).json["id"]
+
+    response = client.patch(f"/api/timers/{item_id}", json={"label": "x" * 51})
+
+    assert response.status_code == 400
+    assert response.json["details"][0]["loc"] == ["label"]
+    assert client.get(f"/api/timers/{item_id}").json["label"] == "ok"
+
+
+@pytest.mark.parametrize("url, kind", COLLECTIONS)
+def test_collection_limit(client, monkeypatch, url, kind):
+    limit_name = "MAX_CUSTOM_TIMERS" if kind == "timers" else "MAX_WHEEL_OPTIONS"
+    total = client.get(url).json["total"]
+    monkeypatch.setattr(config_module, limit_name, total + 2)
+
+    assert client.post(url, json={}).status_code == 201
+    assert client.post(url, json={}).status_code == 201
+    rejected = client.post(url, json={})
+    assert rejected.status_code == 400
+    assert "At most" in rejected.json["error"]
+
+
+def test_stored_config_is_not_capped(tmp_path):
+    # The caps apply to new items only; an existing larger config.json must load, not fall back to defaults
+    path = tmp_path / "config.json"
+    timers = [{"id": f"t{i}", "label": str(i)} for i in range(config_module.MAX_CUSTOM_TIMERS + 1)]
+    path.write_text(config_module.AppConfig(timers={"custom_timers": timers}).model_dump_json(), encoding="utf-8")
+
+    manager = config_module.ConfigManager(path)
+    manager.load_or_create_defaults()
+
+    assert len(manager.get_config().timers.custom_timers) == config_module.MAX_CUSTOM_TIMERS + 1
+    with pytest.raises(ValueError, match="At most"):
+        manager.create_item("timers", {})
+
+
+def test_pagination_and_sorting(client):
+    for timer_id in ids(client.get("/api/timers?limit=500").json):  # Drop the default sample timers
+        client.delete(f"/api/timers/{timer_id}")
+
+    dates = ["2031-01-01T00:00:00", "2001-01-01T00:00:00", "2041-01-01T00:00:00", "2011-01-01T00:00:00"]
+    for index, when in enumerate(dates):
+        client.post("/api/timers", json={"id": f"t{index}", "label": f"L{3 - index}", "date": when})
+
+    assert ids(client.get("/api/timers").json) == ["t0", "t1", "t2", "t3"]
+    assert ids(client.get("/api/timers?sort=date").json) == ["t1", "t3", "t0", "t2"]
+    assert ids(client.get("/api/timers?sort=date&order=desc").json) == ["t2", "t0", "t3", "t1"]
+    assert ids(client.get("/api/timers?sort=label").json) == ["t3", "t2", "t1", "t0"]
+
+    page = client.get("/api/timers?sort=date&offset=1&limit=2").json
+    assert (page["total"], page["offset"], page["limit"], ids(page)) == (4, 1, 2, ["t3", "t0"])
+
+    assert client.get("/api/timers?sort=bogus").status_code == 400
+    assert client.get("/api/timers?limit=0").status_code == 400
+    assert client.get("/api/timers?offset=-1").status_code == 400
+    assert client.get("/api/wheel/options?sort=date").status_code == 400
+
+
+def test_next_completion_order(tmp_path):
+    manager = config_module.ConfigManager(tmp_path / "config.json")
+    manager.update_config({"timers": {"custom_timers": []}})
+    for name, year in (("past_old", 2001), ("future_far", 2040), ("past_recent", 2020), ("future_near", 2030)):
+        manager.create_item("timers", {"id": name, "date": datetime(year, 1, 1)})
+
+    page = manager.list_items("timers", sort="next_completion", now=datetime(2025, 1, 1))
+
+    assert [timer.id for timer in page["items"]] == ["future_near", "future_far", "past_recent", "past_old"]
+
+
+def test_index_follows_deletes_and_full_updates(client):
+    created = [client.post("/api/wheel/options", json={"id": f"o{i}", "label": str(i)}).json["id"] for i in range(5)]
+    client.delete("/api/wheel/options/o1")
+    assert client.patch("/api/wheel/options/o4", json={"label": "four"}).json["label"] == "four"
+
+    config = client.get("/api/config").json
+    config["wheel_options"] = [option for option in config["wheel_options"] if option["id"] != "o0"]
+    client.post("/api/config", json=config)
+
+    assert client.get("/api/wheel/options/o0").status_code == 404
+    assert client.get("/api/wheel/options/o3").json["label"] == "3"
+    assert created == ["o0", "o1", "o2", "o3", "o4"]
+
+
+def test_config_save_without_collections_keeps_items(client):
+    # The settings page sends timers through /api/timers and leaves them out of the config POST
+    settings = client.get("/api/config").json
+    del settings["timers"]["custom_timers"]
+    del settings["wheel_options"]
+    timer_id = client.post("/api/timers", json={"label": "added meanwhile"}).json["id"]
+    client.post("/api/wheel/options", json={"id": "w1", "label": "kept"})
+
+    settings["blur_strength"] = 3
+    saved = client.post("/api/config", json=settings).json
+
+    assert saved["blur_strength"] == 3
+    assert timer_id in [timer["id"] for timer in saved["timers"]["custom_timers"]]
+    assert [option["id"] for option in saved["wheel_options"]] == ["w1"]
+    assert client.get(f"/api/timers/{timer_id}").json["label"] == "added meanwhile"
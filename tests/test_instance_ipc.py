@@ -0,0 +1,97 @@
+"""Tests for the second-launch handoff over the single-instance socket (run.py)."""
+
+import socket
+import threading
+
+import pytest
+
+import run
+
+
+@pytest.fixture
+def lock_socket():
+    sock = run.check_single_instance(0)  # Any free port
+    assert sock is not None
+    yield sock
+    sock.close()
+
+
+def port_of(sock: socket.socket) -> int:
+    return sock.getsockname()[1]
+
+
+def serve(lock_socket):
+    """Start answering requests; returns the list of pages passed to on_activate."""
+    activated = []
+    received = threading.Event()
+
+    def on_activate(page):
+        activated.append(page)
+        received.set()
+
+    run.serve_instance_requests(lock_socket, on_activate)
+    return activated, received
+
+
+def test_handoff_round_trip(lock_socket):
+    activated, received = serve(lock_socket)
+
+    assert run.request_handoff(port_of(lock_socket), "calendar") is True
+    assert received.wait(1)
+    assert activated == ["page-calendar"]
+
+
+def test_handoff_without_page(lock_socket):
+    activated, received = serve(lock_socket)
+
+    assert run.request_handoff(port_of(lock_socket)) is True
+    assert received.wait(1)
+    assert activated == [None]
+
+
+def test_listener_answers_several_launches(lock_socket):
+    activated, _ = serve(lock_socket)
+    port = port_of(lock_socket)
+
+    assert run.request_handoff(port, "wheel") is True
+    assert run.request_handoff(port, "settings") is True
+    assert activated == ["page-wheel", "page-settings"]
+
+
+def test_unknown_page_is_dropped(lock_socket):
+    activated, received = serve(lock_socket)
+
+    with socket.create_connection(("127.0.0.1", port_of(lock_socket)), timeout=1) as sock:
+        sock.sendall(b'{"cmd": "activate", "page": "page-nope"}\n')
+        assert sock.makefile("rb").readline() == b'{"ok": true}\n'
+    assert received.wait(1)
+    assert activated == [None]
+
+
+def test_unknown_command_is_refused(lock_socket):
+    activated, _ = serve(lock_socket)
+
+    with socket.create_connection(("127.0.0.1", port_of(lock_socket)), timeout=1) as sock:
+        sock.sendall(b'{"cmd": "quit"}\n')
+        assert sock.makefile("rb").readline() == b'{"ok": false}\n'
+    assert activated == []
+
+
+def test_no_listener_means_no_instance():
+    sock = run.check_single_instance(0)
+    port = port_of(sock)
+    sock.close()
+
+    assert run.request_handoff(port) is None
+
+
+def test_silent_listener_is_not_a_handoff(lock_socket, monkeypatch):
+    # Bound and listening but never answering: the launch must not treat it as handed off
+    monkeypatch.setattr(run, "IPC_TIMEOUT_S", 0.1)
+    lock_socket.listen(1)
+
+    assert run.request_handoff(port_of(lock_socket), "main") is False
+
+
+def test_second_bind_fails_while_locked(lock_socket):
+    assert run.check_single_instance(port_of(lock_socket)) is None
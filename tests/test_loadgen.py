@@ -0,0 +1,32 @@
+"""Tests for tools/loadgen.py helpers."""
+
+import pytest
+
+from tools.loadgen import percentile, parse_mix, settings_only
+
+
+@pytest.mark.parametrize("values, q, expected", [
+    (list(range(1, 11)), 50, 5),
+    (list(range(1, 11)), 90, 9),
+    (list(range(1, 11)), 99, 10),
+    (list(range(1, 11)), 0, 1),
+    ([1, 2], 50, 1),
+    ([7], 99, 7),
+    ([], 50, 0.0),
+])
+def test_percentile_nearest_rank(values, q, expected):
+    assert percentile(values, q) == expected
+
+
+def test_parse_mix_rejects_unknown_scenarios():
+    assert parse_mix("toggle=2,audio") == {"toggle": 2, "audio": 1}
+    with pytest.raises(ValueError):
+        parse_mix("bogus=1")
+
+
+def test_settings_only_drops_collections():
+    config = {"blur_strength": 1, "wheel_options": [{"id": "a"}],
+              "timers": {"limit_text_length": True, "custom_timers": [{"id": "t"}]}}
+
+    assert settings_only(config) == {"blur_strength": 1, "timers": {"limit_text_length": True}}
+    assert "custom_timers" in config["timers"]  # Input left alone
@@ -0,0 +1,103 @@
+"""Tests for logging setup (core/log_config.py): level parsing, env overrides and sampling."""
+
+import logging
+
+import pytest
+
+from app.core import log_config
+from app.core.log_config import (LOG_LEVELS_ENV, SamplingFilter, apply_config_levels, configure_logging,
+                                 parse_level, parse_level_spec, shutdown_logging)
+
+
+def make_record(msg="hit", level=logging.INFO, sample_key="route"):
+    record = logging.LogRecord("tests", level, __file__, 1, msg, None, None)
+    if sample_key is not None:
+        record.sample_key = sample_key
+    return record
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake time.monotonic() for SamplingFilter; advance it by assigning clock.now."""
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(log_config.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+def test_parse_level():
+    assert parse_level("warning") == logging.WARNING
+    assert parse_level(" Debug ") == logging.DEBUG
+    assert parse_level(15) == 15
+    with pytest.raises(ValueError):
+        parse_level("loud")
+
+
+def test_parse_level_spec():
+    assert parse_level_spec("INFO, app.api=WARNING,werkzeug = error,") == {
+        "": logging.INFO, "app.api": logging.WARNING, "werkzeug": logging.ERROR,
+    }
+    assert parse_level_spec("") == {}
+    with pytest.raises(ValueError):
+        parse_level_spec("app=LOUD")
+
+
+def test_environment_wins_over_config(monkeypatch):
+    monkeypatch.setenv(LOG_LEVELS_ENV, "tests.env_wins=WARNING")
+
+    apply_config_levels({"tests.env_wins": "DEBUG", "tests.config_only": "ERROR", "tests.bad": "LOUD"})
+
+    assert logging.getLogger("tests.env_wins").level == logging.WARNING
+    assert logging.getLogger("tests.config_only").level == logging.ERROR
+    assert logging.getLogger("tests.bad").level == logging.NOTSET
+
+
+def test_invalid_environment_is_ignored(monkeypatch):
+    monkeypatch.setenv(LOG_LEVELS_ENV, "tests.invalid_env=LOUD")
+
+    apply_config_levels({"tests.invalid_env": "ERROR"})
+
+    assert logging.getLogger("tests.invalid_env").level == logging.ERROR
+
+
+def test_sampling_allows_a_burst_then_the_rate(clock):
+    sampler = SamplingFilter(rate_per_s=2.0, burst=3)
+
+    assert [sampler.filter(make_record()) for _ in range(5)] == [True, True, True, False, False]
+
+    clock.now += 0.5  # One token at 2/s
+    record = make_record()
+    assert sampler.filter(record)
+    assert record.msg == "hit (+2 similar suppressed)"
+    assert not sampler.filter(make_record())
+
+
+def test_sampling_keys_are_independent(clock):
+    sampler = SamplingFilter(rate_per_s=1.0, burst=1)
+
+    assert sampler.filter(make_record(sample_key="a"))
+    assert not sampler.filter(make_record(sample_key="a"))
+    assert sampler.filter(make_record(sample_key="b"))
+
+
+def test_unsampled_and_warning_records_always_pass(clock):
+    sampler = SamplingFilter(rate_per_s=1.0, burst=1)
+    sampler.filter(make_record())
+
+    assert all(sampler.filter(make_record(sample_key=None)) for _ in range(10))
+    assert all(sampler.filter(make_record(level=logging.WARNING)) for _ in range(10))
+    record = make_record()
+    assert not sampler.filter(record)  # Warnings did not use up or reset the bucket
+
+
+def test_records_reach_the_log_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(LOG_LEVELS_ENV, "")
+    configure_logging(tmp_path, console=False)
+    try:
+        logging.getLogger("tests.file").info("written by the listener %s", 42)
+    finally:
+        shutdown_logging()
+
+    text = (tmp_path / "logs" / "lovetimer.log").read_text(encoding="utf-8")
+    assert "tests.file: written by the listener 42" in text
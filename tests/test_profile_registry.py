@@ -0,0 +1,223 @@
+"""Tests for the LRU profile registry (core/profile_registry.py, /api/p/<profile>/...)."""
+
+import threading
+from datetime import date
+
+import pytest
+
+from app import create_app, profile_registry
+from app.core.log_config import shutdown_logging
+from app.core.profile_registry import Profile, ProfileRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    profiles = ProfileRegistry()
+    profiles.init_app(tmp_path / "profiles", max_loaded=2)
+    for name in ("a", "b", "c", "d", "e", "fast", "slow", "shared"):
+        profiles.create(name)
+    return profiles
+
+
+def use(registry, name):
+    registry.release(registry.acquire(name))
+
+
+def test_least_recently_used_profile_is_evicted(registry):
+    for name in ("a", "b", "c"):
+        use(registry, name)
+    assert registry.loaded_names() == ["b", "c"]
+
+    use(registry, "b")
+    use(registry, "d")
+    assert registry.loaded_names() == ["b", "d"]
+
+
+def test_profiles_in_use_are_pinned(registry):
+    held = registry.acquire("a")
+    for name in ("b", "c", "d"):
+        use(registry, name)
+    assert "a" in registry.loaded_names()
+    assert len(registry.loaded_names()) == 2
+
+    registry.release(held)
+    use(registry, "e")
+    assert "a" not in registry.loaded_names()
+
+
+@pytest.mark.parametrize("name", ["", "../x", "a/b", ".hidden", "x" * 65])
+def test_invalid_names_are_rejected(registry, name):
+    with pytest.raises(ValueError):
+        registry.acquire(name)
+
+
+def test_unknown_profiles_are_not_created(registry, tmp_path):
+    with pytest.raises(KeyError):
+        registry.acquire("stranger")
+    assert not (tmp_path / "profiles" / "stranger").exists()
+    assert not registry.exists("stranger")
+
+    registry.create("stranger")
+    use(registry, "stranger")
+    assert registry.exists("stranger")
+    assert (tmp_path / "profiles" / "stranger" / "config.json").is_file()
+
+
+def test_evicted_profile_reloads_from_disk(registry):
+    profile = registry.acquire("a")
+    profile.calendar_log.toggle_date(date(2024, 1, 1), "X", 0)
+    registry.release(profile)
+    use(registry, "b")
+    use(registry, "c")
+    assert "a" not in registry.loaded_names()
+
+    profile = registry.acquire("a")
+    assert len(profile.calendar_log.get_log().marked_dates) == 1
+    registry.release(profile)
+
+
+def test_slow_load_does_not_block_other_profiles(registry, monkeypatch):
+    use(registry, "fast")
+    loading, finish = threading.Event(), threading.Event()
+    original_load = ProfileRegistry._load
+
+    def slow_load(self, name):
+        if name == "slow":
+            loading.set()
+            finish.wait(5)
+        return original_load(self, name)
+
+    monkeypatch.setattr(ProfileRegistry, "_load", slow_load)
+    worker = threading.Thread(target=use, args=(registry, "slow"))
+    worker.start()
+    try:
+        assert loading.wait(5)
+        done = threading.Event()
+        other = threading.Thread(target=lambda: (use(registry, "fast"), done.set()))
+        other.start()
+        assert done.wait(2), "a cached profile waited for another profile's load"
+        other.join()
+    finally:
+        finish.set()
+        worker.join()
+    assert "slow" in registry.loaded_names()
+
+
+def slow_flush_of(monkeypatch, name):
+    """Make flushing profile `name` block until the returned `finish` event is set."""
+    flushing, finish = threading.Event(), threading.Event()
+    original_flush = Profile.flush
+
+    def slow_flush(profile):
+        if profile.name == name:
+            flushing.set()
+            finish.wait(5)
+        return original_flush(profile)
+
+    monkeypatch.setattr(Profile, "flush", slow_flush)
+    return flushing, finish
+
+
+def test_slow_eviction_flush_does_not_block_other_profiles(registry, monkeypatch):
+    use(registry, "a")
+    use(registry, "b")
+    flushing, finish = slow_flush_of(monkeypatch, "a")
+    evictor = threading.Thread(target=use, args=(registry, "c"))  # Evicts "a"
+    evictor.start()
+    try:
+        assert flushing.wait(5)
+        done = threading.Event()
+        other = threading.Thread(target=lambda: (use(registry, "b"), done.set()))
+        other.start()
+        assert done.wait(2), "a request waited for another profile's eviction flush"
+        other.join()
+    finally:
+        finish.set()
+        evictor.join()
+    assert "a" not in registry.loaded_names()
+
+
+def test_profile_taken_back_while_flushing_keeps_its_state(registry, monkeypatch):
+    profile = registry.acquire("a")
+    profile.calendar_log.toggle_date(date(2024, 1, 1), "X", 0)
+    registry.release(profile)
+    use(registry, "b")
+    flushing, finish = slow_flush_of(monkeypatch, "a")
+    evictor = threading.Thread(target=use, args=(registry, "c"))
+    evictor.start()
+    try:
+        assert flushing.wait(5)
+        again = registry.acquire("a")  # Not reloaded from disk mid-flush
+        assert again is profile
+        registry.release(again)
+    finally:
+        finish.set()
+        evictor.join()
+    assert len(registry.acquire("a").calendar_log.get_log().marked_dates) == 1
+
+
+def test_profile_that_cannot_be_flushed_stays_loaded(registry, monkeypatch):
+    use(registry, "a")
+    use(registry, "b")
+    monkeypatch.setattr(Profile, "flush", lambda profile: profile.name != "a")
+
+    use(registry, "c")
+
+    assert registry.loaded_names() == ["a", "b", "c"]
+
+
+def test_concurrent_first_access_loads_once(registry, monkeypatch):
+    calls = []
+    original_load = ProfileRegistry._load
+    barrier = threading.Barrier(4)
+
+    def counting_load(self, name):
+        calls.append(name)
+        return original_load(self, name)
+
+    monkeypatch.setattr(ProfileRegistry, "_load", counting_load)
+    acquired = []
+
+    def worker():
+        barrier.wait()
+        acquired.append(registry.acquire("shared"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["shared"]
+    assert len({id(profile) for profile in acquired}) == 1
+    assert acquired[0].in_use == 4
+
+
+def test_profile_api_is_isolated(client):
+    for name in ("alice", "bob"):
+        profile_registry.create(name)
+    client.post("/api/p/alice/calendar/toggle", json={"date": "2024-01-01"})
+
+    assert list(client.get("/api/p/alice/calendar_log").json["marked_dates"]) == ["2024-01-01"]
+    assert client.get("/api/p/bob/calendar_log").json["marked_dates"] == {}
+    assert client.get("/api/calendar_log").json["marked_dates"] == {}
+    assert client.get("/api/p/..%2Fetc/config").status_code == 404
+
+
+def test_unknown_profile_returns_404(client, tmp_path):
+    assert client.get("/api/p/stranger/config").status_code == 404
+    assert client.post("/api/p/stranger/calendar/toggle", json={"date": "2024-01-01"}).status_code == 404
+    assert client.get("/p/stranger/").status_code == 404
+    assert not (tmp_path / "profiles" / "stranger").exists()
+
+
+def test_profiles_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOVETIMER_LOG_LEVELS", "WARNING")
+    monkeypatch.setenv("LOVETIMER_PROFILES", "alice, bob,../bad")
+    try:
+        client = create_app(str(tmp_path)).test_client()
+        assert client.get("/api/p/alice/config").status_code == 200
+        assert client.get("/p/bob/").status_code == 200
+        assert sorted(path.name for path in (tmp_path / "profiles").iterdir()) == ["alice", "bob"]
+    finally:
+        shutdown_logging()
@@ -0,0 +1,45 @@
+"""Tests for static/js/wheel_engine.js, run through Node (skipped if Node is missing)."""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ENGINE_PATH = Path(__file__).resolve().parents[1] / "app" / "static" / "js" / "wheel_engine.js"
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def run_node(script: str):
+    """Run a snippet with WheelEngine/mulberry32 in scope and return its JSON output."""
+    source = f"const {{ WheelEngine, mulberry32 }} = require({json.dumps(str(ENGINE_PATH))});\n{script}"
+    result = subprocess.run(["node", "-e", source], capture_output=True, text=True, check=True, timeout=30)
+    return json.loads(result.stdout)
+
+
+def test_sector_at_matches_pointer():
+    # 4 sectors drawn clockwise from 0deg; rotating the wheel by +a moves
+    # the slice at -a under the top pointer.
+    angles = [0, 10, 89, 91, 180, 185, 269, 271, 359, 370, -10]
+    sectors = run_node(f"""
+        const engine = new WheelEngine({{ sectorCount: 4 }});
+        console.log(JSON.stringify({json.dumps(angles)}.map(a => engine.sectorAt(a))));
+    """)
+    assert sectors == [0, 3, 3, 2, 2, 1, 1, 0, 0, 3, 0]
+
+
+def test_seeded_spin_is_reproducible():
+    results = run_node("""
+        const spinOnce = () => {
+            const engine = new WheelEngine({ sectorCount: 7, seed: 42 });
+            engine.spin();
+            return engine.runUntilRest();
+        };
+        console.log(JSON.stringify([spinOnce(), spinOnce()]));
+    """)
+    first, second = results
+    assert first == second
+    assert 0 <= first["sector"] < 7
+    assert first["crossings"] > 0
@@ -0,0 +1,3 @@
+"""
+Developer tools for the Relationship Countdown Timer (not shipped in the .exe).
+"""
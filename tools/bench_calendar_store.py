@@ -0,0 +1,103 @@
+"""
+Memory and serialization benchmark: CalendarStore vs. the Pydantic model.
+
+Builds a calendar log with N marked dates both as a CalendarLogModel (one
+MarkedDateEntry per date, the previous in-memory form) and as a
+CalendarStore, then reports retained memory and the time to produce the
+calendar_log.json text and the /api/calendar_log dict.
+
+Usage:
+    python -m tools.bench_calendar_store --sizes 100000 1000000
+"""
+
+import io
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, List, Tuple, Any
+
+from app.core.calendar_log import CalendarLogModel, MarkedDateEntry
+from app.core.calendar_store import CalendarStore
+
+# --- Constants ---
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+START_DATE = date(1000, 1, 1)    # Leaves room for several million consecutive days
+STICKERS = ["X", "💖", "❤️", "🌚", "✨"]
+
+
+def make_items(count: int, seed: int = 0) -> List[Tuple[date, int, str]]:
+    """Consecutive dates with random rotations and stickers."""
+    rng = random.Random(seed)
+    return [(START_DATE + timedelta(days=i), rng.randint(-15, 15), rng.choice(STICKERS))
+            for i in range(count)]
+
+
+def measure_memory(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Build an object and return it with the bytes still allocated afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, retained
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Wall time of one call in seconds."""
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def write_store(store: CalendarStore) -> str:
+    buffer = io.StringIO()
+    store.write_json(buffer)
+    return buffer.getvalue()
+
+
+def run(count: int) -> List[str]:
+    """Benchmark one size and return report lines."""
+    items = make_items(count)
+
+    model, model_bytes = measure_memory(lambda: CalendarLogModel(marked_dates={
+        day: MarkedDateEntry(rotation=rotation, sticker=sticker) for day, rotation, sticker in items
+    }))
+    store, store_bytes = measure_memory(lambda: CalendarStore.from_items(items))
+
+    file_text = model.model_dump_json(indent=4)
+    assert write_store(store) == file_text, "CalendarStore output differs from model_dump_json"
+
+    rows = [
+        ("retained memory (MB)", model_bytes / 1e6, store_bytes / 1e6),
+        ("bytes per entry", model_bytes / count, store_bytes / count),
+        ("file JSON write (s)", timed(lambda: model.model_dump_json(indent=4)), timed(lambda: write_store(store))),
+        ("API dict (s)", timed(lambda: model.model_dump(mode="json")), timed(store.to_dict)),
+        ("load + validate (s)", timed(lambda: CalendarLogModel.model_validate_json(file_text)),
+         timed(lambda: CalendarStore.from_items(
+             (day, entry.rotation, entry.sticker)
+             for day, entry in CalendarLogModel.model_validate_json(file_text).marked_dates.items()))),
+    ]
+    lines = [f"--- {count:,} entries (file: {len(file_text.encode('utf-8')) / 1e6:.1f} MB) ---",
+             f"{'':<24}{'pydantic':>12}{'store':>12}{'ratio':>8}"]
+    for label, before, after in rows:
+        ratio = before / after if after else float("inf")
+        lines.append(f"{label:<24}{before:>12.2f}{after:>12.2f}{ratio:>7.1f}x")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compact calendar store.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Entry counts to test.")
+    args = parser.parse_args()
+    for count in args.sizes:
+        print("\n".join(run(count)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Local load generator for a running (headless) LoveTimer server.
+
+Replays the traffic a browser produces — page loads, calendar toggles,
+audio fetches and settings saves — from several concurrent clients and
+reports throughput and p50/p99 latency per request type.
+
+Usage:
+    python run.py --headless --port 8000
+    python -m tools.loadgen --url http://127.0.0.1:8000 --clients 16 --duration 30
+
+Only the standard library is used, so it runs anywhere Python does.
+"""
+
+import json
+import math
+import time
+import random
+import argparse
+import threading
+import http.client
+from datetime import date, timedelta
+from urllib.parse import urlsplit, quote
+from typing import Dict, List, Optional, Tuple, Callable, Iterable
+
+# --- Constants ---
+
+DEFAULT_MIX: Dict[str, int] = {
+    "page_load": 1,     # GET config, calendar_log, defaults, audio_manifest
+    "toggle": 6,        # POST /calendar/toggle
+    "audio": 4,         # GET /audio/<category>/<file>
+    "config_save": 1,   # GET /config, then POST its settings back
+}
+TOGGLE_DAYS = 365       # Toggles hit random dates within this many days
+REQUEST_TIMEOUT_S = 10
+
+# --- Helpers ---
+
+def settings_only(config: Dict) -> Dict:
+    """A config without its custom timers and wheel options.
+
+    The settings page saves those through the item API and leaves them out
+    of POST /config, which then keeps the stored ones.
+    """
+    settings = dict(config)
+    settings.pop("wheel_options", None)
+    if isinstance(settings.get("timers"), dict):
+        settings["timers"] = {key: value for key, value in settings["timers"].items() if key != "custom_timers"}
+    return settings
+
+# --- Statistics ---
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Stats:
+    """Thread-safe collection of per-request latencies and failures."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, label: str, latency_s: float, ok: bool):
+        """Store one request outcome."""
+        with self._lock:
+            self.latencies.setdefault(label, []).append(latency_s)
+            if not ok:
+                self.errors[label] = self.errors.get(label, 0) + 1
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(len(values) for values in self.latencies.values())
+
+    def format_report(self, elapsed_s: float) -> str:
+        """Render a plain-text summary table."""
+        lines = [f"{'request':<16}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        all_values: List[float] = []
+        with self._lock:
+            for label in sorted(self.latencies):
+                values = sorted(self.latencies[label])
+                all_values.extend(values)
+                lines.append(
+                    f"{label:<16}{len(values):>8}{self.errors.get(label, 0):>8}"
+                    f"{percentile(values, 50) * 1000:>10.2f}{percentile(values, 99) * 1000:>10.2f}"
+                    f"{values[-1] * 1000:>10.2f}"
+                )
+            total_errors = sum(self.errors.values())
+        all_values.sort()
+        lines.append(
+            f"{'TOTAL':<16}{len(all_values):>8}{total_errors:>8}"
+            f"{percentile(all_values, 50) * 1000:>10.2f}{percentile(all_values, 99) * 1000:>10.2f}"
+            f"{(all_values[-1] if all_values else 0) * 1000:>10.2f}"
+        )
+        throughput = len(all_values) / elapsed_s if elapsed_s > 0 else 0.0
+        lines.append(f"Elapsed: {elapsed_s:.1f}s, throughput: {throughput:.1f} req/s")
+        return "\n".join(lines)
+
+# --- Client ---
+
+class Client:
+    """One simulated browser.
+
+    The server closes the connection after every response; http.client
+    reconnects transparently on the next request.
+    """
+
+    def __init__(self, base_url: str, stats: Stats, rng: random.Random, api_base: str = "/api"):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.api = api_base.rstrip("/")
+        self.stats = stats
+        self.rng = rng
+        self.audio_files: List[str] = []
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def request(self, label: str, method: str, path: str,
+                payload: Optional[dict] = None) -> Tuple[int, bytes]:
+        """Send one request, record its latency and return (status, body).
+
+        Connection errors are recorded as failures with status 0.
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        start = time.perf_counter()
+        try:
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=REQUEST_TIMEOUT_S)
+            self._conn.request(method, path, body=body, headers=headers)
+            response = self._conn.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.close()
+            status, data = 0, b""
+        self.stats.record(label, time.perf_counter() - start, 200 <= status < 400)
+        return status, data
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Scenarios ---
+
+    def page_load(self):
+        """The four requests the SPA sends on startup."""
+        self.request("config", "GET", f"{self.api}/config")
+        self.request("calendar_log", "GET", f"{self.api}/calendar_log")
+        self.request("defaults", "GET", f"{self.api}/config/defaults")
+        status, data = self.request("audio_manifest", "GET", f"{self.api}/audio_manifest")
+        if status == 200:
+            manifest = json.loads(data or b"{}")
+            self.audio_files = [path for files in manifest.values() for path in files]
+
+    def toggle(self):
+        """Click a random calendar day."""
+        day = date.today() + timedelta(days=self.rng.randrange(TOGGLE_DAYS))
+        self.request("toggle", "POST", f"{self.api}/calendar/toggle", {"date": day.isoformat()})
+
+    def audio(self):
+        """Fetch a random sound file (falls back to the manifest if there are none)."""
+        if not self.audio_files:
+            self.request("audio_manifest", "GET", f"{self.api}/audio_manifest")
+            return
+        self.request("audio", "GET", quote(self.rng.choice(self.audio_files)))
+
+    def config_save(self):
+        """Read the config and save its settings back unchanged, as the settings page does."""
+        status, data = self.request("config", "GET", f"{self.api}/config")
+        if status == 200:
+            self.request("config_save", "POST", f"{self.api}/config", settings_only(json.loads(data)))
+
+# --- Runner ---
+
+def parse_mix(spec: str, known: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Parse "toggle=6,audio=4" into a weight dict.
+
+    Args:
+        spec: Comma-separated name=weight pairs (a bare name means weight 1).
+        known: Accepted scenario names (defaults to the DEFAULT_MIX scenarios).
+
+    Raises:
+        ValueError: On unknown scenarios or malformed weights.
+    """
+    known = list(known) if known is not None else list(DEFAULT_MIX)
+    mix: Dict[str, int] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in known:
+            raise ValueError(f"Unknown scenario: {name} (expected one of {', '.join(known)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def run_load(base_url: str, clients: int, duration_s: float,
+             mix: Optional[Dict[str, int]] = None, seed: Optional[int] = None,
+             api_base: str = "/api",
+             stats: Optional[Stats] = None,
+             extra_scenarios: Optional[Dict[str, Callable[[Client], None]]] = None) -> Tuple[Stats, float]:
+    """Drive `clients` concurrent clients against base_url for duration_s seconds.
+
+    Args:
+        base_url: Server root, e.g. "http://127.0.0.1:8000".
+        clients: Number of concurrent client threads.
+        duration_s: Test length in seconds.
+        mix: Scenario weights (defaults to DEFAULT_MIX).
+        seed: Seed for reproducible traffic.
+        api_base: API root path, e.g. "/api/p/<profile>" to load a single profile.
+        stats: Existing Stats to record into.
+        extra_scenarios: Additional name -> callable(Client) scenarios referenced by `mix`.
+
+    Returns:
+        (stats, elapsed_seconds)
+    """
+    mix = mix or DEFAULT_MIX
+    stats = stats or Stats()
+    master_rng = random.Random(seed)
+    scenarios = {name: getattr(Client, name) for name in DEFAULT_MIX}
+    scenarios.update(extra_scenarios or {})
+    names = [name for name in mix if mix[name] > 0]
+    weights = [mix[name] for name in names]
+    deadline = time.perf_counter() + duration_s
+
+    def worker(client_seed: int):
+        client = Client(base_url, stats, random.Random(client_seed), api_base)
+        client.page_load()
+        while time.perf_counter() < deadline:
+            scenarios[client.rng.choices(names, weights)[0]](client)
+        client.close()
+
+    threads = [threading.Thread(target=worker, args=(master_rng.randrange(2 ** 32),), daemon=True)
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay LoveTimer traffic against a running server.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Server root URL.")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test length in seconds.")
+    parser.add_argument("--mix", default="", help="Scenario weights, e.g. toggle=6,audio=4,page_load=1,config_save=1")
+    parser.add_argument("--api", default="/api", help="API root path, e.g. /api/p/<profile>.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible traffic.")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+    print(f"Driving {args.url} with {args.clients} clients for {args.duration:.0f}s, mix: {mix}")
+    stats, elapsed = run_load(args.url, args.clients, args.duration, mix, args.seed, args.api)
+    print(stats.format_report(elapsed))
+
+
+if __name__ == "__main__":
+    main()
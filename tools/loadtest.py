@@ -0,0 +1,420 @@
+"""
+End-to-end load test with write accounting and consistency checks.
+
+Starts the app in-process on the pooled headless server (real sockets, a
+throwaway data directory), drives it with tools.loadgen clients and then
+reports, besides throughput and latency:
+
+* Write amplification: how many times config.json / calendar_log.json
+  were rewritten and how many bytes that cost per logical operation.
+* Corrupted files: a reader thread keeps parsing both files while the
+  test runs; any read that is not a valid document is counted.
+* Lost updates: every client owns a disjoint set of calendar dates and
+  custom timers and remembers what it last wrote. After the run the files
+  on disk are compared with those expectations.
+
+Usage:
+    python -m tools.loadtest --clients 16 --duration 20
+    python -m tools.loadtest --mix owned_toggle=6,audio=4,timer_edit=2 --threads 4
+
+config_save posts back only the settings, as the settings page does, so
+it must not lose concurrent timer edits.
+"""
+
+import os
+import json
+import random
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+from app import create_app
+from app import config_manager as default_config_manager, calendar_log as default_calendar_log, SOUND_FOLDERS
+from app.server import PooledWSGIServer, DEFAULT_THREADS
+from app.core.config_manager import ConfigManager, AppConfig
+from app.core.calendar_log import CalendarLog, CalendarLogModel
+from app.core.log_config import LOG_LEVELS_ENV, shutdown_logging
+from tools.loadgen import Client, Stats, DEFAULT_MIX as LOADGEN_MIX, parse_mix, run_load, settings_only
+
+# --- Constants ---
+
+DEFAULT_MIX: Dict[str, int] = {
+    "page_load": 1,
+    "owned_toggle": 6,  # Toggle one of the client's own dates (tracked)
+    "audio": 4,
+    "config_save": 1,
+    "timer_edit": 2,    # Create / rename / delete one of the client's own timers (tracked)
+}
+OWNED_START_DATE = date(2000, 1, 1)  # Far from the dates the plain "toggle" scenario uses
+OWNED_DAYS_PER_CLIENT = 64
+TIMERS_PER_CLIENT = 8
+AUDIO_FILES_PER_CATEGORY = 3
+AUDIO_FILE_BYTES = 64 * 1024
+FILE_CHECK_INTERVAL_S = 0.002
+CONFIG_FILE = "config.json"
+CALENDAR_FILE = "calendar_log.json"
+DATA_DIR_MARKER = ".lovetimer-loadtest"  # Marks directories this tool created (safe to overwrite)
+
+# --- Write Accounting ---
+
+class WriteMeter:
+    """Counts whole-file saves (and their size) made by ConfigManager and CalendarLog.
+
+    Wraps both classes' _save() for the duration of the test; every
+    successful save rewrites the complete file, so its size after the
+    write is the number of bytes written.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.saves: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+        self._originals: List[Tuple[type, Any]] = []
+
+    def install(self):
+        for cls, path_attr in ((ConfigManager, "config_path"), (CalendarLog, "log_path")):
+            original = cls._save
+            self._originals.append((cls, original))
+
+            def metered_save(manager, _original=original, _path_attr=path_attr):
+                _original(manager)
+                path = getattr(manager, _path_attr)
+                if path is not None and not manager._dirty:
+                    self._record(path.name, path.stat().st_size)
+
+            cls._save = metered_save
+
+    def uninstall(self):
+        for cls, original in self._originals:
+            cls._save = original
+        self._originals.clear()
+
+    def _record(self, name: str, size: int):
+        with self._lock:
+            self.saves[name] = self.saves.get(name, 0) + 1
+            self.bytes[name] = self.bytes.get(name, 0) + size
+
+    def reset(self):
+        with self._lock:
+            self.saves.clear()
+            self.bytes.clear()
+
+
+# --- File Checks ---
+
+class FileChecker:
+    """Background reader that parses the data files while they are being written."""
+
+    VALIDATORS = {
+        CONFIG_FILE: AppConfig.model_validate_json,
+        CALENDAR_FILE: CalendarLogModel.model_validate_json,
+    }
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self.reads: Dict[str, int] = {name: 0 for name in self.VALIDATORS}
+        self.corrupt: Dict[str, int] = {name: 0 for name in self.VALIDATORS}
+        self.samples: Dict[str, str] = {}   # First error per file
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="file-checker", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            for name, validate in self.VALIDATORS.items():
+                self.check(name, validate)
+            self._stop.wait(FILE_CHECK_INTERVAL_S)
+
+    def check(self, name: str, validate=None) -> bool:
+        """Parse one file now; returns False (and counts it) if it is not valid."""
+        validate = validate or self.VALIDATORS[name]
+        try:
+            text = (self.data_dir / name).read_text(encoding="utf-8")
+        except FileNotFoundError as e:
+            error = f"missing: {e}"
+        except OSError:
+            return True  # Locked by the writer (Windows); not a corruption
+        else:
+            try:
+                validate(text)
+                error = None
+            except ValueError as e:
+                error = f"{len(text)} bytes: {str(e).splitlines()[0]}"
+        self.reads[name] += 1
+        if error is None:
+            return True
+        self.corrupt[name] += 1
+        self.samples.setdefault(name, error)
+        return False
+
+
+# --- Tracked Scenarios ---
+
+class ConsistencyTracker:
+    """Scenarios whose effects each client can predict, plus the expected end state.
+
+    Each client gets a slot on first use. A slot owns the calendar dates
+    OWNED_START_DATE + (k * clients + slot) days and the timers it created,
+    so no two clients ever write the same item and the last successful
+    response for an item is its expected final state.
+    """
+
+    def __init__(self, clients: int):
+        self.clients = clients
+        self._lock = threading.Lock()
+        self._slots: Dict[int, int] = {}
+        self.expected_dates: Dict[date, bool] = {}      # date -> marked?
+        self.uncertain_dates: Set[date] = set()         # Request failed: outcome unknown
+        self.expected_timers: Dict[str, Optional[str]] = {}  # id -> label (None = deleted)
+        self.uncertain_timers: Set[str] = set()
+        self._owned_timers: Dict[int, List[str]] = {}
+        self.ops: Dict[str, int] = {"toggle": 0, "config_save": 0, "timer": 0}
+
+    def _slot(self, client: Client) -> int:
+        with self._lock:
+            return self._slots.setdefault(id(client), len(self._slots))
+
+    def _count(self, op: str):
+        with self._lock:
+            self.ops[op] += 1
+
+    def owned_toggle(self, client: Client):
+        """Toggle one of this client's dates and remember the result."""
+        slot = self._slot(client)
+        day = OWNED_START_DATE + timedelta(days=client.rng.randrange(OWNED_DAYS_PER_CLIENT) * self.clients + slot)
+        status, data = client.request("owned_toggle", "POST", f"{client.api}/calendar/toggle",
+                                      {"date": day.isoformat()})
+        with self._lock:
+            if status == 200:
+                self.expected_dates[day] = json.loads(data)["status"] == "added"
+                self.uncertain_dates.discard(day)
+                self.ops["toggle"] += 1
+            else:
+                self.uncertain_dates.add(day)
+
+    def config_save(self, client: Client):
+        """Loadgen's read-modify-write settings save, counted as a logical write."""
+        status, data = client.request("config", "GET", f"{client.api}/config")
+        if status != 200:
+            return
+        status, _ = client.request("config_save", "POST", f"{client.api}/config", settings_only(json.loads(data)))
+        if status == 200:
+            self._count("config_save")
+
+    def timer_edit(self, client: Client):
+        """Create, rename or delete one of this client's timers."""
+        slot = self._slot(client)
+        with self._lock:
+            owned = self._owned_timers.setdefault(slot, [])
+            owned_ids = list(owned)
+        roll = client.rng.random()
+
+        if not owned_ids or (len(owned_ids) < TIMERS_PER_CLIENT and roll < 0.4):
+            label = f"c{slot}-{client.rng.randrange(10 ** 6)}"
+            status, data = client.request("timer_create", "POST", f"{client.api}/timers", {"label": label})
+            if status == 201:
+                timer_id = json.loads(data)["id"]
+                with self._lock:
+                    owned.append(timer_id)
+                    self.expected_timers[timer_id] = label
+                    self.ops["timer"] += 1
+            return
+
+        timer_id = client.rng.choice(owned_ids)
+        if roll < 0.85:
+            label = f"c{slot}-{client.rng.randrange(10 ** 6)}"
+            status, _ = client.request("timer_update", "PATCH", f"{client.api}/timers/{timer_id}", {"label": label})
+            outcome = label
+        else:
+            status, _ = client.request("timer_delete", "DELETE", f"{client.api}/timers/{timer_id}")
+            outcome = None
+
+        with self._lock:
+            if status == 200:
+                self.expected_timers[timer_id] = outcome
+                self.uncertain_timers.discard(timer_id)
+                self.ops["timer"] += 1
+                if outcome is None:
+                    owned.remove(timer_id)
+            elif status == 404:
+                # Already gone on the server: a concurrent full-config save dropped it
+                owned.remove(timer_id)
+            else:
+                self.uncertain_timers.add(timer_id)
+
+    def scenarios(self):
+        return {"owned_toggle": self.owned_toggle, "config_save": self.config_save,
+                "timer_edit": self.timer_edit}
+
+    # --- Verification ---
+
+    def verify(self, data_dir: Path) -> List[str]:
+        """Compare the files on disk with the expected end state; returns report lines."""
+        lines: List[str] = []
+        try:
+            calendar = CalendarLogModel.model_validate_json((data_dir / CALENDAR_FILE).read_text(encoding="utf-8"))
+            config = AppConfig.model_validate_json((data_dir / CONFIG_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            return [f"Final files unreadable: {e}"]
+
+        marked = set(calendar.marked_dates)
+        lost_marks = [day for day, on in self.expected_dates.items()
+                      if on and day not in marked and day not in self.uncertain_dates]
+        stale_marks = [day for day, on in self.expected_dates.items()
+                       if not on and day in marked and day not in self.uncertain_dates]
+        lines.append(f"calendar: {len(self.expected_dates)} tracked dates, {len(lost_marks)} lost marks, "
+                     f"{len(stale_marks)} resurrected marks, {len(self.uncertain_dates)} unknown (failed requests)")
+
+        on_disk = {timer.id: timer.label for timer in config.timers.custom_timers}
+        lost_timers, wrong_labels, resurrected = 0, 0, 0
+        for timer_id, label in self.expected_timers.items():
+            if timer_id in self.uncertain_timers:
+                continue
+            if label is None:
+                resurrected += timer_id in on_disk
+            elif timer_id not in on_disk:
+                lost_timers += 1
+            elif on_disk[timer_id] != label:
+                wrong_labels += 1
+        lines.append(f"timers: {len(self.expected_timers)} tracked, {lost_timers} lost, "
+                     f"{wrong_labels} stale labels, {resurrected} resurrected, "
+                     f"{len(self.uncertain_timers)} unknown (failed requests)")
+        return lines
+
+
+# --- Report ---
+
+def format_writes(meter: WriteMeter, ops: Dict[str, int], elapsed_s: float) -> List[str]:
+    """Write-amplification table: saves and bytes per logical operation."""
+    logical = {
+        CONFIG_FILE: ops["config_save"] + ops["timer"],
+        CALENDAR_FILE: ops["toggle"],
+    }
+    lines = [f"{'file':<20}{'ops':>8}{'saves':>8}{'MB':>10}{'MB/s':>8}{'saves/op':>10}{'KB/op':>10}"]
+    for name, op_count in logical.items():
+        saves = meter.saves.get(name, 0)
+        written = meter.bytes.get(name, 0)
+        per_op = written / op_count / 1024 if op_count else 0.0
+        saves_per_op = saves / op_count if op_count else 0.0
+        lines.append(f"{name:<20}{op_count:>8}{saves:>8}{written / 1e6:>10.2f}"
+                     f"{written / 1e6 / elapsed_s if elapsed_s else 0:>8.2f}{saves_per_op:>10.2f}{per_op:>10.1f}")
+    return lines
+
+
+# --- Runner ---
+
+def claim_data_dir(data_dir: Path):
+    """Create `data_dir` for a test run, or reuse one from a previous run.
+
+    The test writes fake sounds and random calendar marks, so a non-empty
+    directory not created by this tool (e.g. a real data directory) is refused.
+
+    Raises:
+        ValueError: If data_dir is a file or holds someone else's data.
+    """
+    if data_dir.exists():
+        if not data_dir.is_dir():
+            raise ValueError(f"{data_dir} is not a directory.")
+        if any(data_dir.iterdir()) and not (data_dir / DATA_DIR_MARKER).exists():
+            raise ValueError(f"{data_dir} is not empty and was not created by tools.loadtest; "
+                             f"refusing to write test data into it.")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / DATA_DIR_MARKER).touch()
+
+
+def prepare_data_dir(data_dir: Path):
+    """Put a few dummy .mp3 files in every sound folder so audio requests serve real bytes."""
+    rng = random.Random(0)
+    for folder in SOUND_FOLDERS:
+        folder_path = data_dir / "sounds" / folder
+        folder_path.mkdir(parents=True, exist_ok=True)
+        for index in range(AUDIO_FILES_PER_CATEGORY):
+            (folder_path / f"load_{index}.mp3").write_bytes(rng.randbytes(AUDIO_FILE_BYTES))
+
+
+def run(data_dir: Path, clients: int, duration_s: float, mix: Dict[str, int],
+        threads: int, seed: Optional[int]) -> str:
+    """Run one load test against a fresh app in data_dir and return the report."""
+    os.environ.setdefault(LOG_LEVELS_ENV, "WARNING")
+    prepare_data_dir(data_dir)
+    app = create_app(str(data_dir))
+
+    meter = WriteMeter()
+    meter.install()
+    server = PooledWSGIServer("127.0.0.1", 0, app, threads=threads)
+    server_thread = threading.Thread(target=server.serve_forever, name="loadtest-server", daemon=True)
+    server_thread.start()
+    checker = FileChecker(data_dir)
+    tracker = ConsistencyTracker(clients)
+
+    try:
+        meter.reset()  # Only count writes caused by the traffic
+        checker.start()
+        stats, elapsed = run_load(f"http://127.0.0.1:{server.server_port}", clients, duration_s,
+                                  mix, seed, stats=Stats(), extra_scenarios=tracker.scenarios())
+        checker.stop()
+        default_config_manager.flush()
+        default_calendar_log.flush()
+    finally:
+        server.shutdown()
+        server.server_close()
+        meter.uninstall()
+
+    for name in FileChecker.VALIDATORS:
+        checker.check(name)
+
+    lines = [stats.format_report(elapsed), "", "--- Writes ---"]
+    lines += format_writes(meter, tracker.ops, elapsed)
+    lines += ["", "--- Files ---"]
+    for name in FileChecker.VALIDATORS:
+        line = f"{name:<20}{checker.reads[name]:>8} reads, {checker.corrupt[name]} corrupted"
+        if name in checker.samples:
+            line += f" (first: {checker.samples[name]})"
+        lines.append(line)
+    lines += ["", "--- Lost updates ---"]
+    lines += tracker.verify(data_dir)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process LoveTimer load test with write and consistency checks.")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test length in seconds.")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="Server worker threads.")
+    parser.add_argument("--mix", default="",
+                        help=f"Scenario weights (default: {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())}).")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible traffic.")
+    parser.add_argument("--data-dir", default=None,
+                        help="Use (and keep) this directory instead of a temporary one. "
+                             "Must be new, empty or from an earlier loadtest run.")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix, known=[*LOADGEN_MIX, *DEFAULT_MIX]) if args.mix else DEFAULT_MIX
+    print(f"Driving an in-process server ({args.threads} threads) with {args.clients} clients "
+          f"for {args.duration:.0f}s, mix: {mix}")
+
+    if args.data_dir:
+        data_dir = Path(args.data_dir)
+        try:
+            claim_data_dir(data_dir)
+        except ValueError as e:
+            parser.error(str(e))
+        print(run(data_dir, args.clients, args.duration, mix, args.threads, args.seed))
+    else:
+        with tempfile.TemporaryDirectory(prefix="lovetimer-load-") as temp_dir:
+            report = run(Path(temp_dir), args.clients, args.duration, mix, args.threads, args.seed)
+            shutdown_logging()  # Releases logs/lovetimer.log so the directory can be removed
+        print(report)
+
+
+if __name__ == "__main__":
+    main()